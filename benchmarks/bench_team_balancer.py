@@ -0,0 +1,299 @@
+"""
+TeamBalancer 성능/품질 벤치마크
+
+밸런싱 엔진별로 로스터 크기(2~40명)에 따른 실행 시간, 메모리 할당량,
+최적해 대비 점수 차이를 측정하여 JSON 파일로 저장합니다.
+릴리스 간 결과 파일을 비교하여 성능 또는 품질 저하를 확인할 수 있습니다.
+
+사용법:
+    python -m benchmarks.bench_team_balancer
+    python -m benchmarks.bench_team_balancer --output benchmarks/results/v1.2.json
+    python -m benchmarks.bench_team_balancer --compare benchmarks/results/v1.1.json
+    python -m benchmarks.bench_team_balancer --record <길드 ID>   # 실제 길드 로스터 저장
+
+로스터 종류:
+    random  - 무작위 점수. 최적해는 전수 탐색이 가능한 크기까지만 계산합니다.
+    planted - 같은 점수 쌍으로 구성되어 최적 점수 차이가 0 임이 알려진 로스터
+    <파일명> - benchmarks/rosters/*.json 에 저장된 실제 길드 로스터
+"""
+import argparse
+import asyncio
+import glob
+import itertools
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from services.team_balancer import TeamBalancer, BALANCE_SCORE_VERSION
+from services.win_probability import WinProbabilityEstimator
+
+ROSTER_DIR = os.path.join(os.path.dirname(__file__), 'rosters')
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(__file__), 'results', 'latest.json')
+
+# 합성 로스터 크기
+SIZES = list(range(2, 41))
+
+# 실제 길드 로스터에서 추출할 크기
+RECORDED_SIZES = [10, 20, 40]
+
+# 전수 탐색으로 최적해를 계산할 최대 인원
+EXHAUSTIVE_LIMIT = 16
+
+# 승률 기준 엔진을 실행할 최대 인원 (후보 구성 수 상한으로 그 이상은 의미가 적음)
+WIN_PROBABILITY_LIMIT = 20
+
+# 비교 시 회귀로 판단하는 실행 시간 배율
+TIME_REGRESSION_RATIO = 1.5
+
+# 플레이어별 합성 게임 기록 수와 표준편차
+SYNTHETIC_GAMES = 20
+SYNTHETIC_GAME_STD = 10.0
+
+
+def make_player(player_id: str, score: float) -> Dict:
+    """밸런스 점수만 가진 플레이어 딕셔너리 생성"""
+    return {
+        'discord_id': player_id,
+        'games_played': 0,
+        'balance_score': score,
+        'balance_score_version': BALANCE_SCORE_VERSION
+    }
+
+
+def random_roster(size: int, rng: random.Random) -> List[Dict]:
+    return [make_player(f"p{i}", round(rng.uniform(20, 70), 2)) for i in range(size)]
+
+
+def planted_roster(size: int, rng: random.Random) -> List[Dict]:
+    """최적 점수 차이가 0 인 로스터 (같은 점수 쌍, 홀수면 0점 플레이어 추가)"""
+    players = []
+    for i in range(size // 2):
+        score = round(rng.uniform(20, 70), 2)
+        players.append(make_player(f"p{2 * i}", score))
+        players.append(make_player(f"p{2 * i + 1}", score))
+    if size % 2:
+        players.append(make_player(f"p{size - 1}", 0.0))
+    rng.shuffle(players)
+    return players
+
+
+def load_recorded_rosters() -> Dict[str, List[Dict]]:
+    """benchmarks/rosters/*.json 로드"""
+    rosters = {}
+    for path in sorted(glob.glob(os.path.join(ROSTER_DIR, '*.json'))):
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        rosters[os.path.splitext(os.path.basename(path))[0]] = [
+            make_player(player['id'], float(player['balance_score']))
+            for player in data['players']
+        ]
+    return rosters
+
+
+def split_diff(team1: List[Dict], team2: List[Dict]) -> float:
+    return abs(
+        sum(TeamBalancer.get_player_score(p) for p in team1)
+        - sum(TeamBalancer.get_player_score(p) for p in team2)
+    )
+
+
+def exhaustive_optimum(players: List[Dict]) -> float:
+    """전수 탐색으로 최소 점수 차이 계산 (기존 itertools 구현과 동일한 방식)"""
+    scores = [TeamBalancer.get_player_score(p) for p in players]
+    total = sum(scores)
+    return min(
+        abs(2 * sum(scores[i] for i in team1) - total)
+        for team1 in itertools.combinations(range(len(players)), len(players) // 2)
+    )
+
+
+def synthetic_performances(players: List[Dict], rng: random.Random) -> Dict[str, List[float]]:
+    return {
+        p['discord_id']: [rng.gauss(p['balance_score'], SYNTHETIC_GAME_STD) for _ in range(SYNTHETIC_GAMES)]
+        for p in players
+    }
+
+
+def run_exhaustive(players: List[Dict], performances) -> Tuple[List[Dict], List[Dict]]:
+    scores = [TeamBalancer.get_player_score(p) for p in players]
+    total = sum(scores)
+    best = min(
+        itertools.combinations(range(len(players)), len(players) // 2),
+        key=lambda team1: abs(2 * sum(scores[i] for i in team1) - total)
+    )
+    team1 = [players[i] for i in best]
+    return team1, [p for i, p in enumerate(players) if i not in best]
+
+
+def run_branch_and_bound(players: List[Dict], performances) -> Tuple[List[Dict], List[Dict]]:
+    return TeamBalancer.balance_teams(players)
+
+
+def run_win_probability(players: List[Dict], performances) -> Tuple[List[Dict], List[Dict]]:
+    estimator = WinProbabilityEstimator(performances, seed=0)
+    return TeamBalancer.balance_teams(players, estimator=estimator)
+
+
+# 엔진 이름, 실행 함수, 실행할 최대 인원
+ENGINES: List[Tuple[str, Callable, int]] = [
+    ('exhaustive', run_exhaustive, EXHAUSTIVE_LIMIT),
+    ('branch_and_bound', run_branch_and_bound, max(SIZES)),
+    ('win_probability', run_win_probability, WIN_PROBABILITY_LIMIT),
+]
+
+
+def measure(engine: Callable, players: List[Dict], performances, repeat: int) -> Dict:
+    """실행 시간(반복 측정)과 최대 메모리 할당량 측정"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        team1, team2 = engine([dict(p) for p in players], performances)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    # 메모리 측정은 추적 오버헤드가 시간 측정에 섞이지 않도록 별도로 실행
+    tracemalloc.start()
+    engine([dict(p) for p in players], performances)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'wall_ms_median': round(statistics.median(timings), 3),
+        'wall_ms_min': round(min(timings), 3),
+        'peak_alloc_kib': round(peak / 1024, 1),
+        'score_diff': round(split_diff(team1, team2), 4),
+    }
+
+
+def run_benchmarks(repeat: int, seed: int, engines: Optional[List[str]] = None) -> List[Dict]:
+    rng = random.Random(seed)
+    cases: List[Tuple[str, List[Dict]]] = []
+    for size in SIZES:
+        cases.append(('random', random_roster(size, rng)))
+        cases.append(('planted', planted_roster(size, rng)))
+    for name, roster in load_recorded_rosters().items():
+        for size in RECORDED_SIZES:
+            if size <= len(roster):
+                cases.append((name, random.Random(seed + size).sample(roster, size)))
+
+    results = []
+    for roster_name, players in cases:
+        size = len(players)
+        if roster_name == 'planted':
+            optimum = 0.0
+        elif size <= EXHAUSTIVE_LIMIT:
+            optimum = exhaustive_optimum(players)
+        else:
+            optimum = None
+        performances = synthetic_performances(players, random.Random(seed + size))
+
+        for engine_name, engine, limit in ENGINES:
+            if size > limit or (engines and engine_name not in engines):
+                continue
+            result = measure(engine, players, performances, repeat)
+            result.update({
+                'roster': roster_name,
+                'size': size,
+                'engine': engine_name,
+                'optimum': None if optimum is None else round(optimum, 4),
+                'gap': None if optimum is None else round(result['score_diff'] - optimum, 4),
+            })
+            results.append(result)
+            print(
+                f"{roster_name:>10} n={size:<3} {engine_name:<17} "
+                f"{result['wall_ms_median']:>10.3f}ms {result['peak_alloc_kib']:>9.1f}KiB "
+                f"diff={result['score_diff']:.4f} gap={result['gap']}"
+            )
+    return results
+
+
+def compare(previous_path: str, results: List[Dict]) -> List[str]:
+    """이전 결과 파일과 비교하여 회귀 목록 반환"""
+    with open(previous_path, encoding='utf-8') as f:
+        previous = {
+            (r['roster'], r['size'], r['engine']): r
+            for r in json.load(f)['results']
+        }
+
+    regressions = []
+    for result in results:
+        old = previous.get((result['roster'], result['size'], result['engine']))
+        if not old:
+            continue
+        name = f"{result['roster']} n={result['size']} {result['engine']}"
+        if result['wall_ms_median'] > old['wall_ms_median'] * TIME_REGRESSION_RATIO and result['wall_ms_median'] > 1:
+            regressions.append(
+                f"{name}: 실행 시간 {old['wall_ms_median']:.3f}ms → {result['wall_ms_median']:.3f}ms"
+            )
+        if result['gap'] is not None and old['gap'] is not None and result['gap'] > old['gap'] + 1e-6:
+            regressions.append(f"{name}: 최적해 대비 차이 {old['gap']:.4f} → {result['gap']:.4f}")
+    return regressions
+
+
+async def record_roster(guild_id: int, name: str) -> str:
+    """실제 길드의 밸런스 점수를 익명화하여 로스터 파일로 저장"""
+    from services.database_service import DatabaseService
+
+    users, error = await DatabaseService().get_all_users(guild_id)
+    if error:
+        raise RuntimeError(error)
+
+    # Riot ID 는 공개 정보라 해시해도 역추적할 수 있으므로 점수 순서의 일련번호만 남김
+    scores = sorted((round(TeamBalancer.get_player_score(user), 2) for user in users), reverse=True)
+    players = [{'id': f"p{i}", 'balance_score': score} for i, score in enumerate(scores)]
+    os.makedirs(ROSTER_DIR, exist_ok=True)
+    path = os.path.join(ROSTER_DIR, f"{name}.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'recorded_at': datetime.now().isoformat(), 'players': players}, f, indent=2)
+    return path
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="TeamBalancer 벤치마크")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help="결과 JSON 파일 경로")
+    parser.add_argument('--compare', help="비교할 이전 결과 JSON 파일")
+    parser.add_argument('--repeat', type=int, default=3, help="시간 측정 반복 횟수")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--engine', action='append', help="실행할 엔진 (여러 번 지정 가능)")
+    parser.add_argument('--record', type=int, metavar='GUILD_ID', help="길드 로스터를 저장하고 종료")
+    parser.add_argument('--name', help="--record 로 저장할 로스터 이름 (기본: guild_<ID>)")
+    args = parser.parse_args()
+
+    if args.record:
+        path = asyncio.run(record_roster(args.record, args.name or f"guild_{args.record}"))
+        print(f"로스터 저장 완료: {path}")
+        return 0
+
+    results = run_benchmarks(args.repeat, args.seed, args.engine)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump({
+            'meta': {
+                'created_at': datetime.now().isoformat(),
+                'python': sys.version.split()[0],
+                'platform': platform.platform(),
+                'balance_score_version': BALANCE_SCORE_VERSION,
+                'repeat': args.repeat,
+                'seed': args.seed,
+            },
+            'results': results,
+        }, f, indent=2, ensure_ascii=False)
+    print(f"결과 저장 완료: {args.output}")
+
+    if args.compare:
+        regressions = compare(args.compare, results)
+        for regression in regressions:
+            print(f"[회귀] {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
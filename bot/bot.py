@@ -1,28 +1,59 @@
 from discord.ext import commands
 import discord
-from utils.constants import DISCORD_TOKEN, COMMAND_PREFIX, MESSAGES, COLORS
+from utils.constants import (
+    DISCORD_TOKEN, COMMAND_PREFIX, PREFIX_COMMANDS_ENABLED, SYNC_COMMANDS_ON_STARTUP,
+    SHARD_COUNT, SHARD_IDS, MESSAGES, COLORS
+)
+from utils.admission import AdmissionDenied
 from utils.embed_builder import EmbedBuilder
+from services.compute_service import ComputeService
+from services.user_service import UserService
 import asyncio
+import logging
 
-class MyBot(commands.Bot):
+class MyBot(commands.AutoShardedBot):
     def __init__(self):
-        # 인텐트 설정
+        # 인텐트 설정 (접두어 명령어를 쓰지 않으면 특권 인텐트인 message_content 불필요)
         intents = discord.Intents.default()
-        intents.message_content = True
+        intents.message_content = PREFIX_COMMANDS_ENABLED
+
+        # 샤드 범위를 나누어 여러 프로세스로 실행할 때는 전체 샤드 수를 모든 프로세스가 같게 지정해야 함
+        if SHARD_IDS is not None and SHARD_COUNT is None:
+            raise ValueError("SHARD_IDS 를 지정하려면 SHARD_COUNT 도 설정해야 합니다.")
         
         super().__init__(
-            command_prefix=COMMAND_PREFIX,
+            command_prefix=COMMAND_PREFIX if PREFIX_COMMANDS_ENABLED else commands.when_mentioned,
             intents=intents,
-            help_command=None  # 기본 도움말 명령어 비활성화
+            help_command=None,  # 기본 도움말 명령어 비활성화
+            shard_count=SHARD_COUNT,
+            shard_ids=SHARD_IDS
         )
+
+        # 팀 밸런싱 등 CPU 작업용 프로세스 풀 (이벤트 루프 블로킹 방지)
+        self.compute_service = ComputeService()
+
+        self.logger = logging.getLogger(__name__)
         
     async def setup_hook(self):
         """봇 시작 시 실행되는 설정"""
+        # 연산 워커 예열
+        await self.compute_service.start()
+
         # 코그 로드
         await self.load_extension("bot.cogs.user_commands")
         await self.load_extension("bot.cogs.game_commands")
         await self.load_extension("bot.cogs.stats_updater")  # 추가된 부분
         await self.add_base_commands()
+
+        # 슬래시 명령어 등록 (샤드 프로세스마다 재시작할 때 등록하지 않도록 설정으로만 실행)
+        if SYNC_COMMANDS_ON_STARTUP:
+            await self.sync_commands()
+
+    async def sync_commands(self) -> int:
+        """슬래시 명령어를 Discord 에 전역 등록하고 등록된 명령어 수 반환"""
+        synced = await self.tree.sync()
+        self.logger.info(f"슬래시 명령어 {len(synced)}개 등록")
+        return len(synced)
         
     async def add_base_commands(self):
         """기본 명령어 추가"""
@@ -66,6 +97,21 @@ class MyBot(commands.Bot):
             
             await ctx.reply(embed=embed)
 
+        @self.command(
+            name="명령어동기화",
+            help="슬래시 명령어를 Discord 에 다시 등록합니다. (봇 소유자 전용)",
+            usage=f"{COMMAND_PREFIX}명령어동기화",
+            hidden=True
+        )
+        @commands.is_owner()
+        async def sync(ctx):
+            count = await self.sync_commands()
+            await ctx.reply(embed=EmbedBuilder.success(
+                "명령어 동기화 완료",
+                f"슬래시 명령어 {count}개를 등록했습니다.",
+                footer="전역 명령어는 Discord 에 반영되기까지 시간이 걸릴 수 있습니다."
+            ))
+
         @self.command(
             name="소개",
             help="봇에 대한 설명을 보여줍니다.",
@@ -100,13 +146,22 @@ class MyBot(commands.Bot):
                 )
                 await ctx.reply(embed=embed)
                 
-            elif isinstance(error, commands.MissingPermissions):
+            elif isinstance(error, (commands.MissingPermissions, commands.NotOwner)):
                 embed = EmbedBuilder.error(
                     "권한 오류",
                     "이 명령어를 실행할 권한이 없습니다."
                 )
                 await ctx.reply(embed=embed)
                 
+            elif isinstance(error, AdmissionDenied):
+                scope = "이 서버의" if error.scope == 'guild' else "회원님의"
+                embed = EmbedBuilder.warning(
+                    "사용 한도 초과",
+                    f"{scope} '{ctx.command.name}' 명령어 사용 한도를 초과했습니다.",
+                    footer=f"{error.retry_after:.0f}초 후에 다시 시도해주세요."
+                )
+                await ctx.reply(embed=embed)
+
             elif isinstance(error, commands.CommandNotFound):
                 pass  # 존재하지 않는 명령어는 무시
                 
@@ -117,10 +172,24 @@ class MyBot(commands.Bot):
                 )
                 await ctx.reply(embed=embed)
 
+    async def close(self):
+        """봇 종료 시 연산 워커 정리"""
+        self.compute_service.shutdown()
+        await super().close()
+
+    async def on_shard_ready(self, shard_id: int):
+        """샤드 하나가 준비되었을 때 실행"""
+        guild_count = sum(1 for guild in self.guilds if guild.shard_id == shard_id)
+        print(f"Shard {shard_id} is ready ({guild_count} guilds)")
+
+    async def on_guild_remove(self, guild: discord.Guild):
+        """서버에서 추방되면 해당 서버의 캐시 정리"""
+        UserService.invalidate_roster(guild.id)
+
     async def on_ready(self):
         """봇이 준비되었을 때 실행"""
         print(f"Logged in as: {self.user}")
-        print(f"Bot is ready to serve {len(self.guilds)} guilds!")
+        print(f"Bot is ready to serve {len(self.guilds)} guilds on shards {sorted(self.shards)} (of {self.shard_count})!")
         
         # 상태 메시지 설정
         activity = discord.Activity(
@@ -138,6 +207,7 @@ def run_bot():
         print(f"Connected to Discord!")
         
     try:
-        bot.run(DISCORD_TOKEN)
+        # discord.py 기본 로그 핸들러 대신 utils.logging_config 의 큐 기반 로깅 사용
+        bot.run(DISCORD_TOKEN, log_handler=None)
     except Exception as e:
         print(f"Error running bot: {e}")
\ No newline at end of file
@@ -1,13 +1,32 @@
 import discord
+from discord import app_commands, ui
 from discord.ext import commands
-from discord import ui
-from typing import List, Dict
+from typing import Awaitable, Callable, List, Dict, Set, Tuple, Optional
 import random
+import asyncio
+import shlex
 from services.user_service import UserService
+from services.roster_index import RosterIndex
+from services.refresh_service import REFRESH_ENDPOINTS
+from services.win_probability import WinProbabilityEstimator, MAX_SAMPLES_PER_PLAYER
+from utils.constants import GAME_REFRESH_DEADLINE, PREWARM_PLAYER_LIMIT
+from utils.admission import admission_control
 from utils.embed_builder import EmbedBuilder
+from utils.progress_reporter import ProgressReporter
+
+# 선택 메뉴 한 페이지에 표시할 플레이어 수 (Discord 선택 메뉴 최대 옵션 수)
+PICKER_PAGE_SIZE = 25
 
 class PlayerSelect(ui.Select):
-    def __init__(self, players: List[dict]):
+    def __init__(self):
+        super().__init__(
+            placeholder="참가할 플레이어를 선택하세요",
+            min_values=0,
+            options=[discord.SelectOption(label="-")]
+        )
+
+    def set_players(self, players: List[dict], selected_ids: Set[str]) -> None:
+        """현재 페이지의 플레이어로 옵션 교체 (이미 선택한 플레이어는 선택된 상태로 표시)"""
         options = []
         for player in players:
             winrate = (player['wins'] / player['games_played'] * 100) if player['games_played'] > 0 else 0
@@ -15,102 +34,337 @@ class PlayerSelect(ui.Select):
                 discord.SelectOption(
                     label=player['nickname'],
                     value=str(player['discord_id']),
-                    description=f"승률: {winrate:.1f}% ({player['games_played']}게임)"
+                    description=f"승률: {winrate:.1f}% ({player['games_played']}게임)",
+                    default=player['discord_id'] in selected_ids
                 )
             )
-        super().__init__(
-            placeholder="참가할 플레이어를 선택하세요",
-            min_values=1,
-            max_values=len(players),
-            options=options
+
+        # 검색 결과가 없으면 빈 메뉴를 만들 수 없으므로 비활성화된 안내 옵션 표시
+        self.disabled = not options
+        self.options = options or [discord.SelectOption(label="검색 결과가 없습니다", value="-")]
+        self.max_values = len(self.options)
+
+    async def callback(self, interaction: discord.Interaction):
+        await self.view.update_page_selection(interaction, self.values)
+
+class PlayerSearchModal(ui.Modal, title="플레이어 검색"):
+    query = ui.TextInput(
+        label="닉네임#태그 (앞부분만 입력해도 됩니다, 비우면 전체)",
+        required=False,
+        max_length=40
+    )
+
+    def __init__(self, picker: 'PlayerPickerView'):
+        super().__init__()
+        self.picker = picker
+
+    async def on_submit(self, interaction: discord.Interaction):
+        self.picker.set_query(str(self.query.value))
+        await self.picker.refresh(interaction)
+
+class PlayerPickerView(ui.View):
+    def __init__(
+        self,
+        roster: RosterIndex,
+        player_count: int,
+        on_complete: Callable[[discord.Interaction, List[dict]], Awaitable[None]],
+        preselected: Optional[List[str]] = None
+    ):
+        """페이지 이동과 닉네임 검색으로 명단에서 플레이어를 고르는 메뉴
+
+        선택은 페이지와 검색어가 바뀌어도 유지되며, 완료 버튼을 누르면
+        선택한 플레이어 목록으로 on_complete 를 호출합니다.
+
+        Parameters:
+            roster: 길드 명단 검색 인덱스 (활동 순 정렬)
+            player_count: 선택해야 하는 인원 수
+            on_complete: 완료 버튼을 눌렀을 때 호출할 함수
+            preselected: 미리 선택해 둘 플레이어 (팀 조건에 포함된 플레이어)
+        """
+        super().__init__(timeout=180)
+        self.roster = roster
+        self.player_count = player_count
+        self.on_complete = on_complete
+
+        self.selected: Dict[str, dict] = {
+            discord_id: roster.by_id[discord_id]
+            for discord_id in preselected or []
+            if discord_id in roster.by_id
+        }
+        self.query = ""
+        self.matches = roster.players
+        self.page = 0
+        # 팀 구성이 진행 중이면 메뉴 조작을 무시
+        self.running = False
+
+        self.select = PlayerSelect()
+        self.add_item(self.select)
+        self._update_components()
+
+    @property
+    def page_count(self) -> int:
+        return max(1, -(-len(self.matches) // PICKER_PAGE_SIZE))
+
+    def page_players(self) -> List[dict]:
+        start = self.page * PICKER_PAGE_SIZE
+        return self.matches[start:start + PICKER_PAGE_SIZE]
+
+    def set_query(self, query: str) -> None:
+        self.query = query.strip()
+        self.matches = self.roster.search(self.query)
+        self.page = 0
+
+    def build_embed(self) -> discord.Embed:
+        embed = discord.Embed(
+            title="게임 생성",
+            description=f"참가할 {self.player_count}명의 플레이어를 선택해주세요.",
+            color=discord.Color.blue()
+        )
+        selected = ", ".join(player['nickname'] for player in self.selected.values()) or "없음"
+        embed.add_field(
+            name=f"선택한 플레이어 ({len(self.selected)}/{self.player_count})",
+            value=selected[:1024],
+            inline=False
+        )
+        if self.query:
+            embed.add_field(name="검색어", value=self.query, inline=True)
+        embed.set_footer(
+            text=f"페이지 {self.page + 1}/{self.page_count} · {len(self.matches)}명 · 최근 활동 순 정렬"
         )
+        return embed
 
-class TeamBalancer:
-    @staticmethod
-    def calculate_player_score(player: dict) -> float:
-        """플레이어의 종합 점수 계산"""
-        if player['games_played'] == 0:
-            return 50.0  # 기본 점수
-
-        # 모든 값을 float로 변환
-        winrate = float(player['wins']) / float(player['games_played']) * 100
-        kda_score = float(player['avg_kda']) * 10
-        damage_score = float(player['avg_damage_dealt']) / 1000
-        tankiness_score = float(player['avg_damage_taken']) / 1000
-        healing = float(player['avg_healing']) / 1000
-        cc_score = float(player.get('avg_cc_score', 0)) * 2
-        
-        # 전투력 점수 (30%)
-        combat_score = (kda_score + damage_score) / 2 * 0.3
-        
-        # 생존력 점수 (25%)
-        survival_score = tankiness_score * 0.25
-        
-        # 유틸성 점수 (25%)
-        utility_score = (healing + cc_score) / 2 * 0.25
-        
-        # 승률 점수 (20%)
-        winrate_score = winrate * 0.2
-        
-        # 종합 점수 계산
-        total_score = combat_score + survival_score + utility_score + winrate_score
-        
-        return float(total_score)
+    def _update_components(self) -> None:
+        self.select.set_players(self.page_players(), set(self.selected))
+        self.previous_page.disabled = self.page == 0
+        self.next_page.disabled = self.page >= self.page_count - 1
+        self.complete.disabled = len(self.selected) != self.player_count
 
-    @staticmethod
-    def balance_teams(players: List[dict]) -> tuple[List[dict], List[dict]]:
-        """종합 점수를 기준으로 최적의 팀 밸런스를 찾습니다."""
-        import itertools
+    def lock(self) -> None:
+        """팀 구성을 시작하면 모든 버튼과 선택 메뉴를 비활성화"""
+        self.running = True
+        for item in self.children:
+            item.disabled = True
 
-        # 각 플레이어의 종합 점수 계산
-        for player in players:
-            player['total_score'] = TeamBalancer.calculate_player_score(player)
+    async def refresh(self, interaction: discord.Interaction) -> None:
+        if self.running:
+            await interaction.response.defer()
+            return
+        self._update_components()
+        await interaction.response.edit_message(embed=self.build_embed(), view=self)
 
-        n = len(players)
-        target_team_size = n // 2  # 목표 팀 크기
-        
-        min_diff = float('inf')
-        best_team1 = []
-        best_team2 = []
+    async def update_page_selection(self, interaction: discord.Interaction, values: List[str]) -> None:
+        """현재 페이지의 선택만 교체하고 다른 페이지의 선택은 유지"""
+        for player in self.page_players():
+            self.selected.pop(player['discord_id'], None)
+        for discord_id in values:
+            if discord_id in self.roster.by_id:
+                self.selected[discord_id] = self.roster.by_id[discord_id]
+        await self.refresh(interaction)
 
-        # 가능한 모든 팀 조합을 검사
-        for team1_players in itertools.combinations(players, target_team_size):
-            team1_set = set(player['discord_id'] for player in team1_players)
-            team2_players = [p for p in players if p['discord_id'] not in team1_set]
+    @ui.button(label="◀", style=discord.ButtonStyle.secondary, row=1)
+    async def previous_page(self, interaction: discord.Interaction, button: ui.Button):
+        self.page = max(0, self.page - 1)
+        await self.refresh(interaction)
 
-            team1_score = sum(float(p['total_score']) for p in team1_players)
-            team2_score = sum(float(p['total_score']) for p in team2_players)
-            
-            # 점수 차이 계산
-            score_diff = abs(team1_score - team2_score)
-            
-            # 더 좋은 밸런스를 찾은 경우 업데이트
-            if score_diff < min_diff:
-                min_diff = score_diff
-                best_team1 = list(team1_players)
-                best_team2 = team2_players
+    @ui.button(label="▶", style=discord.ButtonStyle.secondary, row=1)
+    async def next_page(self, interaction: discord.Interaction, button: ui.Button):
+        self.page = min(self.page_count - 1, self.page + 1)
+        await self.refresh(interaction)
+
+    @ui.button(label="검색", emoji="🔍", style=discord.ButtonStyle.primary, row=1)
+    async def search(self, interaction: discord.Interaction, button: ui.Button):
+        await interaction.response.send_modal(PlayerSearchModal(self))
+
+    @ui.button(label="팀 구성", emoji="✅", style=discord.ButtonStyle.success, row=1)
+    async def complete(self, interaction: discord.Interaction, button: ui.Button):
+        if self.running:
+            # 이미 진행 중인 팀 구성이 있으면 다시 갱신하지 않음
+            await interaction.response.defer()
+            return
+        await self.on_complete(interaction, list(self.selected.values()))
+
+class StatsPrewarmer:
+    # Rate Limiter 에 남아 있어야 다음 플레이어를 갱신하는 초당 요청 비율
+    HEADROOM_RATIO = 0.5
+
+    def __init__(
+        self,
+        user_service: UserService,
+        refresh: Callable[[dict], Awaitable[dict]],
+        roster: RosterIndex,
+        limit: int = PREWARM_PLAYER_LIMIT
+    ):
+        """선택 메뉴가 열려 있는 동안 참가 가능성이 높은 플레이어의 전적을 미리 갱신
+
+        최근 게임 수가 많은 플레이어부터 한 명씩, Rate Limiter 에 여유가 있을 때만
+        갱신하여 다른 명령어의 API 호출을 밀어내지 않습니다.
+
+        Parameters:
+            user_service: Rate Limiter 와 API 장애 여부 확인에 사용할 UserService
+            refresh: 플레이어 한 명을 갱신하고 갱신된 데이터를 반환하는 함수
+            roster: 메뉴에 표시된 길드 명단 (최근 활동 순 정렬)
+            limit: 미리 갱신할 최대 플레이어 수
+        """
+        self.user_service = user_service
+        self.refresh = refresh
+        self.players = [
+            player for player in roster.players
+            if roster.play_counts.get(player['user_id'])
+        ][:limit]
+
+        self.tasks: Dict[str, asyncio.Task] = {}
+        self._taken: Set[str] = set()
+        self._runner: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self._runner = asyncio.create_task(self._run())
+
+    def take(self, discord_id: str) -> Optional[asyncio.Task]:
+        """플레이어의 미리 갱신 작업을 넘겨받음 (stop 으로 취소되지 않음)"""
+        task = self.tasks.get(discord_id)
+        if task:
+            self._taken.add(discord_id)
+        return task
+
+    def stop(self) -> None:
+        """남은 미리 갱신을 모두 취소 (넘겨준 작업은 계속 진행)"""
+        if self._runner:
+            self._runner.cancel()
+        for discord_id, task in self.tasks.items():
+            if discord_id not in self._taken:
+                task.cancel()
+
+    async def _run(self) -> None:
+        riot_service = self.user_service.riot_service
+        rate_limiter = riot_service.rate_limiter
+        headroom = max(1, int(rate_limiter.requests_per_second * self.HEADROOM_RATIO))
+        for player in self.players:
+            while rate_limiter.available() < headroom:
+                await asyncio.sleep(1)
+            if riot_service.unavailable_for(REFRESH_ENDPOINTS) is not None:
+                return
+
+            task = asyncio.create_task(self.refresh(player))
+            self.tasks[player['discord_id']] = task
+            # 작업을 넘겨받은 뒤 이 루프가 취소되어도 작업은 취소되지 않도록 wait 로 대기
+            await asyncio.wait([task])
 
-        return best_team1, best_team2
 
 class GameCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.user_service = UserService()
 
-    def create_team_embed(self, team1: List[dict], team2: List[dict]) -> discord.Embed:
+        # 제한 시간 안에 끝나지 않아 백그라운드에서 계속 진행 중인 전적 갱신
+        self._late_refreshes: Set[asyncio.Task] = set()
+
+    async def refresh_player(self, guild_id: int, player: dict) -> dict:
+        """플레이어 한 명의 전적 갱신 (실패 시 기존 데이터 반환)"""
+        success, error_msg, updated_info = await self.user_service.update_user_stats(
+            guild_id=guild_id,
+            nickname_tag=player['discord_id']
+        )
+        if not success:
+            return player
+
+        return {
+            'discord_id': player['discord_id'],
+            'user_id': player['user_id'],
+            'nickname': player['nickname'],
+            'games_played': updated_info['games_played'],
+            'wins': updated_info['wins'],
+            'losses': updated_info['losses'],
+            'avg_kda': updated_info['avg_kda'],
+            'avg_damage_dealt': updated_info['avg_damage_dealt'],
+            'avg_damage_taken': updated_info['avg_damage_taken'],
+            'avg_healing': updated_info['avg_healing'],
+            'avg_cc_score': updated_info.get('avg_cc_score', 0),
+            'balance_score': updated_info.get('balance_score'),
+            'balance_score_version': updated_info.get('balance_score_version')
+        }
+
+    async def refresh_players(
+        self,
+        guild_id: int,
+        players: List[dict],
+        reporter: Optional[ProgressReporter] = None,
+        deadline: float = GAME_REFRESH_DEADLINE,
+        started: Optional[Dict[str, asyncio.Task]] = None
+    ) -> Tuple[List[dict], int]:
+        """플레이어들의 전적을 동시에 갱신하고 제한 시간까지 끝난 결과만 사용
+
+        제한 시간 안에 끝나지 않은 플레이어는 기존 데이터를 사용하며,
+        해당 갱신은 취소하지 않고 백그라운드에서 마저 저장합니다.
+        started(discord_id → 작업)에 이미 시작된 갱신이 있으면 새로 갱신하지 않고 그 결과를 사용합니다.
+
+        Returns:
+            (입력 순서대로의 플레이어 데이터, 기존 데이터를 사용한 지연 플레이어 수)
+        """
+        started = started or {}
+        tasks = [
+            started.get(player['discord_id']) or asyncio.create_task(self.refresh_player(guild_id, player))
+            for player in players
+        ]
+        if reporter:
+            for task in tasks:
+                task.add_done_callback(lambda _: reporter.advance())
+
+        done, pending = await asyncio.wait(tasks, timeout=deadline)
+
+        updated_players = []
+        for player, task in zip(players, tasks):
+            if task in pending:
+                self._late_refreshes.add(task)
+                task.add_done_callback(self._late_refreshes.discard)
+                updated_players.append(player)
+            elif task.cancelled() or task.exception():
+                updated_players.append(player)
+            else:
+                updated_players.append(task.result())
+        return updated_players, len(pending)
+
+    async def load_performances(self, players: List[dict]) -> Optional[Dict[str, List[float]]]:
+        """선택된 플레이어들의 게임별 성능 점수 조회 (실패 시 None)"""
+        performances, error = await self.user_service.get_recent_performances(
+            [player['user_id'] for player in players],
+            MAX_SAMPLES_PER_PLAYER
+        )
+        if error:
+            return None
+
+        return {
+            player['discord_id']: performances.get(player['user_id'], [])
+            for player in players
+        }
+
+    def create_team_embed(
+        self,
+        team1: List[dict],
+        team2: List[dict],
+        estimator: Optional[WinProbabilityEstimator] = None
+    ) -> discord.Embed:
         """팀 정보를 포함한 임베드 생성"""
-        # 팀별 평균 점수 계산
-        team1_avg = sum(p['total_score'] for p in team1) / len(team1)
-        team2_avg = sum(p['total_score'] for p in team2) / len(team2)
-        score_diff = abs(team1_avg - team2_avg)
+        if estimator is not None:
+            # 블루팀 예상 승률 기준 밸런스 상태 확인
+            win_rate, (low, high) = estimator.estimate(team1, team2)
+            gap = abs(win_rate - 0.5)
+            balance_state = "매우 균형" if gap < 0.03 else "균형" if gap < 0.07 else "적절" if gap < 0.12 else "불균형"
+            balance_emoji = "🎯" if gap < 0.03 else "⭐" if gap < 0.07 else "⚖️" if gap < 0.12 else "⚠️"
+            detail = f"블루팀 예상 승률: {win_rate * 100:.1f}% (95% 구간 {low * 100:.1f}~{high * 100:.1f}%)"
+        else:
+            # 팀별 평균 점수 계산
+            team1_avg = sum(p['total_score'] for p in team1) / len(team1)
+            team2_avg = sum(p['total_score'] for p in team2) / len(team2)
+            score_diff = abs(team1_avg - team2_avg)
 
-        # 밸런스 상태 확인
-        balance_state = "매우 균형" if score_diff < 5 else "균형" if score_diff < 10 else "적절" if score_diff < 15 else "불균형"
-        balance_emoji = "🎯" if score_diff < 5 else "⭐" if score_diff < 10 else "⚖️" if score_diff < 15 else "⚠️"
+            # 밸런스 상태 확인
+            balance_state = "매우 균형" if score_diff < 5 else "균형" if score_diff < 10 else "적절" if score_diff < 15 else "불균형"
+            balance_emoji = "🎯" if score_diff < 5 else "⭐" if score_diff < 10 else "⚖️" if score_diff < 15 else "⚠️"
+            detail = f"점수차: {score_diff:.1f}"
 
         embed = discord.Embed(
             title="팀 구성 결과",
-            description=f"{balance_emoji} 팀 밸런스: **{balance_state}** (점수차: {score_diff:.1f})",
+            description=f"{balance_emoji} 팀 밸런스: **{balance_state}** ({detail})",
             color=discord.Color.blue()
         )
 
@@ -144,12 +398,42 @@ class GameCommands(commands.Cog):
 
         return embed
 
-    @commands.command(
+    @staticmethod
+    def parse_constraints(args: Tuple[str, ...]) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+        """팀 조건 파싱 ('A#태그+B#태그' 같은 팀, 'A#태그/B#태그' 다른 팀)"""
+        together, apart = [], []
+        for arg in args:
+            if '+' in arg:
+                target, separator = together, '+'
+            elif '/' in arg:
+                target, separator = apart, '/'
+            else:
+                raise ValueError(f"'{arg}' 는 올바른 조건 형식이 아닙니다.")
+
+            pair = [part.strip() for part in arg.split(separator)]
+            if len(pair) != 2 or not all(pair):
+                raise ValueError(f"'{arg}' 는 올바른 조건 형식이 아닙니다.")
+            target.append((pair[0], pair[1]))
+
+        return together, apart
+
+    @commands.hybrid_command(
         name="게임생성", 
-        help="인원수를 입력하여 게임의 팀을 생성합니다.",
-        usage="%게임생성 [인원수]"
+        help=(
+            "인원수를 입력하여 게임의 팀을 생성합니다.\n"
+            "조건을 추가하면 같은 팀(A#태그+B#태그) 또는 다른 팀(A#태그/B#태그)으로 배치합니다."
+        ),
+        usage="%게임생성 [인원수] [조건...]"
     )
-    async def create_game(self, ctx, player_count: int):
+    @admission_control()
+    @app_commands.describe(
+        player_count="참가 인원 (2~10)",
+        constraints="팀 조건 (예: A#KR1+B#KR1 C#KR1/D#KR1)"
+    )
+    async def create_game(self, ctx, player_count: int, *, constraints: str = ""):
+        # 슬래시 명령어는 3초 안에 응답해야 하므로 먼저 응답을 미루고 결과는 후속 메시지로 전송
+        await ctx.defer()
+
         if not 2 <= player_count <= 10:
             embed = EmbedBuilder.error(
                 "인원 수 오류",
@@ -158,9 +442,21 @@ class GameCommands(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        # 등록된 모든 플레이어 데이터 가져오기
-        user_data, error = await self.user_service.get_all_users(ctx.guild.id)
-        if error:
+        # 팀 조건 파싱
+        try:
+            together, apart = self.parse_constraints(tuple(shlex.split(constraints)))
+        except ValueError as e:
+            embed = EmbedBuilder.error(
+                "조건 형식 오류",
+                str(e),
+                fields=[("올바른 형식", "같은 팀: `닉네임#태그+닉네임#태그`\n다른 팀: `닉네임#태그/닉네임#태그`", False)]
+            )
+            await ctx.send(embed=embed)
+            return
+
+        # 등록된 플레이어 명단 (최근 활동 순, 길드별로 캐시됨)
+        roster, error = await self.user_service.get_roster(ctx.guild.id)
+        if error or not roster:
             embed = EmbedBuilder.error(
                 "등록된 사용자 없음",
                 "게임 생성을 위해서는 먼저 사용자 등록이 필요합니다."
@@ -168,31 +464,13 @@ class GameCommands(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        # 플레이어 데이터 가공
-        players = []
-        for data in user_data:
-            players.append({
-                'discord_id': f"{data['nickname']}#{data['tag']}",
-                'nickname': data['nickname'],
-                'games_played': data['games_played'],
-                'wins': data['wins'],
-                'losses': data['losses'],
-                'avg_kda': data['avg_kda'],
-                'avg_damage_dealt': data['avg_damage_dealt'],
-                'avg_damage_taken': data['avg_damage_taken'],
-                'avg_healing': data['avg_healing'],
-                'avg_cc_score': data.get('avg_cc_score', 0)
-            })
-
-        view = discord.ui.View()
-        select = PlayerSelect(players)
+        prewarmer = StatsPrewarmer(
+            self.user_service,
+            lambda player: self.refresh_player(ctx.guild.id, player),
+            roster
+        )
         
-        async def select_callback(interaction: discord.Interaction):
-            selected_players = [
-                player for player in players
-                if player['discord_id'] in select.values
-            ]
-            
+        async def select_callback(interaction: discord.Interaction, selected_players: List[dict]):
             if len(selected_players) != player_count:
                 await interaction.response.send_message(
                     f"정확히 {player_count}명의 플레이어를 선택해야 합니다.",
@@ -200,6 +478,25 @@ class GameCommands(commands.Cog):
                 )
                 return
 
+            # 조건에 포함된 플레이어가 모두 선택되었는지 확인
+            selected_ids = {player['discord_id'] for player in selected_players}
+            missing = sorted({
+                player_id
+                for pair in together + apart
+                for player_id in pair
+                if player_id not in selected_ids
+            })
+            if missing:
+                await interaction.response.send_message(
+                    f"조건에 포함된 플레이어가 선택되지 않았습니다: {', '.join(missing)}",
+                    ephemeral=True
+                )
+                return
+
+            # 갱신과 팀 구성이 끝날 때까지 메뉴를 비활성화하여 중복 실행 방지
+            view.lock()
+            await interaction.message.edit(view=view)
+
             # 전적 갱신 진행 메시지
             progress_embed = EmbedBuilder.info(
                 "전적 갱신 중",
@@ -207,48 +504,72 @@ class GameCommands(commands.Cog):
                 footer="잠시만 기다려주세요..."
             )
             await interaction.response.send_message(embed=progress_embed)
+            reporter = ProgressReporter(
+                await interaction.original_response(),
+                "전적 갱신 중",
+                len(selected_players),
+                footer="잠시만 기다려주세요..."
+            )
 
-            # 선택된 플레이어들의 전적 갱신
-            updated_players = []
+            # 미리 갱신 중이거나 끝난 플레이어는 그 결과를 사용하고 나머지 미리 갱신은 취소
+            started = {}
             for player in selected_players:
-                success, error_msg, updated_info = await self.user_service.update_user_stats(
-                    guild_id=ctx.guild.id,
-                    nickname_tag=player['discord_id']
+                task = prewarmer.take(player['discord_id'])
+                if task:
+                    started[player['discord_id']] = task
+            prewarmer.stop()
+
+            # 선택된 플레이어들의 전적 갱신 (제한 시간이 지나면 저장된 전적 사용)
+            updated_players, late_count = await self.refresh_players(
+                ctx.guild.id, selected_players, reporter, started=started
+            )
+            await reporter.close()
+
+            # 게임 기록 기반 승률 분포 (조회 실패 시 점수 차이 기준으로 밸런싱)
+            performances = await self.load_performances(updated_players)
+
+            # 팀 밸런싱 (연산 워커에서 실행하여 이벤트 루프를 막지 않음)
+            try:
+                team1, team2 = await self.bot.compute_service.balance_teams(
+                    updated_players, together, apart, performances
                 )
-                if success:
-                    updated_players.append({
-                        'discord_id': player['discord_id'],
-                        'nickname': player['nickname'],
-                        'games_played': updated_info['games_played'],
-                        'wins': updated_info['wins'],
-                        'losses': updated_info['losses'],
-                        'avg_kda': updated_info['avg_kda'],
-                        'avg_damage_dealt': updated_info['avg_damage_dealt'],
-                        'avg_damage_taken': updated_info['avg_damage_taken'],
-                        'avg_healing': updated_info['avg_healing'],
-                        'avg_cc_score': updated_info.get('avg_cc_score', 0)
-                    })
-                else:
-                    # 갱신 실패 시 기존 데이터 사용
-                    updated_players.append(player)
-
-            # 팀 밸런싱
-            team1, team2 = TeamBalancer.balance_teams(updated_players)
+            except ValueError as e:
+                await interaction.followup.send(embed=EmbedBuilder.error("팀 구성 실패", str(e)))
+                view.stop()
+                return
+            except asyncio.TimeoutError:
+                await interaction.followup.send(embed=EmbedBuilder.error(
+                    "팀 구성 실패",
+                    "팀 구성 계산이 제한 시간을 초과했습니다. 조건을 줄여 다시 시도해주세요."
+                ))
+                view.stop()
+                return
+
+            estimator = WinProbabilityEstimator(performances) if performances is not None else None
             
             # 결과 임베드 생성 및 전송
-            embed = self.create_team_embed(team1, team2)
+            embed = self.create_team_embed(team1, team2, estimator)
+            if late_count:
+                embed.set_footer(text=f"{late_count}명은 갱신이 늦어져 저장된 전적으로 구성했습니다. (갱신은 계속 진행됩니다)")
             await interaction.followup.send(embed=embed)
             view.stop()
 
-        select.callback = select_callback
-        view.add_item(select)
-        
-        embed = discord.Embed(
-            title="게임 생성",
-            description=f"참가할 {player_count}명의 플레이어를 선택해주세요.",
-            color=discord.Color.blue()
+        async def on_timeout():
+            # 아무도 선택하지 않고 메뉴가 만료되면 미리 갱신 중단
+            prewarmer.stop()
+
+        # 팀 조건에 포함된 플레이어는 미리 선택
+        view = PlayerPickerView(
+            roster,
+            player_count,
+            select_callback,
+            preselected=[player_id for pair in together + apart for player_id in pair]
         )
-        await ctx.send(embed=embed, view=view)
+        view.on_timeout = on_timeout
+        await ctx.send(embed=view.build_embed(), view=view)
+
+        # 선택을 기다리는 동안 참가 가능성이 높은 플레이어의 전적을 미리 갱신
+        prewarmer.start()
 
 async def setup(bot):
     await bot.add_cog(GameCommands(bot))
\ No newline at end of file
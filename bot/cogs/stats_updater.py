@@ -1,4 +1,3 @@
-import asyncio
 import logging
 from discord.ext import commands, tasks
 from datetime import datetime, time, timedelta
@@ -6,59 +5,337 @@ from typing import Optional, List, Dict, Tuple
 import discord
 from services.user_service import UserService
 from services.database_service import DatabaseService
+from services.refresh_service import RefreshService
+from services.refresh_scheduler import RefreshScheduler
+from services.refresh_planner import SLOT_MINUTES, plan_refresh_windows, resolve_timezone
+from services.refresh_estimator import estimate_refresh_cost
+from utils.constants import (
+    REFRESH_SCHEDULER_INTERVAL_MINUTES,
+    REFRESH_SCHEDULER_BUDGET_RATIO,
+    REFRESH_QUEUE_ENABLED,
+    REFRESH_PRIORITY_SCHEDULED,
+    STATS_UPDATE_SKIP_RECENT_HOURS
+)
 from utils.embed_builder import EmbedBuilder
+from utils.progress_reporter import ProgressReporter, format_duration
 from utils.logging_config import setup_logger
 import pytz
 
+# 일일 갱신 중 이 수만큼 유저를 처리할 때마다 실행 기록의 처리 유저 수(done_users) 갱신
+RUN_PROGRESS_UPDATE_EVERY = 20
+
 class AutomaticStatsUpdater(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.user_service = UserService()
         self.db_service = DatabaseService()
-        self.logger = setup_logger('stats_updater', 'stats_updater.log')
+        self.refresh_service = RefreshService(self.user_service)
+        self.refresh_scheduler = RefreshScheduler(self.db_service, self.refresh_service)
+        self.logger = setup_logger(__name__, 'stats_updater.log')
         
-        # 한국 시간 기준 오전 6시 설정
-        self.kst = pytz.timezone('Asia/Seoul')
-        self.update_time = time(hour=6)
+        # 길드별 일일 갱신 시작 시각 (현지 시간, 마지막으로 계산한 배치)
+        self.refresh_windows: Dict[int, time] = {}
         
         # 자동 갱신 작업 시작
         self.stats_update_task.start()
+        self.adaptive_refresh_task.start()
+
+    async def cog_load(self):
+        """코그 로드 시 밸런스 점수 공식이 바뀐 유저들의 점수를 일괄 재계산"""
+        count, error = await self.db_service.recompute_balance_scores()
+        if error:
+            self.logger.error(f"밸런스 점수 재계산 실패: {error}")
+        elif count:
+            self.logger.info(f"밸런스 점수 재계산 완료: {count}명")
 
     def cog_unload(self):
         """코그가 언로드될 때 작업 중지"""
         self.stats_update_task.cancel()
+        self.adaptive_refresh_task.cancel()
 
-    @tasks.loop(hours=24)
+    @tasks.loop(minutes=SLOT_MINUTES)
     async def stats_update_task(self):
-        """전체 유저 전적 자동 갱신 작업"""
-        self.logger.info("일일 전적 갱신 작업 시작")
+        """갱신 시각이 된 길드의 일일 전적 갱신 작업"""
+        try:
+            retry_after = self.refresh_service.retry_after()
+            if retry_after is not None:
+                # 장애 중에는 시작하지 않고, 중단된 실행은 다음 주기에 이어서 진행
+                self.logger.warning(f"라이엇 API 장애로 일일 전적 갱신 일시 중지 ({retry_after:.0f}초 후 재시도)")
+                return
+
+            due = await self._due_guilds()
+            if due:
+                await self.run_daily_update(due)
+        except Exception as e:
+            self.logger.error(f"일일 전적 갱신 중 오류: {str(e)}")
+
+    async def _due_guilds(self) -> List[Tuple[discord.Guild, object]]:
+        """오늘(길드 현지 날짜) 갱신 구간이 시작되었지만 아직 끝나지 않은 길드 목록
+
+        중단된 실행은 다시 포함되므로 재시작 후 이어서 진행되고,
+        봇이 꺼져 있어 놓친 오늘 갱신도 바로 실행됩니다.
+
+        샤드를 나누어 실행하면 bot.guilds 에는 이 프로세스가 맡은 길드만 있으므로
+        각 프로세스는 자기 길드만 갱신합니다. 갱신 시각 배치는 모든 프로세스가 같은 결과를
+        얻도록 등록된 전체 길드를 기준으로 계산합니다.
+        """
+        guilds = {guild.id: guild for guild in self.bot.guilds}
+        all_settings, error = await self.db_service.get_guild_refresh_settings()
+        if error:
+            self.logger.error(f"길드 갱신 시간 설정 조회 실패: {error}")
+            return []
+        latest_runs, error = await self.db_service.get_latest_stats_runs(list(guilds))
+        if error:
+            self.logger.error(f"갱신 실행 기록 조회 실패: {error}")
+            return []
+
+        now = datetime.now(pytz.utc)
+        all_windows = plan_refresh_windows(all_settings, now)
+        settings = [setting for setting in all_settings if setting['guild_id'] in guilds]
+        windows = {setting['guild_id']: all_windows[setting['guild_id']] for setting in settings}
+        if windows != self.refresh_windows:
+            self.refresh_windows = windows
+            self.logger.info("일일 갱신 시각 배치: " + ", ".join(
+                f"{guilds[guild_id].name} {start:%H:%M}" for guild_id, start in windows.items()
+            ))
+
+        due = []
+        for setting in settings:
+            guild = guilds[setting['guild_id']]
+            local_now = now.astimezone(resolve_timezone(setting['refresh_timezone']))
+            run_date = local_now.date()
+
+            run = latest_runs.get(guild.id)
+            if run and run['run_date'] == run_date:
+                if run['status'] == 'running':
+                    due.append((guild, run_date))
+                continue
+            if local_now.time() >= windows[guild.id]:
+                due.append((guild, run_date))
+        return due
+
+    async def run_daily_update(self, due: List[Tuple[discord.Guild, object]]) -> None:
+        """길드별 일일 전적 갱신 실행 (같은 날짜의 중단된 실행이 있으면 이어서 진행)
+
+        같은 시각에 시작하는 길드들은 한 번에 갱신하여 공유 계정을 한 번만 조회합니다.
+        """
+        runs: Dict[int, int] = {}
+        for guild, run_date in due:
+            run, error = await self.db_service.start_stats_run(guild.id, run_date)
+            if error:
+                self.logger.error(f"길드 {guild.name} 갱신 실행 기록 생성 실패: {error}")
+                continue
+            if run['total_users']:
+                self.logger.info(
+                    f"길드 {guild.name} {run_date} 일일 전적 갱신 재개 "
+                    f"({run['done_users']}/{run['total_users']}명 완료)"
+                )
+            else:
+                self.logger.info(f"길드 {guild.name} {run_date} 일일 전적 갱신 시작")
+            runs[guild.id] = run['id']
+
+        if not runs:
+            return
+        guilds = [guild for guild, _ in due if guild.id in runs]
         start_time = datetime.now()
-        
-        for guild in self.bot.guilds:
-            try:
-                await self.update_guild_users(guild)
-            except Exception as e:
-                self.logger.error(f"길드 {guild.name} ({guild.id}) 처리 중 오류: {str(e)}")
+
+        results = await self.update_guilds(guilds, runs=runs)
+
+        # 장애로 보류된 유저가 있는 길드는 실행을 끝내지 않고 다음 주기에 이어서 진행
+        paused = {result['guild_id'] for result in results if result['deferred']}
+        for guild_id, run_id in runs.items():
+            if guild_id in paused:
+                await self.db_service.update_stats_run(run_id)
+            else:
+                await self.db_service.update_stats_run(run_id, status='completed')
         
         end_time = datetime.now()
         duration = (end_time - start_time).total_seconds()
-        self.logger.info(f"일일 전적 갱신 작업 완료 (소요 시간: {duration:.1f}초)")
+        if paused:
+            self.logger.warning(
+                f"라이엇 API 장애로 일일 전적 갱신 일시 중지 (길드 {len(paused)}개는 복구 후 재개, "
+                f"소요 시간: {duration:.1f}초)"
+            )
+        else:
+            self.logger.info(f"일일 전적 갱신 작업 완료 (길드 {len(runs)}개, 소요 시간: {duration:.1f}초)")
+
+    async def _prepare_run_targets(self, run_id: int, targets: List[Dict]) -> List[Dict]:
+        """체크포인트 기준으로 이미 처리된 유저와 최근에 갱신된 유저 제외"""
+        progress, error = await self.db_service.get_stats_run_progress(run_id)
+        if error:
+            self.logger.error(f"갱신 진행 상태 조회 실패: {error}")
+
+        recent_threshold = datetime.now() - timedelta(hours=STATS_UPDATE_SKIP_RECENT_HOURS)
+        remaining = []
+        skipped = []
+        for target in targets:
+            if progress.get(target['user_id']) in ('done', 'skipped'):
+                continue
+            # 명령어나 적응형 갱신으로 최근에 이미 갱신된 유저
+            if target['last_refreshed_at'] and target['last_refreshed_at'] >= recent_threshold:
+                skipped.append((target['user_id'], 'skipped', None))
+                continue
+            remaining.append(target)
+
+        await self.db_service.save_stats_run_progress(run_id, skipped)
+        await self.db_service.update_stats_run(run_id, total_users=len(targets))
+        self.logger.info(
+            f"갱신 대상 {len(targets)}명 중 이전 진행분 {len(targets) - len(remaining) - len(skipped)}명, "
+            f"최근 갱신 {len(skipped)}명 제외"
+        )
+        return remaining
+
+    @tasks.loop(minutes=REFRESH_SCHEDULER_INTERVAL_MINUTES)
+    async def adaptive_refresh_task(self):
+        """플레이 빈도에 따라 갱신 시각이 된 유저를 하루 종일 나누어 갱신"""
+        try:
+            if self.refresh_service.retry_after() is not None:
+                return
+
+            if REFRESH_QUEUE_ENABLED:
+                # 갱신은 worker.py 프로세스들이 작업 큐에서 가져가 처리
+                await self.refresh_scheduler.enqueue_tick(
+                    [guild.id for guild in self.bot.guilds],
+                    REFRESH_PRIORITY_SCHEDULED
+                )
+                return
+
+            rate_limiter = self.user_service.riot_service.rate_limiter
+            # 한 주기 동안 보낼 수 있는 요청 수 중 일부만 사용
+            request_budget = int(
+                rate_limiter.requests_per_two_minutes
+                * (REFRESH_SCHEDULER_INTERVAL_MINUTES / 2)
+                * REFRESH_SCHEDULER_BUDGET_RATIO
+            )
+            await self.refresh_scheduler.run_tick(
+                [guild.id for guild in self.bot.guilds],
+                request_budget
+            )
+        except Exception as e:
+            self.logger.error(f"적응형 전적 갱신 중 오류: {str(e)}")
+
+    @adaptive_refresh_task.before_loop
+    async def before_adaptive_refresh_task(self):
+        await self.bot.wait_until_ready()
+
+    async def update_guilds(self, guilds: List[discord.Guild], runs: Optional[Dict[int, int]] = None) -> List[Dict]:
+        """여러 길드의 유저 전적을 Riot 계정 단위로 중복 제거하여 한 번에 갱신
+
+        runs(guild_id → 실행 ID)가 주어지면 유저별 처리 결과를 체크포인트로 저장하고,
+        이미 처리되었거나 최근에 갱신된 유저는 건너뜁니다.
+        Riot API 장애로 보류된(deferred) 유저는 체크포인트에 기록하지 않습니다.
+        """
+        targets, error = await self.db_service.get_refresh_targets([guild.id for guild in guilds])
+        if error:
+            self.logger.error(f"갱신 대상 조회 실패: {error}")
+            return []
+
+        # 체크포인트·최근 갱신으로 걸러내기 전의 길드별 등록 유저 수
+        registered: Dict[int, int] = {}
+        for target in targets:
+            registered[target['guild_id']] = registered.get(target['guild_id'], 0) + 1
+
+        if runs:
+            remaining = []
+            for guild_id, run_id in runs.items():
+                remaining.extend(await self._prepare_run_targets(
+                    run_id, [target for target in targets if target['guild_id'] == guild_id]
+                ))
+            targets = remaining
+
+        targets_by_guild: Dict[int, List[Dict]] = {}
+        for target in targets:
+            targets_by_guild.setdefault(target['guild_id'], []).append(target)
+
+        # 알림이 켜진 길드에 진행 상황 메시지 전송
+        progress_messages = {}
+        reporters: Dict[int, ProgressReporter] = {}
+        for guild in guilds:
+            guild_targets = targets_by_guild.get(guild.id, [])
+            progress_messages[guild.id] = await self._begin_guild_report(
+                guild, guild_targets, registered.get(guild.id, 0)
+            )
+            if progress_messages[guild.id]:
+                reporters[guild.id] = ProgressReporter(
+                    progress_messages[guild.id],
+                    "전적 갱신 중",
+                    len(guild_targets),
+                    footer="매일 정해진 시각에 자동으로 갱신됩니다. (%갱신시간)"
+                )
+
+        saved: Dict[int, int] = {}
+
+        async def on_result(result: Dict) -> None:
+            reporter = reporters.get(result['guild_id'])
+            if reporter:
+                reporter.advance()
+            if not runs or result['deferred']:
+                return
+            run_id = runs[result['guild_id']]
+            await self.db_service.save_stats_run_progress(run_id, [(
+                result['user']['user_id'],
+                'done' if result['success'] else 'failed',
+                result['error']
+            )])
+
+            # 진행 중에도 실행 기록의 처리 유저 수를 주기적으로 반영
+            saved[run_id] = saved.get(run_id, 0) + 1
+            if saved[run_id] % RUN_PROGRESS_UPDATE_EVERY == 0:
+                await self.db_service.update_stats_run(run_id)
+
+        # 같은 계정은 길드가 달라도 한 번만 조회 (동시 작업 수는 RefreshService 가 제한)
+        results = await self.refresh_service.refresh_accounts(targets, on_result=on_result)
+
+        results_by_guild: Dict[int, List[Dict]] = {}
+        for result in results:
+            results_by_guild.setdefault(result['guild_id'], []).append(result)
+
+        usage = self.user_service.riot_service.fair_share.usage()
+        for guild in guilds:
+            if guild.id in usage:
+                self.logger.info(f"길드 {guild.name} API 누적 호출 수: {usage[guild.id]['requests']}회")
+
+        for guild in guilds:
+            progress_msg = progress_messages.get(guild.id)
+            if progress_msg:
+                await reporters[guild.id].close()
+                await self._finish_guild_report(guild, progress_msg, results_by_guild.get(guild.id, []))
+
+        return results
 
     async def update_guild_users(self, guild) -> None:
         """길드 내 모든 유저의 전적 갱신"""
         self.logger.info(f"길드 {guild.name} ({guild.id}) 전적 갱신 시작")
-        
+        await self.update_guilds([guild])
+
+    async def _begin_guild_report(
+        self,
+        guild,
+        users: List[Dict],
+        registered_count: Optional[int] = None
+    ) -> Optional[discord.Message]:
+        """갱신 시작 알림 전송 (알림이 꺼져 있거나 보낼 필요가 없으면 None)
+
+        Parameters:
+            users: 이번에 갱신할 유저 (이미 처리했거나 최근에 갱신된 유저 제외)
+            registered_count: 걸러내기 전의 등록 유저 수 (기본: len(users))
+        """
+        if registered_count is None:
+            registered_count = len(users)
+        if registered_count and not users:
+            # 유저는 있지만 모두 이미 처리했거나 최근에 갱신됨 - 알릴 내용 없음
+            return None
+
         # 길드 설정 조회
         settings, error = await self.db_service.get_guild_settings(guild.id)
         if error:
             self.logger.error(f"길드 설정 조회 실패: {error}")
-            return
+            return None
             
         if not settings['update_notifications']:
             self.logger.info(f"길드 {guild.name}의 알림이 비활성화되어 있습니다.")
             # 알림 없이 갱신만 진행
-            await self.update_users_without_notification(guild)
-            return
+            return None
 
         # 지정된 채널 찾기
         notify_channel = None
@@ -69,84 +346,66 @@ class AutomaticStatsUpdater(commands.Cog):
 
         if not notify_channel:
             self.logger.warning(f"길드 {guild.name}에서 '게임방' 채널을 찾을 수 없습니다.")
-            return
+            return None
 
         try:
+            if not registered_count:
+                await notify_channel.send(embed=EmbedBuilder.info(
+                    "전적 갱신 완료",
+                    "현재 등록된 유저가 없습니다.",
+                    footer="유저를 등록하려면 %유저등록 명령어를 사용하세요."
+                ))
+                return None
+
             # 진행 상황 알림 전송
             progress_embed = EmbedBuilder.info(
                 "전적 갱신 시작",
                 "서버 내 모든 유저의 전적을 갱신하고 있습니다...",
-                footer="매일 오전 6시에 자동으로 갱신됩니다."
+                footer="매일 정해진 시각에 자동으로 갱신됩니다. (%갱신시간)"
             )
-            progress_msg = await notify_channel.send(embed=progress_embed)
-
-            # 길드의 모든 유저 조회
-            users, error = await self.user_service.get_all_users(guild.id)
-            if error:
-                self.logger.error(f"길드 {guild.name} 유저 목록 조회 실패: {error}")
-                await progress_msg.edit(embed=EmbedBuilder.error(
-                    "전적 갱신 실패",
-                    "유저 목록을 가져오는데 실패했습니다."
-                ))
-                return
+            return await notify_channel.send(embed=progress_embed)
 
-            if not users:
-                await progress_msg.edit(embed=EmbedBuilder.info(
-                    "전적 갱신 완료",
-                    "현재 등록된 유저가 없습니다.",
-                    footer="유저를 등록하려면 %유저등록 명령어를 사용하세요."
-                ))
-                return
+        except Exception as e:
+            self.logger.error(f"길드 {guild.name} 갱신 알림 전송 중 오류: {str(e)}")
+            return None
 
-            # 갱신 결과 추적
-            success_count = 0
-            fail_count = 0
-            updated_users = []
-
-            # 각 유저 전적 갱신
-            for user in users:
-                nickname_tag = f"{user['nickname']}#{user['tag']}"
-                try:
-                    success, error, updated_info = await self.user_service.update_user_stats(
-                        guild_id=guild.id,
-                        nickname_tag=nickname_tag
-                    )
-                    
-                    if success and updated_info:
-                        success_count += 1
-                        # 변경된 전적이 있는 경우만 기록
-                        if self._has_stats_changed(user, updated_info):
-                            updated_users.append({
-                                'nickname_tag': nickname_tag,
-                                'old_stats': user,
-                                'new_stats': updated_info
-                            })
-                    else:
-                        fail_count += 1
-                        self.logger.warning(f"유저 {nickname_tag} 갱신 실패: {error}")
-                        
-                except Exception as e:
-                    fail_count += 1
-                    self.logger.error(f"유저 {nickname_tag} 처리 중 오류: {str(e)}")
+    async def _finish_guild_report(self, guild, progress_msg: discord.Message, results: List[Dict]) -> None:
+        """갱신 결과로 진행 상황 메시지 수정"""
+        try:
+            # 갱신 결과 집계 (장애로 보류된 유저는 따로 집계)
+            deferred_count = sum(1 for result in results if result['deferred'])
+            results = [result for result in results if not result['deferred']]
+            success_count = sum(1 for result in results if result['success'])
+            fail_count = len(results) - success_count
+            updated_users = [
+                {
+                    'nickname_tag': result['nickname_tag'],
+                    'old_stats': result['user'],
+                    'new_stats': result['updated_info']
+                }
+                for result in results
+                # 변경된 전적이 있는 경우만 기록
+                if result['success'] and self._has_stats_changed(result['user'], result['updated_info'])
+            ]
 
             # 결과 임베드 생성 및 전송
             result_embed = self._create_update_result_embed(
-                total=len(users),
+                total=len(results),
                 success=success_count,
                 failed=fail_count,
-                updated_users=updated_users
+                updated_users=updated_users,
+                deferred=deferred_count
             )
             
             await progress_msg.edit(embed=result_embed)
 
         except Exception as e:
             self.logger.error(f"길드 {guild.name} 전적 갱신 중 오류: {str(e)}")
-            if notify_channel:
-                error_embed = EmbedBuilder.error(
-                    "전적 갱신 실패",
-                    "전적 갱신 중 오류가 발생했습니다."
-                )
-                await notify_channel.send(embed=error_embed)
+            error_embed = EmbedBuilder.error(
+                "전적 갱신 실패",
+                "전적 갱신 중 오류가 발생했습니다."
+            )
+            await progress_msg.channel.send(embed=error_embed)
 
     def _has_stats_changed(self, old_stats: Dict, new_stats: Dict) -> bool:
         """전적 변경 여부 확인"""
@@ -161,7 +420,8 @@ class AutomaticStatsUpdater(commands.Cog):
         total: int,
         success: int,
         failed: int,
-        updated_users: List[Dict]
+        updated_users: List[Dict],
+        deferred: int = 0
     ) -> discord.Embed:
         """갱신 결과 임베드 생성"""
         # 변경된 전적이 있는 유저들의 정보 포맷팅
@@ -185,7 +445,11 @@ class AutomaticStatsUpdater(commands.Cog):
             )
 
         # 결과 임베드 생성
-        if success == total:
+        if deferred and success == total:
+            title = "⏸️ 전적 갱신 일시 중지"
+            description = f"라이엇 API 장애로 {deferred}명의 갱신이 보류되었습니다. 복구되면 이어서 갱신합니다."
+            color = discord.Color.yellow()
+        elif success == total:
             title = "✅ 전적 갱신 완료"
             description = "모든 유저의 전적이 성공적으로 갱신되었습니다."
             color = discord.Color.green()
@@ -231,27 +495,10 @@ class AutomaticStatsUpdater(commands.Cog):
 
         # 타임스탬프 추가
         embed.timestamp = datetime.now()
-        embed.set_footer(text="다음 갱신: 내일 오전 6시")
+        embed.set_footer(text="다음 갱신: 내일 같은 시각")
 
         return embed
 
-    async def update_users_without_notification(self, guild) -> None:
-        """알림 없이 유저 전적 갱신"""
-        users, error = await self.user_service.get_all_users(guild.id)
-        if error:
-            self.logger.error(f"길드 {guild.name} 유저 목록 조회 실패: {error}")
-            return
-
-        for user in users:
-            nickname_tag = f"{user['nickname']}#{user['tag']}"
-            try:
-                await self.user_service.update_user_stats(
-                    guild_id=guild.id,
-                    nickname_tag=nickname_tag
-                )
-            except Exception as e:
-                self.logger.error(f"유저 {nickname_tag} 갱신 중 오류: {str(e)}")
-
     @commands.command(
         name="알림설정",
         help="자동 전적 갱신 알림 설정을 변경합니다.",
@@ -277,7 +524,62 @@ class AutomaticStatsUpdater(commands.Cog):
             embed = EmbedBuilder.success(
                 "설정 완료",
                 f"자동 전적 갱신 알림이 {status}로 설정되었습니다.",
-                footer="매일 오전 6시에 전적이 갱신됩니다."
+                footer="매일 정해진 시각에 전적이 갱신됩니다. (%갱신시간)"
+            )
+        else:
+            embed = EmbedBuilder.error(
+                "설정 실패",
+                f"설정 변경 중 오류가 발생했습니다: {error}"
+            )
+
+        await ctx.reply(embed=embed)
+
+    @commands.command(
+        name="갱신시간",
+        help="매일 자동 전적 갱신을 시작할 시각을 확인하거나 변경합니다. '자동'이면 다른 서버와 겹치지 않는 시각에 배치됩니다.",
+        usage="%갱신시간 [HH:MM/자동] [시간대]"
+    )
+    @commands.has_permissions(administrator=True)
+    async def set_refresh_window(self, ctx, start: Optional[str] = None, timezone_name: Optional[str] = None):
+        if start is None:
+            planned = self.refresh_windows.get(ctx.guild.id)
+            await ctx.reply(embed=EmbedBuilder.info(
+                "갱신 시각",
+                f"매일 {planned:%H:%M} 에 전적이 갱신됩니다." if planned
+                else "아직 갱신 시각이 배치되지 않았습니다.",
+                footer="변경하려면 %갱신시간 [HH:MM/자동] [시간대] 를 사용하세요."
+            ))
+            return
+
+        window_start = None
+        if start != '자동':
+            try:
+                window_start = datetime.strptime(start, '%H:%M').time()
+            except ValueError:
+                await ctx.reply(embed=EmbedBuilder.error(
+                    "잘못된 입력",
+                    "시각은 HH:MM 형식(예: 05:30) 또는 '자동'만 가능합니다."
+                ))
+                return
+
+        if timezone_name is None:
+            settings, _ = await self.db_service.get_guild_refresh_settings([ctx.guild.id])
+            timezone_name = settings[0]['refresh_timezone'] if settings else 'Asia/Seoul'
+        elif timezone_name not in pytz.all_timezones_set:
+            await ctx.reply(embed=EmbedBuilder.error(
+                "잘못된 입력",
+                f"알 수 없는 시간대입니다: {timezone_name} (예: Asia/Seoul)"
+            ))
+            return
+
+        success, error = await self.db_service.update_guild_refresh_window(
+            ctx.guild.id, timezone_name, window_start
+        )
+        if success:
+            embed = EmbedBuilder.success(
+                "설정 완료",
+                f"매일 {window_start:%H:%M} ({timezone_name}) 에 전적이 갱신됩니다." if window_start
+                else f"다른 서버와 겹치지 않는 시각 ({timezone_name} 오전 6시 이후)에 자동으로 갱신됩니다."
             )
         else:
             embed = EmbedBuilder.error(
@@ -287,7 +589,80 @@ class AutomaticStatsUpdater(commands.Cog):
 
         await ctx.reply(embed=embed)
 
+    @commands.command(
+        name="갱신비용",
+        help="이 서버의 전적 갱신에 필요한 API 호출 수, DB 쓰기 수, 소요 시간을 실제 갱신 없이 추정합니다.",
+        usage="%갱신비용"
+    )
+    @commands.has_permissions(administrator=True)
+    async def show_refresh_cost(self, ctx):
+        targets, error = await self.db_service.get_refresh_targets([ctx.guild.id])
+        if error:
+            await ctx.reply(embed=EmbedBuilder.error(
+                "추정 실패",
+                f"갱신 대상 조회 중 오류가 발생했습니다: {error}"
+            ))
+            return
+
+        rate_limiter = self.user_service.riot_service.rate_limiter
+        guilds, _ = estimate_refresh_cost(
+            targets,
+            rate_limiter.requests_per_second,
+            rate_limiter.requests_per_two_minutes,
+            rate_limiter.available()
+        )
+        cost = guilds.get(ctx.guild.id)
+        if not cost:
+            await ctx.reply(embed=EmbedBuilder.info("갱신 비용", "현재 등록된 유저가 없습니다."))
+            return
+
+        await ctx.reply(embed=EmbedBuilder.info(
+            "갱신 비용 (예상)",
+            "마지막 매치 시간과 플레이 빈도로 추정한 일일 전적 갱신 비용입니다.",
+            fields=[
+                ("유저", f"{cost['users']}명 (최근 갱신 {cost['skipped']}명 제외)", True),
+                ("Riot 계정", f"{cost['accounts']}개", True),
+                ("예상 새 게임", f"{cost['new_games']:.0f}판", True),
+                ("API 호출", f"{cost['api_calls']:.0f}회", True),
+                ("DB 쓰기", f"{cost['db_writes']:.0f}회", True),
+                ("예상 소요 시간", format_duration(cost['wall_seconds']), True)
+            ],
+            footer="다른 서버와 동시에 갱신되면 소요 시간이 늘어날 수 있습니다."
+        ))
+
+    @commands.command(
+        name="API사용량",
+        help="전적 갱신에 사용된 이 서버의 Riot API 호출 수를 보여줍니다.",
+        usage="%API사용량"
+    )
+    @commands.has_permissions(administrator=True)
+    async def show_api_usage(self, ctx):
+        fair_share = self.user_service.riot_service.fair_share
+        usage = fair_share.usage().get(ctx.guild.id)
+        if not usage:
+            await ctx.reply(embed=EmbedBuilder.info(
+                "API 사용량",
+                "봇이 시작된 이후 이 서버의 전적 갱신에 사용된 API 호출이 없습니다."
+            ))
+            return
+
+        quota = usage['quota']
+        await ctx.reply(embed=EmbedBuilder.info(
+            "API 사용량",
+            "봇이 시작된 이후 이 서버의 전적 갱신에 사용된 Riot API 호출 수입니다.",
+            fields=[
+                ("누적 호출", f"{usage['requests']}회", True),
+                ("최근 2분", f"{usage['recent_requests']}회", True),
+                ("대기 중", f"{usage['waiting']}건", True),
+                ("배분 비율", f"{usage['weight']:g}", True),
+                ("2분당 한도", f"{quota}회" if quota is not None else "없음", True)
+            ]
+        ))
+
     @set_notifications.error
+    @set_refresh_window.error
+    @show_refresh_cost.error
+    @show_api_usage.error
     async def command_error(self, ctx, error):
         """명령어 오류 처리"""
         if isinstance(error, commands.MissingPermissions):
@@ -311,20 +686,7 @@ class AutomaticStatsUpdater(commands.Cog):
 
     @stats_update_task.before_loop
     async def before_update_task(self):
-        """다음 실행 시간까지 대기"""
         await self.bot.wait_until_ready()
-        
-        # 다음 실행 시간 계산 (한국 시간 기준)
-        now = datetime.now(self.kst)
-        target = datetime.combine(now.date(), self.update_time)
-        target = self.kst.localize(target)
-        
-        if now.time() >= self.update_time:
-            target += timedelta(days=1)
-        
-        # 대기
-        wait_seconds = (target - now).total_seconds()
-        await asyncio.sleep(wait_seconds)
 
 async def setup(bot):
     """코그 설정"""
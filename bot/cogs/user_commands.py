@@ -1,28 +1,255 @@
 import discord
-from discord.ext import commands
+from discord import app_commands
+from discord.ext import commands, tasks
+from typing import Dict, List, Optional, Tuple
 from services.user_service import UserService
+from services.refresh_service import RefreshService
+from services.refresh_worker import RefreshWorker
+from services.user_importer import (
+    IMPORT_DUPLICATE,
+    IMPORT_EXISTS,
+    IMPORT_FAILED,
+    IMPORT_INVALID,
+    IMPORT_REGISTERED,
+    MAX_IMPORT_ROWS,
+    UserImporter,
+    parse_riot_ids
+)
+from utils.constants import REFRESH_QUEUE_ENABLED, REGISTRATION_POLL_SECONDS
 from utils.validators import validate_nickname_tag
+from utils.admission import admission_control
 from utils.embed_builder import EmbedBuilder
+from utils.progress_reporter import ProgressReporter
 from datetime import datetime
 import asyncio
+import csv
+import io
 import logging
 
+# 등록 후 전적 수집 작업 상태 표시
+REGISTRATION_STATUS_LABELS = {
+    'pending': "⏳ 대기 중",
+    'running': "🔄 수집 중",
+    'done': "✅ 완료",
+    'failed': "❌ 실패"
+}
+
+# 일괄 등록 행별 결과 표시
+IMPORT_STATUS_LABELS = {
+    IMPORT_REGISTERED: "✅ 등록",
+    IMPORT_EXISTS: "ℹ️ 이미 등록됨",
+    IMPORT_DUPLICATE: "ℹ️ 목록 내 중복",
+    IMPORT_INVALID: "⚠️ 형식 오류",
+    IMPORT_FAILED: "❌ 실패"
+}
+
+# 유저 목록 한 페이지에 표시할 유저 수
+USER_LIST_PAGE_SIZE = 10
+
+class UserListView(discord.ui.View):
+    def __init__(self, user_service: UserService, guild_id: int, total: int):
+        """유저 목록 페이지 이동 버튼
+
+        페이지마다 앞 페이지의 마지막 (닉네임, 태그) 다음부터 한 페이지만 조회합니다.
+        이미 본 페이지의 시작 위치를 기억하여 이전 페이지로도 이동합니다.
+        """
+        super().__init__(timeout=180)
+        self.user_service = user_service
+        self.guild_id = guild_id
+        self.total = total
+        self.page = 0
+
+        # 페이지별 시작 위치 (해당 페이지 직전 유저의 (닉네임, 태그))
+        self.cursors: List[Optional[Tuple[str, str]]] = [None]
+
+    @property
+    def page_count(self) -> int:
+        return max(1, -(-self.total // USER_LIST_PAGE_SIZE))
+
+    async def load_page(self, page: int) -> Tuple[Optional[discord.Embed], Optional[str]]:
+        users, error = await self.user_service.get_users_page(
+            self.guild_id, USER_LIST_PAGE_SIZE, self.cursors[page]
+        )
+        if error:
+            return None, error
+
+        self.page = page
+        if users and len(self.cursors) == page + 1:
+            self.cursors.append((users[-1]['nickname'], users[-1]['tag']))
+        return self.create_embed(users), None
+
+    def create_embed(self, users: List[Dict]) -> discord.Embed:
+        # 데이터를 두 개의 컬럼으로 나누어 표시
+        column1, column2 = [], []
+        columns = [column1, column2]
+        
+        for i, user in enumerate(users):
+            # 승률 계산
+            win_rate = (user['wins'] / user['games_played'] * 100) if user['games_played'] > 0 else 0
+            balance_score = f"{user['balance_score']:.1f}" if user.get('balance_score') is not None else "-"
+            
+            # 유저 정보 포맷팅
+            nickname_tag = f"{user['nickname']}#{user['tag']}"
+            user_info = (
+                f"```\n"
+                f"{nickname_tag}\n"
+                f"승률  : {win_rate:.0f}%\n"
+                f"KDA   : {user['avg_kda']:.1f}\n"
+                f"평점  : {balance_score}\n"
+                f"```"
+            )
+            
+            # 각 컬럼에 번갈아가며 추가
+            columns[i % 2].append(user_info)
+
+        embed = discord.Embed(
+            title="📊 등록된 유저 목록",
+            description=f"총 {self.total}명의 유저가 등록되어 있습니다.",
+            color=discord.Color.blue()
+        )
+        
+        # 필드 이름을 공백으로 설정하되, Zero-Width Space를 사용하여 구분
+        if column1:
+            embed.add_field(name="⠀", value="\n".join(column1), inline=True)
+        if column2:
+            embed.add_field(name="⠀", value="\n".join(column2), inline=True)
+        
+        embed.set_footer(text=f"페이지 {self.page + 1}/{self.page_count} · 자세한 정보는 %유저정보 [닉네임#태그]")
+        return embed
+
+    def update_buttons(self) -> None:
+        self.previous_page.disabled = self.page == 0
+        self.next_page.disabled = self.page >= self.page_count - 1
+
+    async def _show(self, interaction: discord.Interaction, page: int) -> None:
+        embed, error = await self.load_page(page)
+        if error:
+            await interaction.response.send_message(
+                embed=EmbedBuilder.error("목록 조회 실패", error), ephemeral=True
+            )
+            return
+        self.update_buttons()
+        await interaction.response.edit_message(embed=embed, view=self)
+
+    @discord.ui.button(label="◀ 이전", style=discord.ButtonStyle.secondary)
+    async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._show(interaction, max(0, self.page - 1))
+
+    @discord.ui.button(label="다음 ▶", style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._show(interaction, min(len(self.cursors) - 1, self.page + 1))
+
 class UserCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.user_service = UserService()
+        self.user_importer = UserImporter(self.user_service)
+
+        # 전적 수집 완료를 알려줄 등록 요청 (user_id → (등록 안내 메시지, 닉네임#태그, 요청자))
+        # 슬래시 명령어에는 답장할 명령 메시지가 없으므로 봇이 보낸 안내 메시지에 답장합니다.
+        self.pending_registrations: Dict[int, Tuple[discord.Message, str, discord.abc.User]] = {}
+
+        # 작업 큐 워커를 따로 실행하지 않는 경우 등록 후 전적 수집을 봇에서 처리
+        self.registration_worker: Optional[RefreshWorker] = None
+        self._worker_task: Optional[asyncio.Task] = None
         
         # 로깅 설정
         self.logger = logging.getLogger(__name__)
-        self.logger.setLevel(logging.DEBUG)
+
+    async def cog_load(self):
+        if not REFRESH_QUEUE_ENABLED:
+            # 샤드를 나누어 실행하면 이 프로세스가 맡은 길드의 등록 작업만 처리
+            shards = None
+            if self.bot.shard_ids is not None:
+                shards = (self.bot.shard_count, self.bot.shard_ids)
+            self.registration_worker = RefreshWorker(
+                refresh_service=RefreshService(self.user_service),
+                shards=shards
+            )
+            self._worker_task = asyncio.create_task(self.registration_worker.run())
+
+    def cog_unload(self):
+        """코그가 언로드될 때 작업 중지"""
+        self.registration_watch_task.cancel()
+        if self.registration_worker:
+            self.registration_worker.stop()
+
+    @tasks.loop(seconds=REGISTRATION_POLL_SECONDS)
+    async def registration_watch_task(self):
+        """전적 수집이 끝난 등록 요청에 결과 알림"""
+        if not self.pending_registrations:
+            self.registration_watch_task.stop()
+            return
+
+        jobs, error = await self.user_service.get_registration_jobs(list(self.pending_registrations))
+        if error:
+            self.logger.error(f"등록 작업 상태 조회 실패: {error}")
+            return
+
+        for user_id, (message, nickname_tag, author) in list(self.pending_registrations.items()):
+            job = jobs.get(user_id)
+            if job and job['status'] not in ('done', 'failed'):
+                continue
+            del self.pending_registrations[user_id]
+            if not job:
+                # 수집 전에 삭제된 유저
+                continue
+
+            if job['status'] == 'done':
+                user_info, error_msg = await self.user_service.get_user(message.guild.id, nickname_tag)
+                if error_msg:
+                    embed = EmbedBuilder.error("전적 수집 결과 조회 실패", error_msg)
+                else:
+                    embed = self._create_registration_embed(nickname_tag, user_info)
+            else:
+                embed = EmbedBuilder.error(
+                    "전적 수집 실패",
+                    f"{nickname_tag} 님의 전적을 수집하지 못했습니다: {job['error']}",
+                    footer="다음 자동 갱신 때 다시 수집합니다."
+                )
+
+            try:
+                await message.reply(content=author.mention, embed=embed)
+            except discord.HTTPException as e:
+                self.logger.warning(f"전적 수집 결과 알림 실패: {str(e)}")
+
+    @registration_watch_task.before_loop
+    async def before_registration_watch_task(self):
+        await self.bot.wait_until_ready()
+
+    def _create_registration_embed(self, nickname_tag: str, user_info: Dict) -> discord.Embed:
+        """전적 수집이 끝난 유저의 실력 분석 결과 임베드"""
+        # 성능 지표 문자열 생성
+        win_rate = (user_info['wins'] / user_info['games_played'] * 100) if user_info['games_played'] > 0 else 0
+        performance_str = (
+            f"• 전체 게임: {user_info['games_played']}게임\n"
+            f"• 승/패: {user_info['wins']}승 {user_info['losses']}패 ({win_rate:.1f}%)\n"
+            f"• 평균 KDA: {user_info['avg_kda']:.2f}\n"
+            f"• 평균 딜량: {user_info['avg_damage_dealt']:,}\n"
+            f"• 평균 받은 피해: {user_info['avg_damage_taken']:,}\n"
+            f"• 평균 힐량: {user_info['avg_healing']:,}\n"
+            f"• CC 점수: {user_info.get('avg_cc_score', 0):.1f}\n"
+            f"• 종합 점수: {user_info['performance_score']:.2f}"
+        )
+
+        return EmbedBuilder.success(
+            "전적 수집 완료",
+            f"{nickname_tag} 님의 전적 분석이 끝났습니다!",
+            fields=[("실력 분석 결과", performance_str, False)],
+            footer="게임에 참여하실 준비가 완료되었습니다!"
+        )
 
     @commands.guild_only()
-    @commands.command(
+    @commands.hybrid_command(
         name="유저등록",
         help="새로운 게이머를 등록합니다.",
         usage="%유저등록 [닉네임#태그]"
     )
+    @admission_control()
     async def register(self, ctx, nickname_tag: str):
+        # 슬래시 명령어로 실행된 경우 Riot API 조회가 끝날 때까지 응답을 미룸
+        await ctx.defer()
+
         # 닉네임 형식 검증
         if not validate_nickname_tag(nickname_tag):
             embed = EmbedBuilder.error(
@@ -33,16 +260,7 @@ class UserCommands(commands.Cog):
             await ctx.reply(embed=embed)
             return
 
-        # 진행 중 임베드 표시
-        progress_embed = EmbedBuilder.info(
-            "등록 진행 중",
-            f"{nickname_tag} 님의 전적을 분석하고 있습니다...",
-            fields=[("예상 소요 시간", "약 10-20초", False)],
-            footer="Riot API에서 데이터를 가져오는 중..."
-        )
-        progress_msg = await ctx.reply(embed=progress_embed)
-
-        # 유저 등록 시도
+        # 유저 등록 시도 (전적 수집은 백그라운드에서 진행)
         success, error_msg, user_info = await self.user_service.register_user(
             guild_id=ctx.guild.id,
             guild_name=ctx.guild.name,
@@ -54,32 +272,143 @@ class UserCommands(commands.Cog):
                 "등록 실패",
                 error_msg
             )
-        else:
-            # 성능 지표 문자열 생성
-            win_rate = (user_info['wins'] / user_info['games_played'] * 100) if user_info['games_played'] > 0 else 0
-            performance_str = (
-                f"• 전체 게임: {user_info['games_played']}게임\n"
-                f"• 승/패: {user_info['wins']}승 {user_info['losses']}패 ({win_rate:.1f}%)\n"
-                f"• 평균 KDA: {user_info['avg_kda']:.2f}\n"
-                f"• 평균 딜량: {user_info['avg_damage_dealt']:,}\n"
-                f"• 평균 받은 피해: {user_info['avg_damage_taken']:,}\n"
-                f"• 평균 힐량: {user_info['avg_healing']:,}\n"
-                f"• CC 점수: {user_info.get('avg_cc_score', 0):.1f}\n"
-                f"• 종합 점수: {user_info['performance_score']:.2f}"
-            )
+            await ctx.reply(embed=embed)
+            return
 
-            embed = EmbedBuilder.success(
-                "등록 성공",
-                f"{nickname_tag} 님이 성공적으로 등록되었습니다!",
-                fields=[
-                    ("등록 시각", datetime.now().strftime("%Y-%m-%d %H:%M"), True),
-                    ("실력 분석 결과", performance_str, False)
-                ],
-                footer="게임에 참여하실 준비가 완료되었습니다!"
-            )
+        embed = EmbedBuilder.success(
+            "등록 성공",
+            f"{nickname_tag} 님이 성공적으로 등록되었습니다!",
+            fields=[
+                ("등록 시각", datetime.now().strftime("%Y-%m-%d %H:%M"), True),
+                ("전적 분석", "최근 전적을 수집하고 있습니다. 완료되면 이 메시지에 답장으로 알려드립니다.", False)
+            ],
+            footer=f"진행 상황: %등록상태 {nickname_tag}"
+        )
+        reply = await ctx.reply(embed=embed)
 
-        await progress_msg.delete()
-        await ctx.reply(embed=embed)
+        # 전적 수집 완료 알림 대기
+        self.pending_registrations[user_info['id']] = (reply, nickname_tag, ctx.author)
+        if not self.registration_watch_task.is_running():
+            self.registration_watch_task.start()
+
+    @commands.guild_only()
+    @commands.hybrid_command(
+        name="등록상태",
+        help="등록한 게이머의 전적 수집 진행 상황을 확인합니다.",
+        usage="%등록상태 [닉네임#태그]"
+    )
+    async def registration_status(self, ctx, nickname_tag: str):
+        await ctx.defer()
+
+        user_info, job, error_msg = await self.user_service.get_registration_status(ctx.guild.id, nickname_tag)
+        if error_msg:
+            await ctx.reply(embed=EmbedBuilder.error("조회 실패", error_msg))
+            return
+
+        if not job:
+            await ctx.reply(embed=EmbedBuilder.info(
+                "전적 수집 상태",
+                f"{nickname_tag} 님의 전적 수집 기록이 없습니다.",
+                footer="전적은 자동 갱신 때 수집됩니다."
+            ))
+            return
+
+        fields = [
+            ("상태", REGISTRATION_STATUS_LABELS[job['status']], True),
+            ("시도 횟수", f"{job['attempts']}회", True),
+            ("최근 변경", job['updated_at'].strftime("%Y-%m-%d %H:%M:%S"), True)
+        ]
+        if job['status'] == 'done':
+            fields.append(("수집된 게임", f"{user_info['games_played']}게임", True))
+        if job['error']:
+            fields.append(("오류", job['error'], False))
+
+        await ctx.reply(embed=EmbedBuilder.info(
+            "전적 수집 상태",
+            f"{nickname_tag} 님의 등록 후 전적 수집 진행 상황입니다.",
+            fields=fields
+        ))
+
+    @commands.guild_only()
+    @commands.command(
+        name="유저일괄등록",
+        help="여러 게이머를 한 번에 등록합니다. (관리자 전용)",
+        usage="%유저일괄등록 [닉네임#태그, 닉네임#태그, ...] 또는 CSV/텍스트 파일 첨부"
+    )
+    @commands.has_permissions(administrator=True)
+    @admission_control()
+    async def import_users(self, ctx, *, riot_ids: str = ""):
+        # 메시지 본문과 첨부 파일에서 Riot ID 수집
+        texts = [riot_ids]
+        for attachment in ctx.message.attachments:
+            try:
+                texts.append((await attachment.read()).decode('utf-8-sig'))
+            except (discord.HTTPException, UnicodeDecodeError):
+                await ctx.reply(embed=EmbedBuilder.error(
+                    "일괄 등록 실패",
+                    f"첨부 파일 '{attachment.filename}' 을 읽을 수 없습니다. (UTF-8 CSV/텍스트 파일만 지원)"
+                ))
+                return
+        targets = parse_riot_ids("\n".join(texts))
+
+        if not targets:
+            await ctx.reply(embed=EmbedBuilder.error(
+                "일괄 등록 실패",
+                "등록할 Riot ID 가 없습니다.",
+                fields=[("사용법", "쉼표나 줄바꿈으로 구분한 `닉네임#태그` 목록을 입력하거나 CSV 파일을 첨부해주세요.", False)]
+            ))
+            return
+        if len(targets) > MAX_IMPORT_ROWS:
+            await ctx.reply(embed=EmbedBuilder.error(
+                "일괄 등록 실패",
+                f"한 번에 최대 {MAX_IMPORT_ROWS}명까지 등록할 수 있습니다. (입력: {len(targets)}명)"
+            ))
+            return
+
+        progress_msg = await ctx.reply(embed=EmbedBuilder.info(
+            "일괄 등록 중",
+            f"{len(targets)}개의 Riot ID 를 확인하고 있습니다..."
+        ))
+        reporter = ProgressReporter(progress_msg, "일괄 등록 중", len(targets), footer="Riot ID 확인 중...")
+
+        results = await self.user_importer.import_users(
+            ctx.guild.id, ctx.guild.name, targets, on_resolved=reporter.advance
+        )
+        await reporter.close()
+
+        # 결과 요약과 행별 결과 파일
+        counts: Dict[str, int] = {}
+        for result in results:
+            counts[result['status']] = counts.get(result['status'], 0) + 1
+        summary = "\n".join(
+            f"• {IMPORT_STATUS_LABELS[status]}: {counts[status]}명"
+            for status in IMPORT_STATUS_LABELS if counts.get(status)
+        )
+        failures = [result for result in results if result['status'] in (IMPORT_INVALID, IMPORT_FAILED)]
+        fields = [("결과", summary, False)]
+        if failures:
+            failure_lines = [f"{result['riot_id']}: {result['message']}" for result in failures[:10]]
+            if len(failures) > 10:
+                failure_lines.append(f"외 {len(failures) - 10}건 (첨부 파일 참조)")
+            fields.append(("실패 목록", "\n".join(failure_lines)[:1024], False))
+
+        report = io.StringIO()
+        writer = csv.writer(report)
+        writer.writerow(['riot_id', 'status', 'message'])
+        for result in results:
+            writer.writerow([result['riot_id'], result['status'], result['message']])
+
+        embed = EmbedBuilder.success(
+            "일괄 등록 완료",
+            f"{len(results)}개의 Riot ID 를 처리했습니다.",
+            fields=fields,
+            footer="등록된 유저의 전적은 백그라운드에서 수집됩니다."
+        )
+        await progress_msg.edit(embed=embed)
+        await ctx.reply(file=discord.File(
+            io.BytesIO(report.getvalue().encode('utf-8-sig')),
+            filename="import_results.csv"
+        ))
 
     @commands.guild_only()
     @commands.command(
@@ -146,13 +475,18 @@ class UserCommands(commands.Cog):
             await ctx.reply(embed=embed)
 
     @commands.guild_only()
-    @commands.command(
+    @commands.hybrid_command(
         name="유저목록",
         help="등록된 모든 유저의 목록을 보여줍니다.",
         usage="%유저목록"
     )
     async def list_users(self, ctx):
-        users, error_msg = await self.user_service.get_all_users(ctx.guild.id)
+        await ctx.defer()
+
+        total, error_msg = await self.user_service.count_users(ctx.guild.id)
+        if not error_msg and total:
+            view = UserListView(self.user_service, ctx.guild.id, total)
+            embed, error_msg = await view.load_page(0)
         
         if error_msg:
             embed = EmbedBuilder.error(
@@ -162,61 +496,27 @@ class UserCommands(commands.Cog):
             await ctx.reply(embed=embed)
             return
         
-        if not users:
+        if not total:
             embed = EmbedBuilder.error(
                 "등록된 유저 없음",
                 "현재 등록된 유저가 없습니다."
             )
             await ctx.reply(embed=embed)
             return
-            
-        # 데이터를 두 개의 컬럼으로 나누어 표시
-        column1, column2 = [], []
-        columns = [column1, column2]
-        
-        for i, user in enumerate(users):
-            # 승률 계산
-            win_rate = (user['wins'] / user['games_played'] * 100) if user['games_played'] > 0 else 0
-            
-            # 유저 정보 포맷팅
-            nickname_tag = f"{user['nickname']}#{user['tag']}"
-            user_info = (
-                f"```\n"
-                f"{nickname_tag}\n"
-                f"승률  : {win_rate:.0f}%\n"
-                f"KDA   : {user['avg_kda']:.1f}\n"
-                f"평점  : {user['performance_score']:.1f}\n"
-                f"```"
-            )
-            
-            # 각 컬럼에 번갈아가며 추가
-            columns[i % 2].append(user_info)
 
-        # 임베드 필드 생성
-        if column1:
-            embed = discord.Embed(
-                title="📊 등록된 유저 목록",
-                description=f"총 {len(users)}명의 유저가 등록되어 있습니다.",
-                color=discord.Color.blue()
-            )
-            
-            # 필드 이름을 공백으로 설정하되, Zero-Width Space를 사용하여 구분
-            if column1:
-                embed.add_field(name="⠀", value="\n".join(column1), inline=True)
-            if column2:
-                embed.add_field(name="⠀", value="\n".join(column2), inline=True)
-            
-            embed.set_footer(text="자세한 정보는 %유저정보 [닉네임#태그]")
-            
-            await ctx.reply(embed=embed)
+        # 한 페이지에 모두 들어가면 버튼 없이 표시
+        view.update_buttons()
+        await ctx.reply(embed=embed, view=view if view.page_count > 1 else None)
 
     @commands.guild_only()
-    @commands.command(
+    @commands.hybrid_command(
         name="유저정보",
         help="등록된 게이머의 정보를 조회합니다.",
         usage="%유저정보 [닉네임#태그]"
     )
     async def user_info(self, ctx, nickname_tag: str):
+        await ctx.defer()
+
         user_info, error_msg = await self.user_service.get_user(
             guild_id=ctx.guild.id,
             nickname_tag=nickname_tag
@@ -270,12 +570,15 @@ class UserCommands(commands.Cog):
         await ctx.reply(embed=embed)
 
     @commands.guild_only()
-    @commands.command(
+    @commands.hybrid_command(
         name="전적갱신",
         help="등록된 게이머의 전적 정보를 최신 데이터로 갱신합니다.",
         usage="%전적갱신 [닉네임#태그]"
     )
+    @admission_control()
     async def update_stats(self, ctx, nickname_tag: str):
+        await ctx.defer()
+
         # 닉네임 형식 검증
         if not validate_nickname_tag(nickname_tag):
             embed = EmbedBuilder.error(
@@ -286,12 +589,13 @@ class UserCommands(commands.Cog):
             await ctx.reply(embed=embed)
             return
 
-        # 진행 중 임베드 표시
+        # 진행 중 임베드 표시 (이미 진행 중인 갱신이 있으면 그 결과를 함께 사용)
+        joined = self.user_service.is_refreshing(ctx.guild.id, nickname_tag)
         progress_embed = EmbedBuilder.info(
             "갱신 진행 중",
             f"{nickname_tag} 님의 최신 전적을 분석하고 있습니다...",
             fields=[("예상 소요 시간", "약 10-20초", False)],
-            footer="Riot API에서 데이터를 가져오는 중..."
+            footer="이미 진행 중인 갱신의 결과를 기다리는 중..." if joined else "Riot API에서 데이터를 가져오는 중..."
         )
         progress_msg = await ctx.reply(embed=progress_embed)
 
@@ -346,6 +650,23 @@ class UserCommands(commands.Cog):
             await progress_msg.delete()
             await ctx.reply(embed=embed)
 
+    @user_info.autocomplete('nickname_tag')
+    @update_stats.autocomplete('nickname_tag')
+    @registration_status.autocomplete('nickname_tag')
+    async def nickname_tag_autocomplete(
+        self,
+        interaction: discord.Interaction,
+        current: str
+    ) -> List[app_commands.Choice[str]]:
+        """등록된 유저 중 입력한 앞부분으로 시작하는 닉네임#태그 추천 (최근 활동 순)"""
+        roster, error = await self.user_service.get_roster(interaction.guild_id)
+        if error or not roster:
+            return []
+        return [
+            app_commands.Choice(name=player['discord_id'], value=player['discord_id'])
+            for player in roster.search(current)[:25]
+        ]
+
     @commands.Cog.listener()
     async def on_guild_join(self, guild):
         """봇이 새로운 서버에 참여했을 때 실행"""
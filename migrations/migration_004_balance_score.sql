@@ -0,0 +1,9 @@
+-- migration_004_balance_score.sql
+
+-- 팀 밸런싱용 점수를 전적 집계 시점에 미리 계산하여 저장
+-- balance_score_version 이 현재 공식 버전과 다르면 봇 시작 시 일괄 재계산됩니다.
+ALTER TABLE user_stats
+ADD COLUMN IF NOT EXISTS balance_score DECIMAL(10,2) DEFAULT 50.00,
+ADD COLUMN IF NOT EXISTS balance_score_version INT DEFAULT 0;
+
+CREATE INDEX IF NOT EXISTS idx_balance_score_version ON user_stats(balance_score_version);
@@ -0,0 +1,13 @@
+-- migration_005_refresh_state.sql
+
+-- 유저별 전적 갱신 일정 (플레이 빈도에 따라 갱신 주기를 다르게 적용)
+CREATE TABLE IF NOT EXISTS refresh_state (
+    user_id INT PRIMARY KEY,
+    last_refreshed_at TIMESTAMP NULL,           -- 마지막 갱신 시각 (자동/수동 모두 포함)
+    next_refresh_at TIMESTAMP NULL,             -- 다음 갱신 예정 시각
+    play_rate FLOAT NOT NULL DEFAULT 0,         -- 최근 하루 평균 게임 수
+    failure_count INT NOT NULL DEFAULT 0,       -- 연속 갱신 실패 횟수 (실패할수록 다음 시도를 늦춤)
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS idx_next_refresh_at ON refresh_state(next_refresh_at);
@@ -0,0 +1,26 @@
+-- migration_006_stats_update_runs.sql
+
+-- 일일 전적 갱신 실행 기록 (재시작 시 이어서 진행하기 위한 체크포인트)
+CREATE TABLE IF NOT EXISTS stats_update_runs (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    guild_id BIGINT NULL,
+    run_date DATE NOT NULL,                     -- 갱신 기준 날짜 (길드 현지 시간)
+    status ENUM('running', 'completed', 'abandoned') NOT NULL DEFAULT 'running',
+    total_users INT NOT NULL DEFAULT 0,
+    done_users INT NOT NULL DEFAULT 0,
+    started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    finished_at TIMESTAMP NULL,
+    UNIQUE KEY unique_guild_run_date (guild_id, run_date)
+);
+
+-- 실행별 유저 처리 결과
+CREATE TABLE IF NOT EXISTS stats_update_progress (
+    run_id INT NOT NULL,
+    user_id INT NOT NULL,
+    status ENUM('done', 'failed', 'skipped') NOT NULL,
+    error VARCHAR(255) NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (run_id, user_id),
+    FOREIGN KEY (run_id) REFERENCES stats_update_runs(id) ON DELETE CASCADE,
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+);
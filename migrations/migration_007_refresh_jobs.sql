@@ -0,0 +1,21 @@
+-- migration_007_refresh_jobs.sql
+
+-- 전적 갱신 작업 큐 (여러 워커 프로세스가 임대(lease) 방식으로 나누어 처리)
+-- 같은 유저·우선순위의 작업은 한 행만 유지하며, 끝난 작업은 다시 등록될 때 재사용됩니다.
+CREATE TABLE IF NOT EXISTS refresh_jobs (
+    id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    user_id INT NOT NULL,
+    priority TINYINT NOT NULL DEFAULT 0,        -- 높을수록 먼저 처리
+    status ENUM('pending', 'running', 'done', 'failed') NOT NULL DEFAULT 'pending',
+    attempts INT NOT NULL DEFAULT 0,
+    worker_id VARCHAR(64) NULL,                 -- 작업을 가져간 워커
+    lease_expires_at TIMESTAMP NULL,            -- 이 시각까지 끝나지 않으면 다른 워커가 다시 가져감
+    available_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    error VARCHAR(255) NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    UNIQUE KEY unique_user_priority (user_id, priority),
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS idx_refresh_jobs_claim ON refresh_jobs(status, priority, available_at);
@@ -0,0 +1,6 @@
+-- migration_008_guild_api_share.sql
+
+-- 전적 갱신 시 길드별 API 호출 한도 배분 설정
+ALTER TABLE guilds
+ADD COLUMN IF NOT EXISTS api_weight FLOAT NOT NULL DEFAULT 1,    -- 다른 길드 대비 배분 비율
+ADD COLUMN IF NOT EXISTS api_quota INT NULL;                     -- 2분당 최대 호출 수 (NULL 이면 제한 없음)
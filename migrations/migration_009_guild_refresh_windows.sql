@@ -0,0 +1,6 @@
+-- migration_009_guild_refresh_windows.sql
+
+-- 길드별 일일 전적 갱신 시간대와 시작 시각 (NULL 이면 다른 길드와 겹치지 않도록 자동 배치)
+ALTER TABLE guilds
+ADD COLUMN IF NOT EXISTS refresh_timezone VARCHAR(64) NOT NULL DEFAULT 'Asia/Seoul',
+ADD COLUMN IF NOT EXISTS refresh_window_start TIME NULL;
@@ -0,0 +1,146 @@
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from services.team_balancer import TeamBalancer, BALANCE_SCORE_VERSION
+from utils.constants import COMPUTE_WORKERS, COMPUTE_TIMEOUT
+from utils.logging_config import setup_logger
+
+# 워커 프로세스에 전달되는 로스터 형식: ((플레이어 ID, 밸런스 점수), ...)
+# 전적 딕셔너리 전체 대신 계산에 필요한 값만 보내 직렬화 비용을 줄입니다.
+Roster = Tuple[Tuple[str, float], ...]
+
+
+def serialize_roster(players: List[dict]) -> Roster:
+    """플레이어 목록을 워커 전달용 로스터로 변환"""
+    return tuple(
+        (player['discord_id'], float(TeamBalancer.get_player_score(player)))
+        for player in players
+    )
+
+
+def deserialize_roster(roster: Roster) -> List[dict]:
+    """워커에서 로스터를 밸런서가 사용하는 플레이어 딕셔너리로 복원"""
+    return [
+        {
+            'discord_id': player_id,
+            'games_played': 0,
+            'balance_score': score,
+            'balance_score_version': BALANCE_SCORE_VERSION
+        }
+        for player_id, score in roster
+    ]
+
+
+def _warm_up() -> None:
+    """워커 초기화 시 무거운 모듈을 미리 로드"""
+    import numpy  # noqa: F401
+    import services.win_probability  # noqa: F401
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+def _balance_worker(
+    roster: Roster,
+    together: Sequence[Tuple[str, str]],
+    apart: Sequence[Tuple[str, str]],
+    performances: Optional[Dict[str, Tuple[float, ...]]],
+    deadline: float
+) -> List[int]:
+    """워커 프로세스에서 팀 밸런싱 실행 후 팀1 플레이어 인덱스 반환"""
+    from services.win_probability import WinProbabilityEstimator
+
+    players = deserialize_roster(roster)
+    estimator = WinProbabilityEstimator(performances) if performances is not None else None
+    team1, _ = TeamBalancer.balance_teams(
+        players, together, apart, estimator=estimator, deadline=deadline
+    )
+    team1_ids = {player['discord_id'] for player in team1}
+    return [i for i, player in enumerate(players) if player['discord_id'] in team1_ids]
+
+
+class ComputeService:
+    def __init__(self, max_workers: int = COMPUTE_WORKERS):
+        self.max_workers = max_workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self.logger = setup_logger(__name__, 'compute.log')
+
+    async def start(self) -> None:
+        """프로세스 풀 생성 및 워커 예열"""
+        if self._pool is not None:
+            return
+
+        # 이벤트 루프가 실행 중인 프로세스를 fork 하지 않도록 spawn 사용
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_warm_up
+        )
+
+        # 모든 워커를 미리 띄워 첫 요청의 프로세스 생성 지연 제거
+        loop = asyncio.get_running_loop()
+        pids = await asyncio.gather(*[
+            loop.run_in_executor(self._pool, _ping) for _ in range(self.max_workers)
+        ])
+        self.logger.info(f"연산 워커 {len(set(pids))}개 준비 완료")
+
+    def shutdown(self) -> None:
+        """프로세스 풀 종료 (대기 중인 작업은 취소)"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    async def run(self, fn: Callable, *args, timeout: float = COMPUTE_TIMEOUT):
+        """연산 작업을 워커에서 실행
+
+        timeout 을 넘기거나 호출한 태스크가 취소되면 아직 시작되지 않은 작업을 취소하고
+        asyncio.TimeoutError / CancelledError 를 그대로 전달합니다.
+        """
+        if self._pool is None:
+            await self.start()
+
+        future = self._pool.submit(fn, *args)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            future.cancel()
+            raise
+
+    async def balance_teams(
+        self,
+        players: List[dict],
+        together: Optional[Iterable[Tuple[str, str]]] = None,
+        apart: Optional[Iterable[Tuple[str, str]]] = None,
+        performances: Optional[Dict[str, List[float]]] = None,
+        timeout: float = COMPUTE_TIMEOUT
+    ) -> Tuple[List[dict], List[dict]]:
+        """TeamBalancer.balance_teams 를 워커에서 실행
+
+        performances(플레이어 ID별 게임 성능 점수)가 주어지면 승률 기준으로 밸런싱합니다.
+        조건을 만족하는 구성이 없으면 ValueError 가 발생합니다.
+        """
+        for player in players:
+            player['total_score'] = TeamBalancer.get_player_score(player)
+
+        # 워커가 제한 시간 안에 스스로 탐색을 끝내도록 마감 시각 전달
+        deadline = time.time() + timeout * 0.8
+        team1_indices = await self.run(
+            _balance_worker,
+            serialize_roster(players),
+            list(together or []),
+            list(apart or []),
+            {
+                player_id: tuple(scores) for player_id, scores in performances.items()
+            } if performances is not None else None,
+            deadline,
+            timeout=timeout
+        )
+
+        team1_set = set(team1_indices)
+        team1 = [players[i] for i in team1_indices]
+        team2 = [player for i, player in enumerate(players) if i not in team1_set]
+        return team1, team2
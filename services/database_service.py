@@ -3,9 +3,16 @@ from mysql.connector import pooling, Error as MySQLError
 import os
 from typing import Dict, Optional, Tuple, List
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 import asyncio
 from utils.logging_config import setup_logger
+from services.team_balancer import TeamBalancer, BALANCE_SCORE_VERSION
+from services.refresh_scheduler import (
+    refresh_interval,
+    PLAY_RATE_WINDOW_DAYS,
+    FAILURE_BACKOFF_BASE,
+    MAX_REFRESH_INTERVAL
+)
 
 class DatabaseService:
     def __init__(self):
@@ -23,7 +30,7 @@ class DatabaseService:
         
 
         # 로깅 설정
-        self.logger = setup_logger('database_service', 'database.log')
+        self.logger = setup_logger(__name__, 'database.log')
 
         # 커넥션 풀 생성
         self._create_pool()
@@ -165,6 +172,67 @@ class DatabaseService:
             if 'conn' in locals():
                 conn.close()
 
+    async def register_users(
+        self,
+        guild_id: int,
+        users: List[Dict]
+    ) -> Tuple[Dict[Tuple[str, str], int], Optional[str]]:
+        """여러 사용자를 한 트랜잭션으로 등록 (초기 통계는 0)
+
+        users 는 nickname, tag, summoner_id, puuid, account_id 를 가진 목록이며,
+        이미 등록된 (닉네임, 태그)는 건너뜁니다.
+
+        Returns:
+            ((닉네임, 태그) → 새 user_id, 오류 메시지)
+        """
+        if not users:
+            return {}, None
+
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+
+            conn.start_transaction()
+
+            try:
+                sql = """
+                INSERT IGNORE INTO users (guild_id, nickname, tag, summoner_id, puuid, account_id)
+                VALUES (%s, %s, %s, %s, %s, %s)
+                """
+                user_ids: Dict[Tuple[str, str], int] = {}
+                for user in users:
+                    cursor.execute(sql, (
+                        guild_id,
+                        user['nickname'],
+                        user['tag'],
+                        user['summoner_id'],
+                        user['puuid'],
+                        user['account_id']
+                    ))
+                    if cursor.rowcount:
+                        user_ids[(user['nickname'], user['tag'])] = cursor.lastrowid
+
+                if user_ids:
+                    sql = "INSERT INTO user_stats (user_id) VALUES (%s)"
+                    cursor.executemany(sql, [(user_id,) for user_id in user_ids.values()])
+
+                conn.commit()
+                return user_ids, None
+
+            except Exception as e:
+                conn.rollback()
+                raise e
+
+        except Exception as e:
+            self.logger.error(f"사용자 일괄 등록 중 오류 발생: {str(e)}")
+            return {}, str(e)
+
+        finally:
+            if 'cursor' in locals():
+                cursor.close()
+            if 'conn' in locals():
+                conn.close()
+
     async def get_user(
         self, 
         guild_id: int, 
@@ -301,6 +369,68 @@ class DatabaseService:
             if 'conn' in locals():
                 conn.close()
 
+    async def get_users_page(
+        self,
+        guild_id: int,
+        limit: int,
+        after: Optional[Tuple[str, str]] = None
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """길드 유저를 (닉네임, 태그) 순서로 limit 명 조회 (키셋 페이지네이션)
+
+        after 가 주어지면 그 (닉네임, 태그) 다음 유저부터 조회하므로
+        OFFSET 없이 (guild_id, nickname, tag) 인덱스만으로 페이지를 가져옵니다.
+        """
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor(dictionary=True)
+
+            sql = """
+            SELECT 
+                u.nickname,
+                u.tag,
+                s.*
+            FROM users u
+            JOIN user_stats s ON u.id = s.user_id
+            WHERE u.guild_id = %s
+            """
+            params: Tuple = (guild_id,)
+            if after:
+                sql += " AND (u.nickname, u.tag) > (%s, %s)"
+                params += tuple(after)
+            sql += " ORDER BY u.nickname, u.tag LIMIT %s"
+
+            cursor.execute(sql, params + (limit,))
+            return cursor.fetchall(), None
+
+        except Exception as e:
+            self.logger.error(f"사용자 페이지 조회 중 오류 발생: {str(e)}")
+            return [], str(e)
+
+        finally:
+            if 'cursor' in locals():
+                cursor.close()
+            if 'conn' in locals():
+                conn.close()
+
+    async def count_users(self, guild_id: int) -> Tuple[int, Optional[str]]:
+        """길드에 등록된 사용자 수 조회"""
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+
+            cursor.execute("SELECT COUNT(*) FROM users WHERE guild_id = %s", (guild_id,))
+            return cursor.fetchone()[0], None
+
+        except Exception as e:
+            self.logger.error(f"사용자 수 조회 중 오류 발생: {str(e)}")
+            return 0, str(e)
+
+        finally:
+            if 'cursor' in locals():
+                cursor.close()
+            if 'conn' in locals():
+                conn.close()
+
     async def delete_user(
         self, 
         guild_id: int, 
@@ -563,6 +693,17 @@ class DatabaseService:
                 ((avg_cc_score / 10) * 0.1)  # CC 점수
             )
 
+            # 팀 밸런싱용 점수 계산 (집계 시점에 한 번만 계산하여 저장)
+            balance_score = TeamBalancer.calculate_player_score({
+                'games_played': stats[0],
+                'wins': stats[1] or 0,
+                'avg_kda': avg_kda,
+                'avg_damage_dealt': avg_damage,
+                'avg_damage_taken': to_float(stats[5]),
+                'avg_healing': avg_healing,
+                'avg_cc_score': avg_cc_score
+            })
+
             # user_stats 테이블 업데이트
             sql = """
             UPDATE user_stats 
@@ -575,7 +716,9 @@ class DatabaseService:
                 avg_damage_taken = %s,
                 avg_healing = %s,
                 avg_cc_score = %s,
-                performance_score = %s
+                performance_score = %s,
+                balance_score = %s,
+                balance_score_version = %s
             WHERE user_id = %s
             """
             
@@ -589,6 +732,8 @@ class DatabaseService:
                 stats[6],  # avg_healing
                 stats[7],  # avg_cc_score
                 performance_score,
+                balance_score,
+                BALANCE_SCORE_VERSION,
                 user_id
             ))
 
@@ -605,6 +750,790 @@ class DatabaseService:
             if 'conn' in locals():
                 conn.close()
 
+    async def get_refresh_targets(
+        self,
+        guild_ids: List[int],
+        due_only: bool = False,
+        limit: Optional[int] = None
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """전적 갱신 대상 유저 목록 조회 (여러 길드, PUUID 및 마지막 매치 시간 포함)
+
+        due_only 가 True 이면 갱신 예정 시각(refresh_state.next_refresh_at)이 지난 유저만,
+        예정 시각이 오래된 순서로 조회합니다.
+        """
+        if not guild_ids:
+            return [], None
+
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor(dictionary=True)
+
+            placeholders = ', '.join(['%s'] * len(guild_ids))
+            conditions = f"u.guild_id IN ({placeholders})"
+            order_by = "u.guild_id, u.nickname"
+            if due_only:
+                conditions += " AND (rs.next_refresh_at IS NULL OR rs.next_refresh_at <= NOW())"
+                order_by = "rs.next_refresh_at IS NOT NULL, rs.next_refresh_at"
+            params = list(guild_ids)
+            limit_clause = ""
+            if limit is not None:
+                limit_clause = "LIMIT %s"
+                params.append(limit)
+
+            sql = f"""
+            SELECT 
+                u.id AS user_id,
+                u.guild_id,
+                u.nickname,
+                u.tag,
+                u.puuid,
+                lu.last_match_time,
+                s.games_played,
+                s.wins,
+                s.losses,
+                s.avg_kda,
+                s.performance_score,
+                s.balance_score,
+                rs.play_rate,
+                rs.last_refreshed_at,
+                rs.next_refresh_at
+            FROM users u
+            JOIN user_stats s ON u.id = s.user_id
+            LEFT JOIN last_updates lu ON u.id = lu.user_id
+            LEFT JOIN refresh_state rs ON u.id = rs.user_id
+            WHERE {conditions}
+            ORDER BY {order_by}
+            {limit_clause}
+            """
+
+            cursor.execute(sql, tuple(params))
+            return cursor.fetchall(), None
+
+        except Exception as e:
+            self.logger.error(f"갱신 대상 조회 중 오류 발생: {str(e)}")
+            return [], str(e)
+
+        finally:
+            if 'cursor' in locals():
+                cursor.close()
+            if 'conn' in locals():
+                conn.close()
+
+    async def record_refresh(self, user_ids: List[int]) -> Tuple[bool, Optional[str]]:
+        """갱신 완료 기록 및 최근 플레이 빈도에 따른 다음 갱신 시각 설정"""
+        if not user_ids:
+            return True, None
+
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+
+            # 최근 기간의 게임 수로 하루 평균 플레이 빈도 계산 (game_creation 은 밀리초)
+            since = int((datetime.now() - timedelta(days=PLAY_RATE_WINDOW_DAYS)).timestamp() * 1000)
+            placeholders = ', '.join(['%s'] * len(user_ids))
+            sql = f"""
+            SELECT user_id, COUNT(*)
+            FROM game_records
+            WHERE user_id IN ({placeholders}) AND game_creation >= %s
+            GROUP BY user_id
+            """
+            cursor.execute(sql, (*user_ids, since))
+            counts = dict(cursor.fetchall())
+
+            rows = []
+            for user_id in user_ids:
+                play_rate = counts.get(user_id, 0) / PLAY_RATE_WINDOW_DAYS
+                interval = int(refresh_interval(play_rate).total_seconds())
+                rows.append((user_id, interval, play_rate))
+
+            sql = """
+            INSERT INTO refresh_state (user_id, last_refreshed_at, next_refresh_at, play_rate, failure_count)
+            VALUES (%s, NOW(), DATE_ADD(NOW(), INTERVAL %s SECOND), %s, 0)
+            ON DUPLICATE KEY UPDATE
+                last_refreshed_at = VALUES(last_refreshed_at),
+                next_refresh_at = VALUES(next_refresh_at),
+                play_rate = VALUES(play_rate),
+                failure_count = 0
+            """
+            cursor.executemany(sql, rows)
+            conn.commit()
+
+            return True, None
+
+        except Exception as e:
+            self.logger.error(f"갱신 기록 저장 중 오류 발생: {str(e)}")
+            return False, str(e)
+
+        finally:
+            if 'cursor' in locals():
+                cursor.close()
+            if 'conn' in locals():
+                conn.close()
+
+    async def record_refresh_failures(self, user_ids: List[int]) -> Tuple[bool, Optional[str]]:
+        """갱신 실패 기록 및 연속 실패 횟수에 따라 늘어나는 다음 재시도 시각 설정
+
+        실패한 유저가 갱신 예정 시각이 지난 채로 남아 매 주기 맨 앞에서 다시
+        선택되지 않도록, 재시도 간격을 FAILURE_BACKOFF_BASE 부터 실패마다 두 배로
+        늘립니다 (최대 MAX_REFRESH_INTERVAL). 갱신에 성공하면 record_refresh 가 초기화합니다.
+        """
+        if not user_ids:
+            return True, None
+
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+
+            base = int(FAILURE_BACKOFF_BASE.total_seconds())
+            cap = int(MAX_REFRESH_INTERVAL.total_seconds())
+            # next_refresh_at 은 증가 전의 failure_count 로 계산 (첫 실패는 base)
+            sql = """
+            INSERT INTO refresh_state (user_id, next_refresh_at, failure_count)
+            VALUES (%s, DATE_ADD(NOW(), INTERVAL %s SECOND), 1)
+            ON DUPLICATE KEY UPDATE
+                next_refresh_at = DATE_ADD(NOW(), INTERVAL LEAST(%s * POW(2, failure_count), %s) SECOND),
+                failure_count = failure_count + 1
+            """
+            cursor.executemany(sql, [(user_id, base, base, cap) for user_id in user_ids])
+            conn.commit()
+
+            return True, None
+
+        except Exception as e:
+            self.logger.error(f"갱신 실패 기록 저장 중 오류 발생: {str(e)}")
+            return False, str(e)
+
+        finally:
+            if 'cursor' in locals():
+                cursor.close()
+            if 'conn' in locals():
+                conn.close()
+
+    async def start_stats_run(self, guild_id: int, run_date) -> Tuple[Optional[Dict], Optional[str]]:
+        """길드의 일일 갱신 실행 기록 생성 (같은 날짜의 기록이 있으면 그대로 반환)
+
+        같은 길드의 이전 날짜 실행 중 끝나지 않은 것은 중단(abandoned) 처리합니다.
+        """
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor(dictionary=True)
+
+            cursor.execute(
+                """
+                UPDATE stats_update_runs
+                SET status = 'abandoned', finished_at = NOW()
+                WHERE guild_id = %s AND status = 'running' AND run_date < %s
+                """,
+                (guild_id, run_date)
+            )
+            cursor.execute(
+                "INSERT IGNORE INTO stats_update_runs (guild_id, run_date) VALUES (%s, %s)",
+                (guild_id, run_date)
+            )
+            conn.commit()
+
+            cursor.execute(
+                "SELECT * FROM stats_update_runs WHERE guild_id = %s AND run_date = %s",
+                (guild_id, run_date)
+            )
+            return cursor.fetchone(), None
+
+        except Exception as e:
+            self.logger.error(f"갱신 실행 기록 생성 중 오류 발생: {str(e)}")
+            return None, str(e)
+
+        finally:
+            if 'cursor' in locals():
+                cursor.close()
+            if 'conn' in locals():
+                conn.close()
+
+    async def get_latest_stats_runs(self, guild_ids: List[int]) -> Tuple[Dict[int, Dict], Optional[str]]:
+        """길드별 가장 최근 일일 갱신 실행 기록 조회 (guild_id → 실행 기록)"""
+        if not guild_ids:
+            return {}, None
+
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor(dictionary=True)
+
+            placeholders = ', '.join(['%s'] * len(guild_ids))
+            sql = f"""
+            SELECT r.*
+            FROM stats_update_runs r
+            JOIN (
+                SELECT guild_id, MAX(run_date) AS run_date
+                FROM stats_update_runs
+                WHERE guild_id IN ({placeholders})
+                GROUP BY guild_id
+            ) latest ON r.guild_id = latest.guild_id AND r.run_date = latest.run_date
+            """
+            cursor.execute(sql, tuple(guild_ids))
+            return {row['guild_id']: row for row in cursor.fetchall()}, None
+
+        except Exception as e:
+            self.logger.error(f"갱신 실행 기록 조회 중 오류 발생: {str(e)}")
+            return {}, str(e)
+
+        finally:
+            if 'cursor' in locals():
+                cursor.close()
+            if 'conn' in locals():
+                conn.close()
+
+    async def get_stats_run_progress(self, run_id: int) -> Tuple[Dict[int, str], Optional[str]]:
+        """실행의 유저별 처리 상태 조회 (user_id → status)"""
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+
+            cursor.execute(
+                "SELECT user_id, status FROM stats_update_progress WHERE run_id = %s",
+                (run_id,)
+            )
+            return dict(cursor.fetchall()), None
+
+        except Exception as e:
+            self.logger.error(f"갱신 진행 상태 조회 중 오류 발생: {str(e)}")
+            return {}, str(e)
+
+        finally:
+            if 'cursor' in locals():
+                cursor.close()
+            if 'conn' in locals():
+                conn.close()
+
+    async def save_stats_run_progress(
+        self,
+        run_id: int,
+        entries: List[Tuple[int, str, Optional[str]]]
+    ) -> Tuple[bool, Optional[str]]:
+        """유저별 처리 결과 저장 (entries: (user_id, status, error) 목록)"""
+        if not entries:
+            return True, None
+
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+
+            sql = """
+            INSERT INTO stats_update_progress (run_id, user_id, status, error)
+            VALUES (%s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE
+                status = VALUES(status),
+                error = VALUES(error)
+            """
+            cursor.executemany(sql, [
+                (run_id, user_id, status, error[:255] if error else None)
+                for user_id, status, error in entries
+            ])
+            conn.commit()
+
+            return True, None
+
+        except Exception as e:
+            self.logger.error(f"갱신 진행 상태 저장 중 오류 발생: {str(e)}")
+            return False, str(e)
+
+        finally:
+            if 'cursor' in locals():
+                cursor.close()
+            if 'conn' in locals():
+                conn.close()
+
+    async def update_stats_run(
+        self,
+        run_id: int,
+        total_users: Optional[int] = None,
+        status: Optional[str] = None
+    ) -> Tuple[bool, Optional[str]]:
+        """실행 기록의 전체 유저 수, 처리된 유저 수, 상태 갱신"""
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+
+            updates = [
+                "done_users = (SELECT COUNT(*) FROM stats_update_progress p "
+                "WHERE p.run_id = %s AND p.status IN ('done', 'skipped'))"
+            ]
+            values = [run_id]
+
+            if total_users is not None:
+                updates.append("total_users = %s")
+                values.append(total_users)
+
+            if status is not None:
+                updates.append("status = %s")
+                values.append(status)
+                if status != 'running':
+                    updates.append("finished_at = NOW()")
+
+            sql = f"""
+            UPDATE stats_update_runs
+            SET {', '.join(updates)}
+            WHERE id = %s
+            """
+            values.append(run_id)
+            cursor.execute(sql, values)
+            conn.commit()
+
+            return True, None
+
+        except Exception as e:
+            self.logger.error(f"갱신 실행 기록 업데이트 중 오류 발생: {str(e)}")
+            return False, str(e)
+
+        finally:
+            if 'cursor' in locals():
+                cursor.close()
+            if 'conn' in locals():
+                conn.close()
+
+    async def enqueue_refresh_jobs(
+        self,
+        user_ids: List[int],
+        priority: int
+    ) -> Tuple[int, Optional[str]]:
+        """전적 갱신 작업 등록 (같은 유저·우선순위의 대기/진행 중 작업이 있으면 그대로 둠)
+
+        끝난(done) 작업 행은 대기 상태로 되돌려 재사용합니다. 실패(failed)한 작업은
+        마지막 실패 후 FAILURE_BACKOFF_BASE 가 지나야 시도 횟수를 초기화해 다시 대기시키고,
+        그 전에는 시도 횟수와 상태를 그대로 둡니다.
+        """
+        if not user_ids:
+            return 0, None
+
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+
+            # 다시 대기시킬 행: 끝난 작업, 또는 재시도 대기 시간이 지난 실패 작업
+            # status 는 앞의 조건들이 이전 값을 참조하도록 마지막에 변경
+            reusable = (
+                "(status = 'done' OR "
+                "(status = 'failed' AND updated_at <= DATE_SUB(NOW(), INTERVAL %s SECOND)))"
+            )
+            sql = f"""
+            INSERT INTO refresh_jobs (user_id, priority)
+            VALUES (%s, %s)
+            ON DUPLICATE KEY UPDATE
+                attempts = IF({reusable}, 0, attempts),
+                error = IF({reusable}, NULL, error),
+                available_at = IF({reusable}, NOW(), available_at),
+                status = IF({reusable}, 'pending', status)
+            """
+            backoff = int(FAILURE_BACKOFF_BASE.total_seconds())
+            cursor.executemany(sql, [(user_id, priority, *([backoff] * 4)) for user_id in user_ids])
+            conn.commit()
+
+            return len(user_ids), None
+
+        except Exception as e:
+            self.logger.error(f"갱신 작업 등록 중 오류 발생: {str(e)}")
+            return 0, str(e)
+
+        finally:
+            if 'cursor' in locals():
+                cursor.close()
+            if 'conn' in locals():
+                conn.close()
+
+    async def claim_refresh_jobs(
+        self,
+        worker_id: str,
+        limit: int,
+        lease_seconds: int,
+        shards: Optional[Tuple[int, List[int]]] = None
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """처리할 갱신 작업을 임대하여 갱신 대상 정보와 함께 반환
+
+        SKIP LOCKED 로 다른 워커가 잠근 행은 건너뛰므로 여러 워커가 동시에
+        호출해도 같은 작업을 가져가지 않습니다. 임대 시간이 지난 진행 중 작업은
+        워커가 중단된 것으로 보고 다시 가져갑니다.
+        shards(전체 샤드 수, 샤드 번호 목록)가 주어지면 해당 샤드에 속한 길드의 작업만 가져옵니다.
+        결과 행은 get_refresh_targets 와 같은 컬럼에 job_id 가 추가된 형태입니다.
+        """
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor(dictionary=True)
+
+            conn.start_transaction()
+
+            try:
+                shard_filter = ""
+                params: List = []
+                if shards is not None:
+                    # Discord 와 같은 방식으로 길드의 샤드 번호 계산
+                    shard_count, shard_ids = shards
+                    shard_filter = f"""
+                    AND MOD(u.guild_id >> 22, %s) IN ({', '.join(['%s'] * len(shard_ids))})
+                    """
+                    params = [shard_count, *shard_ids]
+
+                sql = f"""
+                SELECT j.id
+                FROM refresh_jobs j
+                JOIN users u ON j.user_id = u.id
+                WHERE ((j.status = 'pending' AND j.available_at <= NOW())
+                   OR (j.status = 'running' AND j.lease_expires_at < NOW()))
+                   {shard_filter}
+                ORDER BY j.priority DESC, j.available_at
+                LIMIT %s
+                FOR UPDATE OF j SKIP LOCKED
+                """
+                cursor.execute(sql, (*params, limit))
+                job_ids = [row['id'] for row in cursor.fetchall()]
+
+                if job_ids:
+                    placeholders = ', '.join(['%s'] * len(job_ids))
+                    sql = f"""
+                    UPDATE refresh_jobs
+                    SET status = 'running',
+                        worker_id = %s,
+                        lease_expires_at = DATE_ADD(NOW(), INTERVAL %s SECOND),
+                        attempts = attempts + 1
+                    WHERE id IN ({placeholders})
+                    """
+                    cursor.execute(sql, (worker_id, lease_seconds, *job_ids))
+
+                conn.commit()
+
+            except Exception as e:
+                conn.rollback()
+                raise e
+
+            if not job_ids:
+                return [], None
+
+            sql = f"""
+            SELECT 
+                j.id AS job_id,
+                u.id AS user_id,
+                u.guild_id,
+                u.nickname,
+                u.tag,
+                u.puuid,
+                lu.last_match_time,
+                s.games_played,
+                s.wins,
+                s.losses,
+                s.avg_kda,
+                s.performance_score,
+                s.balance_score,
+                rs.play_rate,
+                rs.last_refreshed_at,
+                rs.next_refresh_at
+            FROM refresh_jobs j
+            JOIN users u ON j.user_id = u.id
+            JOIN user_stats s ON u.id = s.user_id
+            LEFT JOIN last_updates lu ON u.id = lu.user_id
+            LEFT JOIN refresh_state rs ON u.id = rs.user_id
+            WHERE j.id IN ({placeholders})
+            ORDER BY j.priority DESC, j.available_at
+            """
+            cursor.execute(sql, tuple(job_ids))
+            return cursor.fetchall(), None
+
+        except Exception as e:
+            self.logger.error(f"갱신 작업 임대 중 오류 발생: {str(e)}")
+            return [], str(e)
+
+        finally:
+            if 'cursor' in locals():
+                cursor.close()
+            if 'conn' in locals():
+                conn.close()
+
+    async def extend_refresh_leases(
+        self,
+        worker_id: str,
+        job_ids: List[int],
+        lease_seconds: int
+    ) -> Tuple[bool, Optional[str]]:
+        """처리 중인 작업의 임대 시간 연장 (아직 이 워커가 가진 작업만)"""
+        if not job_ids:
+            return True, None
+
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+
+            placeholders = ', '.join(['%s'] * len(job_ids))
+            sql = f"""
+            UPDATE refresh_jobs
+            SET lease_expires_at = DATE_ADD(NOW(), INTERVAL %s SECOND)
+            WHERE id IN ({placeholders}) AND status = 'running' AND worker_id = %s
+            """
+            cursor.execute(sql, (lease_seconds, *job_ids, worker_id))
+            conn.commit()
+
+            return True, None
+
+        except Exception as e:
+            self.logger.error(f"갱신 작업 임대 연장 중 오류 발생: {str(e)}")
+            return False, str(e)
+
+        finally:
+            if 'cursor' in locals():
+                cursor.close()
+            if 'conn' in locals():
+                conn.close()
+
+    async def finish_refresh_job(
+        self,
+        worker_id: str,
+        job_id: int,
+        error: Optional[str] = None,
+        max_attempts: int = 3,
+        retry_delay_seconds: int = 60
+    ) -> Tuple[bool, Optional[str]]:
+        """작업 결과 기록
+
+        성공하면 done, 실패하면 시도 횟수가 남아 있는 경우 지연 후 재시도하도록
+        pending 으로, 아니면 failed 로 변경합니다. 임대가 만료되어 다른 워커가
+        가져간 작업은 변경하지 않습니다.
+        """
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+
+            if error is None:
+                sql = """
+                UPDATE refresh_jobs
+                SET status = 'done', error = NULL, lease_expires_at = NULL
+                WHERE id = %s AND status = 'running' AND worker_id = %s
+                """
+                cursor.execute(sql, (job_id, worker_id))
+            else:
+                # 재시도 간격은 시도 횟수에 비례하여 증가
+                sql = """
+                UPDATE refresh_jobs
+                SET error = %s,
+                    lease_expires_at = NULL,
+                    available_at = DATE_ADD(NOW(), INTERVAL %s * attempts SECOND),
+                    status = IF(attempts >= %s, 'failed', 'pending')
+                WHERE id = %s AND status = 'running' AND worker_id = %s
+                """
+                cursor.execute(sql, (error[:255], retry_delay_seconds, max_attempts, job_id, worker_id))
+            conn.commit()
+
+            return True, None
+
+        except Exception as e:
+            self.logger.error(f"갱신 작업 결과 기록 중 오류 발생: {str(e)}")
+            return False, str(e)
+
+        finally:
+            if 'cursor' in locals():
+                cursor.close()
+            if 'conn' in locals():
+                conn.close()
+
+    async def release_refresh_job(
+        self,
+        worker_id: str,
+        job_id: int,
+        delay_seconds: int
+    ) -> Tuple[bool, Optional[str]]:
+        """처리하지 못한 작업을 시도 횟수에 포함하지 않고 지연 후 다시 대기 상태로 변경"""
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+
+            sql = """
+            UPDATE refresh_jobs
+            SET status = 'pending',
+                attempts = GREATEST(attempts - 1, 0),
+                lease_expires_at = NULL,
+                available_at = DATE_ADD(NOW(), INTERVAL %s SECOND)
+            WHERE id = %s AND status = 'running' AND worker_id = %s
+            """
+            cursor.execute(sql, (delay_seconds, job_id, worker_id))
+            conn.commit()
+
+            return True, None
+
+        except Exception as e:
+            self.logger.error(f"갱신 작업 반환 중 오류 발생: {str(e)}")
+            return False, str(e)
+
+        finally:
+            if 'cursor' in locals():
+                cursor.close()
+            if 'conn' in locals():
+                conn.close()
+
+    async def get_refresh_jobs(
+        self,
+        user_ids: List[int],
+        priority: int
+    ) -> Tuple[Dict[int, Dict], Optional[str]]:
+        """유저별 해당 우선순위 갱신 작업의 상태 조회 (작업이 없는 유저는 제외)"""
+        if not user_ids:
+            return {}, None
+
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor(dictionary=True)
+
+            placeholders = ', '.join(['%s'] * len(user_ids))
+            sql = f"""
+            SELECT user_id, status, attempts, error, created_at, updated_at
+            FROM refresh_jobs
+            WHERE user_id IN ({placeholders}) AND priority = %s
+            """
+            cursor.execute(sql, (*user_ids, priority))
+
+            return {row['user_id']: row for row in cursor.fetchall()}, None
+
+        except Exception as e:
+            self.logger.error(f"갱신 작업 상태 조회 중 오류 발생: {str(e)}")
+            return {}, str(e)
+
+        finally:
+            if 'cursor' in locals():
+                cursor.close()
+            if 'conn' in locals():
+                conn.close()
+
+    async def get_recent_match_records(
+        self,
+        user_ids: List[int],
+        limit_per_user: int
+    ) -> Tuple[Dict[int, List[Dict]], Optional[str]]:
+        """유저별 최근 게임 기록 조회 (승률 시뮬레이션용)"""
+        if not user_ids:
+            return {}, None
+
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor(dictionary=True)
+
+            placeholders = ', '.join(['%s'] * len(user_ids))
+            sql = f"""
+            SELECT 
+                user_id, win, kills, deaths, assists,
+                total_damage_dealt, total_damage_taken, total_heal, total_cc_score
+            FROM (
+                SELECT 
+                    gr.*,
+                    ROW_NUMBER() OVER (PARTITION BY user_id ORDER BY game_creation DESC) AS rn
+                FROM game_records gr
+                WHERE user_id IN ({placeholders})
+            ) ranked
+            WHERE rn <= %s
+            """
+
+            cursor.execute(sql, (*user_ids, limit_per_user))
+
+            records: Dict[int, List[Dict]] = {user_id: [] for user_id in user_ids}
+            for row in cursor.fetchall():
+                records[row['user_id']].append(row)
+
+            return records, None
+
+        except Exception as e:
+            self.logger.error(f"최근 게임 기록 조회 중 오류 발생: {str(e)}")
+            return {}, str(e)
+
+        finally:
+            if 'cursor' in locals():
+                cursor.close()
+            if 'conn' in locals():
+                conn.close()
+
+    async def get_recent_play_counts(
+        self,
+        user_ids: List[int],
+        since: int
+    ) -> Tuple[Dict[int, int], Optional[str]]:
+        """유저별 since(Unix timestamp, ms) 이후 게임 수 조회"""
+        if not user_ids:
+            return {}, None
+
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor(dictionary=True)
+
+            placeholders = ', '.join(['%s'] * len(user_ids))
+            sql = f"""
+            SELECT user_id, COUNT(*) AS games
+            FROM game_records
+            WHERE user_id IN ({placeholders}) AND game_creation >= %s
+            GROUP BY user_id
+            """
+
+            cursor.execute(sql, (*user_ids, since))
+
+            counts: Dict[int, int] = {user_id: 0 for user_id in user_ids}
+            for row in cursor.fetchall():
+                counts[row['user_id']] = row['games']
+
+            return counts, None
+
+        except Exception as e:
+            self.logger.error(f"최근 게임 수 조회 중 오류 발생: {str(e)}")
+            return {}, str(e)
+
+        finally:
+            if 'cursor' in locals():
+                cursor.close()
+            if 'conn' in locals():
+                conn.close()
+
+    async def recompute_balance_scores(self, batch_size: int = 500) -> Tuple[int, Optional[str]]:
+        """공식 버전이 다른 모든 유저의 밸런스 점수 일괄 재계산"""
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor(dictionary=True)
+            update_cursor = conn.cursor()
+
+            sql = """
+            SELECT 
+                user_id, games_played, wins, avg_kda,
+                avg_damage_dealt, avg_damage_taken, avg_healing, avg_cc_score
+            FROM user_stats
+            WHERE balance_score_version IS NULL OR balance_score_version <> %s
+            """
+            cursor.execute(sql, (BALANCE_SCORE_VERSION,))
+            rows = cursor.fetchall()
+
+            update_sql = """
+            UPDATE user_stats
+            SET balance_score = %s, balance_score_version = %s
+            WHERE user_id = %s
+            """
+
+            # 배치 단위로 갱신하여 트랜잭션 크기 제한
+            for start in range(0, len(rows), batch_size):
+                batch = rows[start:start + batch_size]
+                update_cursor.executemany(update_sql, [
+                    (
+                        TeamBalancer.calculate_player_score({
+                            **row,
+                            'avg_cc_score': row['avg_cc_score'] or 0
+                        }),
+                        BALANCE_SCORE_VERSION,
+                        row['user_id']
+                    )
+                    for row in batch
+                ])
+                conn.commit()
+
+            return len(rows), None
+
+        except Exception as e:
+            self.logger.error(f"밸런스 점수 재계산 중 오류 발생: {str(e)}")
+            return 0, str(e)
+
+        finally:
+            if 'update_cursor' in locals():
+                update_cursor.close()
+            if 'cursor' in locals():
+                cursor.close()
+            if 'conn' in locals():
+                conn.close()
+
     async def get_guild_settings(self, guild_id: int) -> Tuple[Optional[Dict], Optional[str]]:
         """길드의 설정 정보 조회"""
         try:
@@ -635,6 +1564,124 @@ class DatabaseService:
             if 'conn' in locals():
                 conn.close()
 
+    async def get_guild_api_shares(
+        self,
+        guild_ids: List[int]
+    ) -> Tuple[Dict[int, Tuple[float, Optional[int]]], Optional[str]]:
+        """길드별 API 호출 배분 설정 조회 (guild_id → (가중치, 2분당 최대 호출 수))"""
+        if not guild_ids:
+            return {}, None
+
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+
+            placeholders = ', '.join(['%s'] * len(guild_ids))
+            sql = f"""
+            SELECT guild_id, api_weight, api_quota
+            FROM guilds
+            WHERE guild_id IN ({placeholders})
+            """
+            cursor.execute(sql, tuple(guild_ids))
+            return {
+                guild_id: (float(weight), quota)
+                for guild_id, weight, quota in cursor.fetchall()
+            }, None
+
+        except Exception as e:
+            self.logger.error(f"길드 API 배분 설정 조회 중 오류 발생: {str(e)}")
+            return {}, str(e)
+
+        finally:
+            if 'cursor' in locals():
+                cursor.close()
+            if 'conn' in locals():
+                conn.close()
+
+    async def get_guild_refresh_settings(
+        self,
+        guild_ids: Optional[List[int]] = None
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """길드별 갱신 시간 설정, 유저 수, 이전 일일 갱신 소요 시간(초) 조회
+
+        guild_ids 가 None 이면 등록된 모든 길드(다른 샤드 프로세스의 길드 포함)를 조회합니다.
+        """
+        if guild_ids is not None and not guild_ids:
+            return [], None
+
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor(dictionary=True)
+
+            where = ""
+            if guild_ids is not None:
+                where = f"WHERE g.guild_id IN ({', '.join(['%s'] * len(guild_ids))})"
+            sql = f"""
+            SELECT 
+                g.guild_id,
+                g.refresh_timezone,
+                g.refresh_window_start,
+                (SELECT COUNT(*) FROM users u WHERE u.guild_id = g.guild_id) AS user_count,
+                (
+                    SELECT TIMESTAMPDIFF(SECOND, r.started_at, r.finished_at)
+                    FROM stats_update_runs r
+                    WHERE r.guild_id = g.guild_id AND r.status = 'completed'
+                    ORDER BY r.run_date DESC
+                    LIMIT 1
+                ) AS last_duration
+            FROM guilds g
+            {where}
+            """
+            cursor.execute(sql, tuple(guild_ids or ()))
+            settings = cursor.fetchall()
+
+            # TIME 컬럼은 timedelta 로 반환되므로 시각으로 변환
+            for row in settings:
+                if row['refresh_window_start'] is not None:
+                    row['refresh_window_start'] = (datetime.min + row['refresh_window_start']).time()
+            return settings, None
+
+        except Exception as e:
+            self.logger.error(f"길드 갱신 시간 설정 조회 중 오류 발생: {str(e)}")
+            return [], str(e)
+
+        finally:
+            if 'cursor' in locals():
+                cursor.close()
+            if 'conn' in locals():
+                conn.close()
+
+    async def update_guild_refresh_window(
+        self,
+        guild_id: int,
+        refresh_timezone: str,
+        refresh_window_start
+    ) -> Tuple[bool, Optional[str]]:
+        """길드의 갱신 시간대와 시작 시각 설정 (시작 시각이 None 이면 자동 배치)"""
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+
+            sql = """
+            UPDATE guilds
+            SET refresh_timezone = %s, refresh_window_start = %s
+            WHERE guild_id = %s
+            """
+            cursor.execute(sql, (refresh_timezone, refresh_window_start, guild_id))
+            conn.commit()
+
+            return True, None
+
+        except Exception as e:
+            self.logger.error(f"길드 갱신 시간 설정 중 오류 발생: {str(e)}")
+            return False, str(e)
+
+        finally:
+            if 'cursor' in locals():
+                cursor.close()
+            if 'conn' in locals():
+                conn.close()
+
     async def update_guild_settings(
         self, 
         guild_id: int, 
@@ -0,0 +1,156 @@
+"""
+전적 갱신 비용 예측 (dry-run)
+
+Riot API 를 호출하지 않고 DB 에 저장된 마지막 매치 시간, 플레이 빈도, 갱신 기록과
+현재 Rate Limiter 상태만으로 길드별 API 호출 수, DB 쓰기 수, 소요 시간을 추정합니다.
+일일 갱신과 같은 규칙(계정 단위 중복 제거, 최근 갱신 유저 제외)을 적용합니다.
+
+사용법:
+    python -m services.refresh_estimator --guild <길드 ID> [--guild <길드 ID> ...]
+"""
+import argparse
+import asyncio
+import sys
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from services.refresh_scheduler import (
+    BASE_REQUEST_COST,
+    DEFAULT_PLAY_RATE,
+    MAX_MATCHES_PER_REFRESH,
+    expected_new_games
+)
+from utils.constants import (
+    RIOT_REQUESTS_PER_SECOND,
+    RIOT_REQUESTS_PER_TWO_MINUTES,
+    STATS_UPDATE_SKIP_RECENT_HOURS
+)
+from utils.progress_reporter import format_duration
+
+# 게임 한 판을 저장할 때의 DB 쓰기 수 (game_records, last_updates)
+WRITES_PER_GAME = 2
+
+# 유저 한 명을 갱신할 때 게임 수와 무관한 DB 쓰기 수 (user_stats, refresh_state)
+WRITES_PER_USER = 2
+
+
+def estimated_new_games(target: Dict, now: datetime) -> float:
+    """마지막 갱신 이후 새 게임 수 추정
+
+    갱신 기록이 없는 유저는 마지막으로 저장된 매치(last_updates) 이후 기간으로 추정합니다.
+    """
+    if target.get('last_refreshed_at') is None and target.get('last_match_time'):
+        play_rate = target.get('play_rate')
+        if play_rate is None:
+            play_rate = DEFAULT_PLAY_RATE
+        last_match = datetime.fromtimestamp(target['last_match_time'] / 1000)
+        elapsed_days = max(0.0, (now - last_match) / timedelta(days=1))
+        return min(MAX_MATCHES_PER_REFRESH, play_rate * elapsed_days)
+    return expected_new_games(target, now)
+
+
+def estimate_wall_seconds(
+    api_calls: float,
+    requests_per_second: int,
+    requests_per_two_minutes: int,
+    available_now: Optional[int] = None
+) -> float:
+    """Rate Limiter 한도 기준 예상 소요 시간(초)
+
+    지금 바로 보낼 수 있는 요청(available_now)은 즉시 처리되고,
+    나머지는 두 제한 중 더 느린 지속 속도로 처리된다고 가정합니다.
+    """
+    sustained_rate = min(requests_per_second, requests_per_two_minutes / 120)
+    if available_now is None:
+        available_now = min(requests_per_second, requests_per_two_minutes)
+    return max(0.0, api_calls - available_now) / sustained_rate
+
+
+def estimate_refresh_cost(
+    targets: List[Dict],
+    requests_per_second: int,
+    requests_per_two_minutes: int,
+    available_now: Optional[int] = None,
+    now: Optional[datetime] = None,
+    skip_recent_hours: float = STATS_UPDATE_SKIP_RECENT_HOURS
+) -> Tuple[Dict[int, Dict], Dict]:
+    """길드별, 전체 갱신 비용 추정
+
+    Parameters:
+        targets: DatabaseService.get_refresh_targets 결과
+        requests_per_second, requests_per_two_minutes: Rate Limiter 한도
+        available_now: 지금 바로 보낼 수 있는 요청 수 (RateLimiter.available())
+        now: 기준 시각
+        skip_recent_hours: 이 시간 안에 갱신된 유저는 일일 갱신처럼 제외
+
+    Returns:
+        (guild_id → 비용, 전체 비용). 비용은 users, skipped, accounts, new_games,
+        api_calls, db_writes, wall_seconds 를 가지며, 길드별 wall_seconds 는
+        해당 길드만 갱신할 때의 소요 시간입니다. 여러 길드가 공유하는 계정의
+        API 호출은 갱신 때와 같이 첫 번째 길드에 계산합니다.
+    """
+    now = now or datetime.now()
+    recent_threshold = now - timedelta(hours=skip_recent_hours)
+
+    guilds: Dict[int, Dict] = {}
+    accounts: Dict[str, List[Dict]] = {}
+    for target in targets:
+        cost = guilds.setdefault(target['guild_id'], {
+            'users': 0, 'skipped': 0, 'accounts': 0,
+            'new_games': 0.0, 'api_calls': 0.0, 'db_writes': 0.0
+        })
+        cost['users'] += 1
+        if target.get('last_refreshed_at') and target['last_refreshed_at'] >= recent_threshold:
+            cost['skipped'] += 1
+            continue
+        accounts.setdefault(target['puuid'], []).append(target)
+
+    for rows in accounts.values():
+        games = {id(row): estimated_new_games(row, now) for row in rows}
+        owner = guilds[rows[0]['guild_id']]
+        owner['accounts'] += 1
+        # 계정은 가장 오래된 행 기준으로 한 번만 조회
+        owner['api_calls'] += BASE_REQUEST_COST + max(games.values())
+        for row in rows:
+            cost = guilds[row['guild_id']]
+            cost['new_games'] += games[id(row)]
+            cost['db_writes'] += WRITES_PER_GAME * games[id(row)] + WRITES_PER_USER
+
+    total = {key: sum(cost[key] for cost in guilds.values())
+             for key in ('users', 'skipped', 'accounts', 'new_games', 'api_calls', 'db_writes')}
+    for cost in list(guilds.values()) + [total]:
+        cost['wall_seconds'] = estimate_wall_seconds(
+            cost['api_calls'], requests_per_second, requests_per_two_minutes, available_now
+        )
+    return guilds, total
+
+
+async def estimate_guilds(guild_ids: List[int]) -> Tuple[Dict[int, Dict], Dict]:
+    """DB 의 갱신 대상으로 비용 추정 (새 프로세스이므로 Rate Limiter 는 비어 있다고 가정)
+
+    API 를 호출하지 않으므로 RIOT_API_KEY 없이도 실행할 수 있습니다.
+    """
+    from services.database_service import DatabaseService
+
+    targets, error = await DatabaseService().get_refresh_targets(guild_ids)
+    if error:
+        raise RuntimeError(error)
+    return estimate_refresh_cost(targets, RIOT_REQUESTS_PER_SECOND, RIOT_REQUESTS_PER_TWO_MINUTES)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="전적 갱신 비용 예측 (API 호출 없음)")
+    parser.add_argument('--guild', type=int, action='append', required=True, help="길드 ID (여러 번 지정 가능)")
+    args = parser.parse_args()
+
+    guilds, total = asyncio.run(estimate_guilds(args.guild))
+    print(f"{'길드':>20} {'유저':>6} {'제외':>6} {'계정':>6} {'API 호출':>9} {'DB 쓰기':>9} {'예상 시간':>12}")
+    for guild_id, cost in list(guilds.items()) + [('전체', total)]:
+        print(
+            f"{guild_id:>20} {cost['users']:>6} {cost['skipped']:>6} {cost['accounts']:>6} "
+            f"{cost['api_calls']:>9.0f} {cost['db_writes']:>9.0f} {format_duration(cost['wall_seconds']):>12}"
+        )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
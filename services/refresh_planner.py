@@ -0,0 +1,97 @@
+import math
+from datetime import datetime, time
+from typing import Dict, List, Optional, Tuple
+import pytz
+
+# 갱신 시간대가 지정되지 않은 길드의 기본 시간대와 희망 시작 시각 (현지 시간)
+DEFAULT_REFRESH_TIMEZONE = 'Asia/Seoul'
+DEFAULT_REFRESH_TIME = time(hour=6)
+
+# 이전 실행 기록이 없는 길드의 유저당 예상 갱신 시간(초)
+ESTIMATED_SECONDS_PER_USER = 3.0
+
+# 예상 소요 시간에 곱하는 여유 배율과 최소 구간 길이(분)
+WINDOW_MARGIN = 1.2
+MIN_WINDOW_MINUTES = 5
+
+# 갱신 구간을 배치하는 단위(분)
+SLOT_MINUTES = 5
+
+MINUTES_PER_DAY = 24 * 60
+
+
+def resolve_timezone(name: Optional[str]):
+    """시간대 이름을 pytz 시간대로 변환 (알 수 없는 이름이면 기본 시간대)"""
+    try:
+        return pytz.timezone(name or DEFAULT_REFRESH_TIMEZONE)
+    except pytz.UnknownTimeZoneError:
+        return pytz.timezone(DEFAULT_REFRESH_TIMEZONE)
+
+
+def estimate_window_minutes(guild: Dict) -> int:
+    """이전 실행 소요 시간(없으면 유저 수) 기준 갱신 구간 길이(분)"""
+    seconds = guild.get('last_duration')
+    if seconds is None:
+        seconds = (guild.get('user_count') or 0) * ESTIMATED_SECONDS_PER_USER
+    minutes = math.ceil(seconds * WINDOW_MARGIN / 60)
+    return min(MINUTES_PER_DAY, max(MIN_WINDOW_MINUTES, minutes))
+
+
+def _overlaps(start1: int, length1: int, start2: int, length2: int) -> bool:
+    """하루(원형) 위의 두 구간이 겹치는지 확인 (분 단위)"""
+    return (start2 - start1) % MINUTES_PER_DAY < length1 or (start1 - start2) % MINUTES_PER_DAY < length2
+
+
+def plan_refresh_windows(guilds: List[Dict], now: datetime) -> Dict[int, time]:
+    """길드별 갱신 시작 시각(현지 시간) 배치
+
+    관리자가 시각을 지정한 길드는 그대로 두고, 나머지 길드는 희망 시각
+    (현지 오전 6시) 이후에 다른 길드의 구간과 겹치지 않는 가장 이른 시각에 배치합니다.
+    모든 길드를 UTC 기준 하루 위에 놓고 비교하므로 시간대가 달라도 동시에 몰리지 않습니다.
+    빈 구간이 없으면 희망 시각을 그대로 사용합니다.
+
+    Parameters:
+        guilds: guild_id, refresh_timezone, refresh_window_start, user_count, last_duration 를 가진 목록
+        now: 시간대별 UTC 오프셋을 계산할 기준 시각 (timezone 포함)
+    """
+    placed: List[Tuple[int, int]] = []
+    windows: Dict[int, time] = {}
+    offsets: Dict[int, int] = {}
+    auto: List[Tuple[int, int, int]] = []
+
+    for guild in guilds:
+        tz = resolve_timezone(guild.get('refresh_timezone'))
+        offset = int(now.astimezone(tz).utcoffset().total_seconds() // 60)
+        offsets[guild['guild_id']] = offset
+        length = estimate_window_minutes(guild)
+
+        fixed = guild.get('refresh_window_start')
+        if fixed is not None:
+            placed.append(((fixed.hour * 60 + fixed.minute - offset) % MINUTES_PER_DAY, length))
+            windows[guild['guild_id']] = fixed
+        else:
+            preferred = (DEFAULT_REFRESH_TIME.hour * 60 + DEFAULT_REFRESH_TIME.minute - offset) % MINUTES_PER_DAY
+            auto.append((preferred, length, guild['guild_id']))
+
+    # 희망 시각 순서대로, 같으면 오래 걸리는 길드부터 배치
+    for preferred, length, guild_id in sorted(auto, key=lambda item: (item[0], -item[1], item[2])):
+        start = preferred
+        for _ in range(MINUTES_PER_DAY // SLOT_MINUTES):
+            conflict = next(
+                ((other_start, other_length) for other_start, other_length in placed
+                 if _overlaps(start, length, other_start, other_length)),
+                None
+            )
+            if conflict is None:
+                break
+            # 겹치는 구간이 끝난 뒤의 다음 배치 단위로 이동
+            end = conflict[0] + conflict[1]
+            start = math.ceil(end / SLOT_MINUTES) * SLOT_MINUTES % MINUTES_PER_DAY
+        else:
+            start = preferred
+
+        placed.append((start, length))
+        local = (start + offsets[guild_id]) % MINUTES_PER_DAY
+        windows[guild_id] = time(hour=local // 60, minute=local % 60)
+
+    return windows
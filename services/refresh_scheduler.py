@@ -0,0 +1,125 @@
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from utils.logging_config import setup_logger
+
+# 플레이 빈도 계산에 사용할 최근 기간
+PLAY_RATE_WINDOW_DAYS = 14
+
+# 게임 기록이 없는 유저의 기본 플레이 빈도 (하루 게임 수)
+DEFAULT_PLAY_RATE = 0.5
+
+# 갱신 한 번에 기대하는 새 게임 수 (갱신 주기 = 이 값 / 플레이 빈도)
+TARGET_NEW_GAMES = 1.0
+
+# 갱신 주기 범위
+MIN_REFRESH_INTERVAL = timedelta(hours=1)
+MAX_REFRESH_INTERVAL = timedelta(hours=24)
+
+# 갱신에 실패한 유저의 첫 재시도 간격 (연속 실패마다 두 배, 최대 MAX_REFRESH_INTERVAL)
+FAILURE_BACKOFF_BASE = timedelta(minutes=30)
+
+# 계정 하나를 갱신할 때 새 게임 외에 항상 드는 API 호출 수 (매치 목록 조회)
+BASE_REQUEST_COST = 1
+
+# 매치 목록 조회 한 번에 가져오는 최대 매치 수
+MAX_MATCHES_PER_REFRESH = 50
+
+
+def refresh_interval(play_rate: Optional[float]) -> timedelta:
+    """플레이 빈도에 따른 갱신 주기 (자주 하는 유저일수록 짧게)"""
+    rate = play_rate if play_rate else 0.0
+    if rate <= 0:
+        return MAX_REFRESH_INTERVAL
+    interval = timedelta(days=TARGET_NEW_GAMES / rate)
+    return max(MIN_REFRESH_INTERVAL, min(MAX_REFRESH_INTERVAL, interval))
+
+
+def expected_new_games(target: Dict, now: datetime) -> float:
+    """마지막 갱신 이후 쌓였을 것으로 예상되는 게임 수"""
+    play_rate = target.get('play_rate')
+    if play_rate is None:
+        play_rate = DEFAULT_PLAY_RATE
+
+    last_refreshed_at = target.get('last_refreshed_at')
+    if last_refreshed_at is None:
+        elapsed_days = MAX_REFRESH_INTERVAL / timedelta(days=1)
+    else:
+        elapsed_days = max(0.0, (now - last_refreshed_at) / timedelta(days=1))
+
+    return min(MAX_MATCHES_PER_REFRESH, play_rate * elapsed_days)
+
+
+class RefreshScheduler:
+    def __init__(self, db_service, refresh_service):
+        """
+        Parameters:
+            db_service: 갱신 대상 조회에 사용할 DatabaseService
+            refresh_service: 계정 단위 갱신을 실행할 RefreshService
+        """
+        self.db_service = db_service
+        self.refresh_service = refresh_service
+        self.logger = setup_logger(__name__, 'stats_updater.log')
+
+    @staticmethod
+    def plan(targets: List[Dict], request_budget: int, now: Optional[datetime] = None) -> List[Dict]:
+        """새 게임이 있을 가능성이 높은 계정부터 API 예산 안에서 선택
+
+        같은 계정의 유저 행은 함께 선택되며, 계정 비용은
+        매치 목록 조회 1회 + 예상 새 게임 수(매치 상세 조회)로 추정합니다.
+        """
+        now = now or datetime.now()
+        accounts: Dict[str, List[Dict]] = {}
+        for target in targets:
+            accounts.setdefault(target['puuid'], []).append(target)
+
+        ranked = sorted(
+            accounts.values(),
+            key=lambda rows: max(expected_new_games(row, now) for row in rows),
+            reverse=True
+        )
+
+        selected = []
+        spent = 0.0
+        for rows in ranked:
+            cost = BASE_REQUEST_COST + max(expected_new_games(row, now) for row in rows)
+            if selected and spent + cost > request_budget:
+                break
+            selected.extend(rows)
+            spent += cost
+        return selected
+
+    async def run_tick(self, guild_ids: List[int], request_budget: int) -> List[Dict]:
+        """갱신 시각이 된 유저들 중 예산 안에서 우선순위가 높은 계정 갱신"""
+        targets, error = await self.db_service.get_refresh_targets(guild_ids, due_only=True)
+        if error:
+            self.logger.error(f"갱신 예정 유저 조회 실패: {error}")
+            return []
+        if not targets:
+            return []
+
+        selected = self.plan(targets, request_budget)
+        self.logger.info(
+            f"적응형 갱신: 예정 {len(targets)}명 중 {len(selected)}명 갱신 (예산 {request_budget}회)"
+        )
+        return await self.refresh_service.refresh_accounts(selected)
+
+    async def enqueue_tick(self, guild_ids: List[int], priority: int) -> int:
+        """갱신 시각이 된 유저를 작업 큐에 등록 (워커 프로세스들이 각자의 API 한도로 처리)
+
+        이미 대기 중이거나 처리 중인 작업은 중복 등록되지 않습니다.
+        """
+        targets, error = await self.db_service.get_refresh_targets(guild_ids, due_only=True)
+        if error:
+            self.logger.error(f"갱신 예정 유저 조회 실패: {error}")
+            return 0
+        if not targets:
+            return 0
+
+        count, error = await self.db_service.enqueue_refresh_jobs(
+            [target['user_id'] for target in targets], priority
+        )
+        if error:
+            self.logger.error(f"갱신 작업 등록 실패: {error}")
+            return 0
+        self.logger.info(f"적응형 갱신: 예정 {len(targets)}명 작업 큐에 등록")
+        return count
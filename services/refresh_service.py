@@ -0,0 +1,203 @@
+import asyncio
+import heapq
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+from .user_service import UserService
+from .riot_service import CIRCUIT_OPEN_MESSAGE
+from utils.constants import STATS_UPDATE_CONCURRENCY
+from utils.fair_share import FairShareLimiter, current_guild
+from utils.logging_config import setup_logger
+
+# 계정 단위 갱신에 사용하는 Riot API 엔드포인트
+REFRESH_ENDPOINTS = ('match_ids', 'match')
+
+
+class RefreshService:
+    def __init__(self, user_service: UserService, concurrency: int = STATS_UPDATE_CONCURRENCY):
+        """
+        Parameters:
+            user_service: 전적 갱신에 사용할 UserService
+            concurrency: 동시에 갱신할 최대 유저 수 (모든 길드가 공유)
+        """
+        self.user_service = user_service
+        self.concurrency = concurrency
+
+        # 모든 길드의 갱신 작업이 같은 작업 슬롯을 나눠 쓰도록 공유
+        self._slots = asyncio.Semaphore(concurrency)
+
+        self.logger = setup_logger(__name__, 'stats_updater.log')
+
+    async def refresh_user(self, guild_id: int, user: Dict) -> Dict:
+        """유저 한 명의 전적 갱신 (실패해도 예외를 전파하지 않고 결과로 반환)"""
+        nickname_tag = f"{user['nickname']}#{user['tag']}"
+        async with self._slots:
+            # 이 작업의 API 호출은 해당 길드 몫으로 배분
+            token = current_guild.set(guild_id)
+            try:
+                success, error, updated_info = await self.user_service.update_user_stats(
+                    guild_id=guild_id,
+                    nickname_tag=nickname_tag
+                )
+            except Exception as e:
+                self.logger.error(f"유저 {nickname_tag} 처리 중 오류: {str(e)}")
+                success, error, updated_info = False, str(e), None
+            finally:
+                current_guild.reset(token)
+
+        if not (success and updated_info):
+            self.logger.warning(f"유저 {nickname_tag} 갱신 실패: {error}")
+
+        return {
+            'user': user,
+            'nickname_tag': nickname_tag,
+            'success': bool(success and updated_info),
+            'deferred': error == CIRCUIT_OPEN_MESSAGE,
+            'error': error,
+            'updated_info': updated_info
+        }
+
+    async def refresh_users(
+        self,
+        guild_id: int,
+        users: List[Dict],
+        on_result: Optional[Callable[[Dict], Awaitable[None]]] = None
+    ) -> List[Dict]:
+        """유저 목록을 작업 슬롯 수만큼 동시에 갱신
+
+        Riot API 호출 속도는 공유 Rate Limiter 가 제한하므로 동시 작업 수는
+        한도를 채울 만큼만 있으면 됩니다. 결과는 입력 순서대로 반환됩니다.
+        on_result 가 주어지면 유저 한 명이 끝날 때마다 호출됩니다.
+        """
+        async def run(user: Dict) -> Dict:
+            result = await self.refresh_user(guild_id, user)
+            if on_result:
+                try:
+                    await on_result(result)
+                except Exception as e:
+                    self.logger.error(f"갱신 결과 처리 중 오류: {str(e)}")
+            return result
+
+        return list(await asyncio.gather(*(run(user) for user in users)))
+
+    @staticmethod
+    def plan_accounts(targets: List[Dict]) -> Dict[str, List[Dict]]:
+        """갱신 대상을 Riot 계정(PUUID) 단위로 묶기
+
+        같은 계정이 여러 길드에 등록되어 있어도 API 조회는 한 번만 하도록
+        PUUID 별로 해당 계정을 참조하는 유저 행 목록을 만듭니다.
+        """
+        accounts: Dict[str, List[Dict]] = {}
+        for target in targets:
+            accounts.setdefault(target['puuid'], []).append(target)
+        return accounts
+
+    @staticmethod
+    def interleave_accounts(
+        accounts: Dict[str, List[Dict]],
+        weights: Optional[Dict[int, float]] = None
+    ) -> List[Tuple[str, List[Dict]]]:
+        """길드 가중치에 비례하도록 여러 길드의 계정을 번갈아 배치
+
+        작업 슬롯은 먼저 요청한 순서대로 배정되므로, 큰 길드의 계정이 앞에
+        몰려 있으면 작은 길드는 큰 길드가 끝날 때까지 시작하지 못합니다.
+        """
+        weights = weights or {}
+        by_guild: Dict[int, List[Tuple[str, List[Dict]]]] = {}
+        for puuid, rows in accounts.items():
+            by_guild.setdefault(rows[0]['guild_id'], []).append((puuid, rows))
+
+        # (다음 차례, 길드 ID, 다음 계정 위치) - 가중치가 클수록 차례가 자주 돌아옴
+        heap = [(0.0, guild_id, 0) for guild_id in by_guild]
+        heapq.heapify(heap)
+        ordered = []
+        while heap:
+            turn, guild_id, index = heapq.heappop(heap)
+            ordered.append(by_guild[guild_id][index])
+            if index + 1 < len(by_guild[guild_id]):
+                step = 1 / max(weights.get(guild_id, 1.0), 0.01)
+                heapq.heappush(heap, (turn + step, guild_id, index + 1))
+        return ordered
+
+    async def configure_fair_share(self, guild_ids) -> FairShareLimiter:
+        """길드별 API 호출 배분 설정을 DB 에서 읽어 공유 배분기에 반영"""
+        fair_share = self.user_service.riot_service.fair_share
+        shares, error = await self.user_service.db_service.get_guild_api_shares(list(guild_ids))
+        if error:
+            self.logger.error(f"길드 API 배분 설정 조회 실패: {error}")
+        for guild_id, (weight, quota) in shares.items():
+            fair_share.configure(guild_id, weight, quota)
+        return fair_share
+
+    def retry_after(self) -> Optional[float]:
+        """Riot API 장애로 갱신할 수 없으면 재시도까지 남은 시간(초), 갱신 가능하면 None"""
+        return self.user_service.riot_service.unavailable_for(REFRESH_ENDPOINTS)
+
+    async def refresh_account(self, puuid: str, rows: List[Dict]) -> List[Dict]:
+        """계정 하나를 조회하여 연결된 모든 유저 행에 결과 반영
+
+        Riot API 가 장애로 차단되어 있으면 조회하지 않고 결과의 deferred 를
+        True 로 표시합니다. 이 유저들은 실패가 아니라 나중에 다시 갱신할 대상입니다.
+        """
+        async with self._slots:
+            if self.retry_after() is not None:
+                outcomes = [(False, CIRCUIT_OPEN_MESSAGE, None) for _ in rows]
+            else:
+                # 여러 길드가 공유하는 계정은 첫 번째 길드 몫으로 배분
+                token = current_guild.set(rows[0]['guild_id'])
+                try:
+                    outcomes = await self.user_service.refresh_account(puuid, rows)
+                except Exception as e:
+                    self.logger.error(f"계정 {puuid} 처리 중 오류: {str(e)}")
+                    outcomes = [(False, str(e), None) for _ in rows]
+                finally:
+                    current_guild.reset(token)
+
+        results = []
+        for row, (success, error, updated_info) in zip(rows, outcomes):
+            nickname_tag = f"{row['nickname']}#{row['tag']}"
+            deferred = error == CIRCUIT_OPEN_MESSAGE
+            if not (success and updated_info) and not deferred:
+                self.logger.warning(f"유저 {nickname_tag} 갱신 실패: {error}")
+            results.append({
+                'user': row,
+                'guild_id': row['guild_id'],
+                'nickname_tag': nickname_tag,
+                'success': bool(success and updated_info),
+                'deferred': deferred,
+                'error': error,
+                'updated_info': updated_info
+            })
+
+        # 장애로 보류된 유저는 그대로 두고, 실패한 유저만 재시도를 늦춤
+        failed = [result['user']['user_id'] for result in results if not result['success'] and not result['deferred']]
+        _, error = await self.user_service.db_service.record_refresh_failures(failed)
+        if error:
+            self.logger.error(f"갱신 실패 기록 실패: {error}")
+        return results
+
+    async def refresh_accounts(
+        self,
+        targets: List[Dict],
+        on_result: Optional[Callable[[Dict], Awaitable[None]]] = None
+    ) -> List[Dict]:
+        """여러 길드의 갱신 대상을 계정 단위로 중복 제거하여 동시에 갱신
+
+        targets 는 DatabaseService.get_refresh_targets 결과이며,
+        결과는 유저 행마다 하나씩 반환됩니다.
+        """
+        accounts = self.plan_accounts(targets)
+        self.logger.info(f"갱신 계획: 유저 {len(targets)}명 → 계정 {len(accounts)}개")
+        fair_share = await self.configure_fair_share({target['guild_id'] for target in targets})
+
+        async def run(puuid: str, rows: List[Dict]) -> List[Dict]:
+            results = await self.refresh_account(puuid, rows)
+            if on_result:
+                for result in results:
+                    try:
+                        await on_result(result)
+                    except Exception as e:
+                        self.logger.error(f"갱신 결과 처리 중 오류: {str(e)}")
+            return results
+
+        ordered = self.interleave_accounts(accounts, fair_share.weights)
+        grouped = await asyncio.gather(*(run(puuid, rows) for puuid, rows in ordered))
+        return [result for results in grouped for result in results]
@@ -0,0 +1,117 @@
+import asyncio
+import os
+import socket
+from typing import Dict, List, Optional, Tuple
+from .database_service import DatabaseService
+from .refresh_service import RefreshService
+from .user_service import UserService
+from utils.constants import (
+    REFRESH_JOB_LEASE_SECONDS,
+    REFRESH_JOB_MAX_ATTEMPTS,
+    REFRESH_WORKER_BATCH_SIZE,
+    REFRESH_WORKER_POLL_SECONDS
+)
+from utils.logging_config import setup_logger
+
+
+class RefreshWorker:
+    def __init__(
+        self,
+        db_service: Optional[DatabaseService] = None,
+        refresh_service: Optional[RefreshService] = None,
+        worker_id: Optional[str] = None,
+        batch_size: int = REFRESH_WORKER_BATCH_SIZE,
+        lease_seconds: int = REFRESH_JOB_LEASE_SECONDS,
+        poll_seconds: float = REFRESH_WORKER_POLL_SECONDS,
+        shards: Optional[Tuple[int, List[int]]] = None
+    ):
+        """
+        Parameters:
+            db_service: 작업 큐에 사용할 DatabaseService
+            refresh_service: 계정 단위 갱신을 실행할 RefreshService
+            worker_id: 작업 임대에 기록할 워커 이름 (기본: 호스트명:PID)
+            batch_size: 한 번에 임대할 작업 수
+            lease_seconds: 작업 임대 시간 (처리 중에는 주기적으로 연장)
+            poll_seconds: 큐가 비었을 때 다시 확인하기까지 대기 시간
+            shards: (전체 샤드 수, 샤드 번호 목록) - 주어지면 해당 샤드 길드의 작업만 처리
+        """
+        self.db_service = db_service or DatabaseService()
+        self.refresh_service = refresh_service or RefreshService(UserService())
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.batch_size = batch_size
+        self.lease_seconds = lease_seconds
+        self.poll_seconds = poll_seconds
+        self.shards = shards
+        self._stopping = asyncio.Event()
+        self.logger = setup_logger(__name__, 'refresh_worker.log')
+
+    def stop(self) -> None:
+        """현재 묶음을 마친 뒤 종료"""
+        self._stopping.set()
+
+    async def run(self) -> None:
+        """종료 요청이 있을 때까지 큐에서 작업을 가져와 처리"""
+        self.logger.info(f"갱신 워커 시작: {self.worker_id}")
+        while not self._stopping.is_set():
+            try:
+                processed = await self.run_once()
+            except Exception as e:
+                self.logger.error(f"갱신 작업 처리 중 오류: {str(e)}")
+                processed = 0
+
+            if not processed:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self.poll_seconds)
+                except asyncio.TimeoutError:
+                    pass
+        self.logger.info(f"갱신 워커 종료: {self.worker_id}")
+
+    async def run_once(self) -> int:
+        """작업 한 묶음을 임대하여 처리하고 처리한 작업 수 반환"""
+        retry_after = self.refresh_service.retry_after()
+        if retry_after is not None:
+            # 장애가 복구될 때까지 작업을 가져가지 않음
+            self.logger.warning(f"라이엇 API 장애로 작업 처리 일시 중지 ({retry_after:.0f}초 후 재시도)")
+            return 0
+
+        jobs, error = await self.db_service.claim_refresh_jobs(
+            self.worker_id, self.batch_size, self.lease_seconds, self.shards
+        )
+        if error:
+            self.logger.error(f"갱신 작업 임대 실패: {error}")
+            return 0
+        if not jobs:
+            return 0
+
+        self.logger.info(f"갱신 작업 {len(jobs)}개 임대")
+        job_ids = [job['job_id'] for job in jobs]
+        heartbeat = asyncio.create_task(self._renew_leases(job_ids))
+        try:
+            await self.refresh_service.refresh_accounts(jobs, on_result=self._finish_job)
+        finally:
+            heartbeat.cancel()
+        return len(jobs)
+
+    async def _finish_job(self, result: Dict) -> None:
+        """갱신 결과를 작업 큐에 기록"""
+        if result['deferred']:
+            # 장애로 처리하지 못한 작업은 실패로 세지 않고 복구 후 다시 처리
+            await self.db_service.release_refresh_job(
+                self.worker_id,
+                result['user']['job_id'],
+                int(self.refresh_service.retry_after() or self.poll_seconds)
+            )
+            return
+
+        await self.db_service.finish_refresh_job(
+            self.worker_id,
+            result['user']['job_id'],
+            error=None if result['success'] else (result['error'] or "갱신 실패"),
+            max_attempts=REFRESH_JOB_MAX_ATTEMPTS
+        )
+
+    async def _renew_leases(self, job_ids: List[int]) -> None:
+        """처리하는 동안 임대가 만료되지 않도록 주기적으로 연장"""
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            await self.db_service.extend_refresh_leases(self.worker_id, job_ids, self.lease_seconds)
@@ -4,11 +4,35 @@ import asyncio
 from datetime import datetime, timedelta
 import logging
 from urllib import parse
-from utils.constants import RIOT_API_KEY, RIOT_API_BASE_URL, RIOT_API_ASIA_URL
+from utils.constants import (
+    RIOT_API_KEY,
+    RIOT_API_BASE_URL,
+    RIOT_API_ASIA_URL,
+    RIOT_REQUESTS_PER_SECOND,
+    RIOT_REQUESTS_PER_TWO_MINUTES,
+    SHARD_COUNT,
+    SHARD_IDS
+)
 from utils.rate_limiter import RateLimiter
+from utils.fair_share import FairShareLimiter
+from utils.circuit_breaker import CircuitBreaker
+from utils.sharding import shard_share
 from utils.logging_config import setup_logger
 
+# 호출이 차단된 엔드포인트에 대한 오류 메시지 (갱신 작업은 이 오류를 받으면 나중에 다시 시도)
+CIRCUIT_OPEN_MESSAGE = "라이엇 API 장애로 호출이 일시 중단되었습니다. 잠시 후 다시 시도해주세요."
+
+# 요청 하나의 최대 대기 시간(초)
+REQUEST_TIMEOUT = 10
+
 class RiotService:
+    # 호출 한도는 API 키 단위이므로 모든 인스턴스가 하나의 Rate Limiter 를 공유
+    _shared_rate_limiter: Optional[RateLimiter] = None
+    _shared_fair_share: Optional[FairShareLimiter] = None
+
+    # 엔드포인트별 장애 감지 (프로세스 전체 공유)
+    _circuit_breakers: Dict[str, CircuitBreaker] = {}
+
     def __init__(self):
         if not RIOT_API_KEY:
             raise ValueError("RIOT_API_KEY가 설정되지 않았습니다.")
@@ -22,26 +46,57 @@ class RiotService:
             "X-Riot-Token": self.api_key
         }
         
-        # Rate Limiter 초기화
-        self.rate_limiter = RateLimiter(
-            requests_per_second=20,
-            requests_per_two_minutes=100
-        )
+        # Rate Limiter 초기화 (프로세스 전체 공유)
+        # 샤드를 나누어 실행하면 같은 키를 쓰는 다른 샤드 프로세스와 한도를 나누어 사용
+        if RiotService._shared_rate_limiter is None:
+            share = shard_share(SHARD_IDS, SHARD_COUNT)
+            RiotService._shared_rate_limiter = RateLimiter(
+                requests_per_second=max(1, int(RIOT_REQUESTS_PER_SECOND * share)),
+                requests_per_two_minutes=max(1, int(RIOT_REQUESTS_PER_TWO_MINUTES * share))
+            )
+            RiotService._shared_fair_share = FairShareLimiter(RiotService._shared_rate_limiter)
+        self.rate_limiter = RiotService._shared_rate_limiter
+
+        # 전적 갱신 중에는 길드별 가중치에 따라 호출 한도를 나누어 사용
+        self.fair_share = RiotService._shared_fair_share
         
         self.logger = setup_logger(__name__, 'user_service.log')
 
 
-    async def _make_request(self, url: str) -> Tuple[Optional[Dict], Optional[str]]:
-        """API 요청 실행"""
+    def _circuit(self, endpoint: str) -> CircuitBreaker:
+        breaker = RiotService._circuit_breakers.get(endpoint)
+        if breaker is None:
+            breaker = RiotService._circuit_breakers[endpoint] = CircuitBreaker(endpoint)
+        return breaker
+
+    def unavailable_for(self, endpoints: Tuple[str, ...]) -> Optional[float]:
+        """엔드포인트 중 호출이 차단된 것이 있으면 재시도까지 남은 시간(초), 모두 호출 가능하면 None"""
+        waits = [
+            wait for wait in (self._circuit(endpoint).retry_after() for endpoint in endpoints)
+            if wait is not None
+        ]
+        return max(waits) if waits else None
+
+    async def _make_request(self, url: str, endpoint: str) -> Tuple[Optional[Dict], Optional[str]]:
+        """API 요청 실행
+
+        엔드포인트가 장애로 차단되어 있으면 Rate Limiter 를 기다리지 않고 바로 실패합니다.
+        """
+        breaker = self._circuit(endpoint)
+        if not breaker.allow():
+            return None, CIRCUIT_OPEN_MESSAGE
+
         try:
-            # Rate limit 체크
-            await self.rate_limiter.acquire()
+            # Rate limit 체크 (갱신 작업이면 길드 차례까지 대기)
+            await self.fair_share.acquire()
             
-            self.logger.debug(f"API 요청: {url}")
+            self.logger.debug("API 요청: %s", url)
             
-            async with aiohttp.ClientSession() as session:
+            timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+            async with aiohttp.ClientSession(timeout=timeout) as session:
                 async with session.get(url, headers=self.headers) as response:
                     if response.status == 200:
+                        breaker.record_success()
                         return await response.json(), None
                     
                     error_msg = None
@@ -51,6 +106,21 @@ class RiotService:
                     except:
                         error_msg = await response.text()
                     
+                    if response.status in (401, 403):
+                        # 키 만료 등은 다시 호출해도 실패하므로 바로 차단
+                        breaker.record_failure(trip=True)
+                    elif response.status == 429:
+                        # 호출 한도 초과는 장애가 아니므로 차단하지 않고 Retry-After 동안 모든 요청을 멈춤
+                        breaker.record_neutral()
+                        try:
+                            self.rate_limiter.pause(float(response.headers['Retry-After']))
+                        except (KeyError, ValueError):
+                            pass
+                    elif response.status >= 500:
+                        breaker.record_failure()
+                    else:
+                        breaker.record_success()
+
                     if response.status == 404:
                         return None, "소환사를 찾을 수 없습니다."
                     elif response.status == 403:
@@ -63,10 +133,17 @@ class RiotService:
                     else:
                         return None, f"API 오류 (상태 코드: {response.status}): {error_msg}"
                         
-        except aiohttp.ClientError as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            breaker.record_failure()
             self.logger.error(f"네트워크 오류: {str(e)}")
             return None, "네트워크 연결에 실패했습니다."
+        except asyncio.CancelledError:
+            # 시험 호출이 취소되면 결과를 알 수 없으므로 다시 차단 상태로 되돌림
+            if breaker.state == CircuitBreaker.HALF_OPEN:
+                breaker.record_failure()
+            raise
         except Exception as e:
+            breaker.record_failure()
             self.logger.error(f"예상치 못한 오류: {str(e)}")
             return None, f"예상치 못한 오류가 발생했습니다: {str(e)}"
 
@@ -74,30 +151,33 @@ class RiotService:
         """Riot ID로 계정 정보 조회"""
         encoded_name = parse.quote(game_name)
         url = f"{RIOT_API_ASIA_URL}/riot/account/v1/accounts/by-riot-id/{encoded_name}/{tag_line}"
-        return await self._make_request(url)
+        return await self._make_request(url, 'account')
 
     async def get_summoner_by_puuid(self, puuid: str) -> Tuple[Optional[Dict], Optional[str]]:
         """PUUID로 소환사 정보 조회"""
         url = f"{RIOT_API_BASE_URL}/lol/summoner/v4/summoners/by-puuid/{puuid}"
-        return await self._make_request(url)
+        return await self._make_request(url, 'summoner')
 
     async def get_aram_matches(self, puuid: str, start_time: Optional[int] = None) -> Tuple[List[str], Optional[str]]:
         """ARAM 매치 목록 조회"""
         if not start_time:
             # 최근 30일의 데이터만 조회
             start_time = int((datetime.now() - timedelta(days=30)).timestamp())
+        elif start_time > 10 ** 11:
+            # last_updates 에는 gameCreation(밀리초)이 저장되므로 초 단위로 변환
+            start_time = start_time // 1000
 
         url = (
             f"{RIOT_API_ASIA_URL}/lol/match/v5/matches/by-puuid/{puuid}/ids"
             f"?queue=450&type=normal&start=0&count=50&startTime={start_time}"
         )
-        result, error = await self._make_request(url)
+        result, error = await self._make_request(url, 'match_ids')
         return (result if result else [], error)
 
     async def get_match_details(self, match_id: str) -> Tuple[Optional[Dict], Optional[str]]:
         """매치 상세 정보 조회"""
         url = f"{RIOT_API_ASIA_URL}/lol/match/v5/matches/{match_id}"
-        return await self._make_request(url)
+        return await self._make_request(url, 'match')
 
     async def get_match_details_for_user(self, match_id: str, puuid: str) -> Tuple[Optional[Dict], Optional[str]]:
         """특정 유저의 매치 상세 정보 추출"""
@@ -134,55 +214,58 @@ class RiotService:
 
         return match_data, None
 
+    async def get_new_matches(self, puuid: str, start_time: Optional[int] = None) -> Tuple[List[Dict], Optional[str]]:
+        """PUUID 기준 새로운 ARAM 매치 상세 데이터 조회 (계정 조회 없이)"""
+        matches, error = await self.get_aram_matches(puuid, start_time)
+        if error:
+            return [], error
+
+        # 매치 상세 정보를 병렬로 조회
+        match_results = await asyncio.gather(*[
+            self.get_match_details_for_user(match_id, puuid)
+            for match_id in matches
+        ])
+
+        # 장애로 일부 매치를 못 가져오면 저장 순서가 어긋나지 않도록 전체를 나중에 다시 조회
+        if any(error == CIRCUIT_OPEN_MESSAGE for _, error in match_results):
+            return [], CIRCUIT_OPEN_MESSAGE
+
+        return [match_result for match_result, _ in match_results if match_result], None
+
+    async def get_basic_info(self, game_name: str, tag_line: str) -> Tuple[Optional[Dict], Optional[str]]:
+        """Riot ID로 계정과 소환사 기본 정보 조회 (매치는 조회하지 않음)"""
+        # Riot ID로 계정 정보 조회
+        account_info, error = await self.get_account_by_riot_id(game_name, tag_line)
+        if error:
+            return None, error
+        if not account_info:
+            return None, "계정 정보를 찾을 수 없습니다."
+
+        # PUUID로 소환사 정보 조회
+        summoner, error = await self.get_summoner_by_puuid(account_info['puuid'])
+        if error:
+            return None, error
+        if not summoner:
+            return None, "소환사 정보를 찾을 수 없습니다."
+
+        return {
+            'summoner_id': summoner['id'],
+            'puuid': summoner['puuid'],
+            'account_id': summoner['accountId'],
+            'summoner_level': summoner['summonerLevel'],
+        }, None
+
     async def analyze_aram_performance(self, game_name: str, tag_line: str, last_match_time: Optional[int] = None) -> Tuple[Optional[Dict], Optional[str], List[Dict]]:
         """ARAM 게임 성능 분석 및 새로운 매치 데이터 반환"""
         try:
-            # Riot ID로 계정 정보 조회
-            account_info, error = await self.get_account_by_riot_id(game_name, tag_line)
+            basic_info, error = await self.get_basic_info(game_name, tag_line)
             if error:
                 return None, error, []
-            if not account_info:
-                return None, "계정 정보를 찾을 수 없습니다.", []
 
-            # PUUID로 소환사 정보 조회
-            summoner, error = await self.get_summoner_by_puuid(account_info['puuid'])
+            # ARAM 매치 목록 및 상세 정보 조회
+            new_matches, error = await self.get_new_matches(basic_info['puuid'], last_match_time)
             if error:
                 return None, error, []
-            if not summoner:
-                return None, "소환사 정보를 찾을 수 없습니다.", []
-
-            # ARAM 매치 목록 조회
-            matches, error = await self.get_aram_matches(account_info['puuid'], last_match_time)
-            if error:
-                return None, error, []
-
-            if not matches:
-                basic_info = {
-                    'summoner_id': summoner['id'],
-                    'puuid': summoner['puuid'],
-                    'account_id': summoner['accountId'],
-                    'summoner_level': summoner['summonerLevel'],
-                }
-                return basic_info, None, []
-
-            # 매치 상세 정보를 병렬로 조회
-            match_tasks = []
-            for match_id in matches:
-                match_tasks.append(self.get_match_details_for_user(match_id, account_info['puuid']))
-
-            match_results = await asyncio.gather(*match_tasks)
-            
-            new_matches = []
-            for match_result, _ in match_results:
-                if match_result:
-                    new_matches.append(match_result)
-
-            basic_info = {
-                'summoner_id': summoner['id'],
-                'puuid': summoner['puuid'],
-                'account_id': summoner['accountId'],
-                'summoner_level': summoner['summonerLevel'],
-            }
 
             return basic_info, None, new_matches
 
@@ -0,0 +1,52 @@
+import bisect
+import time
+from typing import Dict, List, Optional
+
+# 캐시된 명단을 다시 불러오기까지의 시간(초) - 등록/삭제 시에는 바로 무효화
+ROSTER_TTL_SECONDS = 600
+
+
+class RosterIndex:
+    def __init__(self, players: List[Dict], play_counts: Optional[Dict[int, int]] = None):
+        """길드 명단의 닉네임#태그 접두어 검색 인덱스
+
+        플레이어는 최근 게임 수가 많은 순서(같으면 닉네임 순)로 정렬해 두고,
+        검색 결과도 같은 순서로 반환합니다.
+
+        Parameters:
+            players: discord_id(닉네임#태그)와 user_id 를 가진 플레이어 목록
+            play_counts: user_id → 최근 게임 수
+        """
+        self.play_counts = play_counts or {}
+        self.created_at = time.monotonic()
+
+        self.players = sorted(
+            players,
+            key=lambda player: (-self.play_counts.get(player['user_id'], 0), player['discord_id'].lower())
+        )
+        self.by_id = {player['discord_id']: player for player in self.players}
+
+        # 접두어 검색용 (소문자 닉네임#태그, 활동 순위) 정렬 목록
+        self._keys = sorted(
+            (player['discord_id'].lower(), rank) for rank, player in enumerate(self.players)
+        )
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+    def expired(self, ttl: float = ROSTER_TTL_SECONDS) -> bool:
+        return time.monotonic() - self.created_at >= ttl
+
+    def search(self, prefix: str = "") -> List[Dict]:
+        """닉네임#태그가 prefix 로 시작하는 플레이어 (대소문자 무시, 활동 순)"""
+        prefix = prefix.strip().lower()
+        if not prefix:
+            return self.players
+
+        ranks = []
+        start = bisect.bisect_left(self._keys, (prefix,))
+        for key, rank in self._keys[start:]:
+            if not key.startswith(prefix):
+                break
+            ranks.append(rank)
+        return [self.players[rank] for rank in sorted(ranks)]
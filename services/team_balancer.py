@@ -0,0 +1,302 @@
+import itertools
+import time
+from typing import List, Dict, Optional, Tuple, Iterable, Iterator
+
+# 한 번의 탐색에서 방문할 최대 노드 수 (대규모 로스터에서 지연 시간 상한)
+MAX_SEARCH_NODES = 500_000
+
+# 승률 기준 밸런싱에서 평가할 최대 팀 구성 수
+MAX_PROBABILITY_CANDIDATES = 5000
+
+# 밸런스 점수 공식 버전 (calculate_player_score 를 변경하면 반드시 올려야 합니다)
+# user_stats.balance_score_version 이 이 값과 다르면 일괄 재계산 대상이 됩니다.
+BALANCE_SCORE_VERSION = 1
+
+
+class TeamBalancer:
+    @staticmethod
+    def calculate_player_score(player: dict) -> float:
+        """플레이어의 종합 점수 계산"""
+        if player['games_played'] == 0:
+            return 50.0  # 기본 점수
+
+        # 모든 값을 float로 변환
+        winrate = float(player['wins']) / float(player['games_played']) * 100
+        kda_score = float(player['avg_kda']) * 10
+        damage_score = float(player['avg_damage_dealt']) / 1000
+        tankiness_score = float(player['avg_damage_taken']) / 1000
+        healing = float(player['avg_healing']) / 1000
+        cc_score = float(player.get('avg_cc_score', 0)) * 2
+
+        # 전투력 점수 (30%)
+        combat_score = (kda_score + damage_score) / 2 * 0.3
+
+        # 생존력 점수 (25%)
+        survival_score = tankiness_score * 0.25
+
+        # 유틸성 점수 (25%)
+        utility_score = (healing + cc_score) / 2 * 0.25
+
+        # 승률 점수 (20%)
+        winrate_score = winrate * 0.2
+
+        # 종합 점수 계산
+        total_score = combat_score + survival_score + utility_score + winrate_score
+
+        return float(total_score)
+
+    @staticmethod
+    def get_player_score(player: dict) -> float:
+        """미리 계산된 밸런스 점수 조회 (버전이 다르거나 없으면 다시 계산)"""
+        if (
+            player.get('balance_score') is not None
+            and player.get('balance_score_version') == BALANCE_SCORE_VERSION
+        ):
+            return float(player['balance_score'])
+        return TeamBalancer.calculate_player_score(player)
+
+    @staticmethod
+    def _build_units(
+        ids: List[str],
+        together: Iterable[Tuple[str, str]],
+        apart: Iterable[Tuple[str, str]]
+    ) -> Tuple[List[List[int]], List[set]]:
+        """같은 팀 조건으로 플레이어를 묶고, 다른 팀 조건을 묶음 간 충돌로 변환"""
+        index = {player_id: i for i, player_id in enumerate(ids)}
+        parent = list(range(len(ids)))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        def lookup(player_id: str) -> int:
+            if player_id not in index:
+                raise ValueError(f"선택되지 않은 플레이어입니다: {player_id}")
+            return index[player_id]
+
+        for a, b in together:
+            parent[find(lookup(a))] = find(lookup(b))
+
+        # 루트별로 플레이어 인덱스 묶기 (입력 순서 유지)
+        groups: Dict[int, List[int]] = {}
+        for i in range(len(ids)):
+            groups.setdefault(find(i), []).append(i)
+        unit_of = {}
+        units = []
+        for members in groups.values():
+            for i in members:
+                unit_of[i] = len(units)
+            units.append(members)
+
+        conflicts = [set() for _ in units]
+        for a, b in apart:
+            ua, ub = unit_of[lookup(a)], unit_of[lookup(b)]
+            if ua == ub:
+                raise ValueError(f"{a}, {b} 는 같은 팀 조건과 다른 팀 조건을 동시에 만족할 수 없습니다.")
+            conflicts[ua].add(ub)
+            conflicts[ub].add(ua)
+
+        return units, conflicts
+
+    @staticmethod
+    def balance_teams(
+        players: List[dict],
+        together: Optional[Iterable[Tuple[str, str]]] = None,
+        apart: Optional[Iterable[Tuple[str, str]]] = None,
+        max_nodes: int = MAX_SEARCH_NODES,
+        estimator=None,
+        deadline: Optional[float] = None
+    ) -> tuple[List[dict], List[dict]]:
+        """종합 점수를 기준으로 최적의 팀 밸런스를 찾습니다.
+
+        together/apart 는 (플레이어 ID, 플레이어 ID) 쌍의 목록입니다.
+        조건은 탐색 중에 가지치기로 적용되므로 조건이 많을수록 탐색 공간이 줄어듭니다.
+        estimator(WinProbabilityEstimator)가 주어지면 점수 차이 대신
+        |블루팀 승률 - 0.5| 를 최소화합니다.
+        deadline(time.time() 기준)이 지나면 그때까지 찾은 최선의 구성을 반환합니다.
+        조건을 만족하는 팀 구성이 없으면 ValueError 를 발생시킵니다.
+        """
+        # 각 플레이어의 종합 점수 계산
+        for player in players:
+            player['total_score'] = TeamBalancer.get_player_score(player)
+
+        if estimator is not None:
+            return TeamBalancer._balance_by_win_probability(players, together, apart, estimator, deadline)
+
+        n = len(players)
+        team1_size = n // 2  # 목표 팀 크기
+        team2_size = n - team1_size
+
+        units, conflicts = TeamBalancer._build_units(
+            [p['discord_id'] for p in players], together or [], apart or []
+        )
+        unit_scores = [sum(float(players[i]['total_score']) for i in unit) for unit in units]
+        unit_sizes = [len(unit) for unit in units]
+
+        # 점수가 큰 묶음부터 배치해야 하한 가지치기가 빨리 효과를 봅니다
+        order = sorted(range(len(units)), key=lambda u: (-unit_sizes[u], -unit_scores[u]))
+        # 남은 묶음 점수 합 (order 기준 접미사 합)
+        remaining = [0.0] * (len(order) + 1)
+        for pos in range(len(order) - 1, -1, -1):
+            remaining[pos] = remaining[pos + 1] + unit_scores[order[pos]]
+
+        assignment = [0] * len(units)  # 1 또는 2
+        best = {'diff': float('inf'), 'assignment': None}
+        nodes = 0
+
+        def search(pos: int, size1: int, size2: int, diff: float) -> bool:
+            """diff = 팀1 점수 - 팀2 점수. 더 이상 개선할 수 없으면 True 반환"""
+            nonlocal nodes
+            nodes += 1
+
+            if pos == len(order):
+                if abs(diff) < best['diff']:
+                    best['diff'] = abs(diff)
+                    best['assignment'] = list(assignment)
+                return best['diff'] <= 1e-9 or nodes >= max_nodes
+
+            # 남은 점수를 모두 한쪽에 몰아도 현재 최선보다 나을 수 없으면 가지치기
+            if abs(diff) - remaining[pos] >= best['diff']:
+                return False
+            if best['assignment'] is not None and (
+                nodes >= max_nodes
+                or (deadline is not None and nodes % 1024 == 0 and time.time() >= deadline)
+            ):
+                return True
+
+            unit = order[pos]
+            size = unit_sizes[unit]
+            score = unit_scores[unit]
+
+            # 점수가 낮은 팀에 먼저 배치 (좋은 해를 빨리 찾아 가지치기 강화)
+            sides = (1, 2) if diff <= 0 else (2, 1)
+            # 첫 묶음은 팀1에 고정하여 대칭 해 제거 (팀 크기가 같을 때만 유효)
+            if pos == 0 and team1_size == team2_size:
+                sides = (1,)
+
+            for side in sides:
+                if side == 1 and size1 + size > team1_size:
+                    continue
+                if side == 2 and size2 + size > team2_size:
+                    continue
+                # 다른 팀 조건: 이미 같은 팀에 배치된 충돌 묶음이 있으면 가지치기
+                if any(
+                    assignment[other] == side
+                    for other in conflicts[unit]
+                    if assignment[other]
+                ):
+                    continue
+
+                assignment[unit] = side
+                if side == 1:
+                    done = search(pos + 1, size1 + size, size2, diff + score)
+                else:
+                    done = search(pos + 1, size1, size2 + size, diff - score)
+                assignment[unit] = 0
+                if done:
+                    return True
+
+            return False
+
+        search(0, 0, 0, 0.0)
+
+        if best['assignment'] is None:
+            raise ValueError("조건을 만족하는 팀 구성이 없습니다.")
+
+        best_team1 = []
+        best_team2 = []
+        for unit, side in enumerate(best['assignment']):
+            target = best_team1 if side == 1 else best_team2
+            target.extend(players[i] for i in units[unit])
+
+        return best_team1, best_team2
+
+    @staticmethod
+    def iter_feasible_splits(
+        players: List[dict],
+        together: Optional[Iterable[Tuple[str, str]]] = None,
+        apart: Optional[Iterable[Tuple[str, str]]] = None
+    ) -> Iterator[List[int]]:
+        """조건을 만족하는 모든 팀 구성을 팀1 플레이어 인덱스 목록으로 순회 (대칭 해 제외)"""
+        n = len(players)
+        team1_size = n // 2
+        team2_size = n - team1_size
+
+        units, conflicts = TeamBalancer._build_units(
+            [p['discord_id'] for p in players], together or [], apart or []
+        )
+        order = sorted(range(len(units)), key=lambda u: -len(units[u]))
+        assignment = [0] * len(units)
+
+        def search(pos: int, size1: int, size2: int) -> Iterator[List[int]]:
+            if pos == len(order):
+                yield sorted(i for unit, side in enumerate(assignment) if side == 1 for i in units[unit])
+                return
+
+            unit = order[pos]
+            size = len(units[unit])
+            sides = (1,) if pos == 0 and team1_size == team2_size else (1, 2)
+            for side in sides:
+                if side == 1 and size1 + size > team1_size:
+                    continue
+                if side == 2 and size2 + size > team2_size:
+                    continue
+                if any(assignment[other] == side for other in conflicts[unit] if assignment[other]):
+                    continue
+
+                assignment[unit] = side
+                if side == 1:
+                    yield from search(pos + 1, size1 + size, size2)
+                else:
+                    yield from search(pos + 1, size1, size2 + size)
+                assignment[unit] = 0
+
+        yield from search(0, 0, 0)
+
+    @staticmethod
+    def _balance_by_win_probability(
+        players: List[dict],
+        together: Optional[Iterable[Tuple[str, str]]],
+        apart: Optional[Iterable[Tuple[str, str]]],
+        estimator,
+        deadline: Optional[float] = None
+    ) -> tuple[List[dict], List[dict]]:
+        """예상 승률이 50%에 가장 가까운 팀 구성 선택
+
+        deadline(time.time() 기준)이 지나면 후보 수집과 승률 계산을 멈추고
+        그때까지 평가한 후보 중 최선의 구성을 반환합니다.
+        """
+        splits = []
+        for split in itertools.islice(
+            TeamBalancer.iter_feasible_splits(players, together, apart),
+            MAX_PROBABILITY_CANDIDATES
+        ):
+            splits.append(split)
+            if deadline is not None and len(splits) % 1024 == 0 and time.time() >= deadline:
+                break
+        if not splits:
+            raise ValueError("조건을 만족하는 팀 구성이 없습니다.")
+
+        masks = [[False] * len(players) for _ in splits]
+        for row, team1_indices in enumerate(splits):
+            for i in team1_indices:
+                masks[row][i] = True
+
+        probabilities = estimator.estimate_splits(players, masks, deadline)
+        # 시간이 부족하면 승률을 계산한 앞쪽 후보만 비교
+        splits = splits[:len(probabilities)]
+
+        # |p - 0.5| 가 같으면 점수 차이가 작은 구성을 우선
+        total = sum(p['total_score'] for p in players)
+
+        def key(row: int) -> Tuple[float, float]:
+            team1_score = sum(players[i]['total_score'] for i in splits[row])
+            return abs(float(probabilities[row]) - 0.5), abs(2 * team1_score - total)
+
+        best = min(range(len(splits)), key=key)
+        team1_set = set(splits[best])
+        team1 = [players[i] for i in splits[best]]
+        team2 = [p for i, p in enumerate(players) if i not in team1_set]
+        return team1, team2
@@ -0,0 +1,156 @@
+import asyncio
+import csv
+import io
+from typing import Callable, Dict, List, Optional
+from .user_service import UserService
+from utils.constants import REFRESH_PRIORITY_REGISTRATION
+from utils.logging_config import setup_logger
+from utils.validators import validate_nickname_tag
+
+# 한 번에 가져올 수 있는 최대 Riot ID 수
+MAX_IMPORT_ROWS = 200
+
+# 동시에 확인할 Riot ID 수 (실제 호출 속도는 Rate Limiter 가 제한)
+IMPORT_CONCURRENCY = 4
+
+# 행별 결과 상태
+IMPORT_REGISTERED = 'registered'
+IMPORT_EXISTS = 'exists'
+IMPORT_DUPLICATE = 'duplicate'
+IMPORT_INVALID = 'invalid'
+IMPORT_FAILED = 'failed'
+
+
+def parse_riot_ids(text: str) -> List[str]:
+    """목록 또는 CSV 에서 Riot ID(닉네임#태그) 추출
+
+    줄바꿈이나 쉼표로 구분한 목록과 CSV 를 모두 받으며,
+    '#' 이 들어 있는 칸만 Riot ID 로 봅니다 (헤더 등 나머지 칸은 무시).
+    """
+    return [
+        cell.strip()
+        for row in csv.reader(io.StringIO(text))
+        for cell in row
+        if '#' in cell
+    ]
+
+
+class UserImporter:
+    def __init__(self, user_service: UserService, concurrency: int = IMPORT_CONCURRENCY):
+        """
+        Parameters:
+            user_service: Riot ID 확인과 등록에 사용할 UserService
+            concurrency: 동시에 확인할 Riot ID 수
+        """
+        self.user_service = user_service
+        self.db_service = user_service.db_service
+        self.riot_service = user_service.riot_service
+        self.concurrency = concurrency
+
+        self.logger = setup_logger(__name__, 'commands.log')
+
+    async def import_users(
+        self,
+        guild_id: int,
+        guild_name: str,
+        riot_ids: List[str],
+        on_resolved: Optional[Callable[[int], None]] = None
+    ) -> List[Dict]:
+        """Riot ID 목록 일괄 등록
+
+        계정 확인은 여러 개를 동시에 진행하고(호출 속도는 Rate Limiter 가 제한),
+        확인된 유저는 한 트랜잭션으로 등록한 뒤 전적 수집 작업을 한 번에 큐에 넣습니다.
+        Riot API 장애로 호출이 차단되면 남은 행은 확인하지 않고 실패로 처리합니다.
+
+        Parameters:
+            on_resolved: 처리한 행 수를 받아 호출 (진행 상황 표시용)
+
+        Returns:
+            입력 순서대로 riot_id, status, message 를 가진 행별 결과
+
+        Raises:
+            ValueError: riot_ids 가 MAX_IMPORT_ROWS 개를 넘는 경우
+        """
+        if len(riot_ids) > MAX_IMPORT_ROWS:
+            raise ValueError(f"한 번에 최대 {MAX_IMPORT_ROWS}명까지 등록할 수 있습니다. (입력: {len(riot_ids)}명)")
+
+        results = [{'riot_id': riot_id, 'status': None, 'message': None} for riot_id in riot_ids]
+
+        _, error = await self.db_service.register_guild(guild_id, guild_name)
+        if error:
+            for result in results:
+                result.update(status=IMPORT_FAILED, message=f"길드 등록 실패: {error}")
+            return results
+
+        existing, error = await self.db_service.get_all_users(guild_id)
+        if error:
+            for result in results:
+                result.update(status=IMPORT_FAILED, message=f"유저 목록 조회 실패: {error}")
+            return results
+        registered = {f"{user['nickname']}#{user['tag']}".lower() for user in existing}
+
+        # 형식, 중복, 기존 등록 여부는 API 호출 없이 먼저 걸러냄
+        pending = []
+        seen = set()
+        for result in results:
+            key = result['riot_id'].lower()
+            if not validate_nickname_tag(result['riot_id']):
+                result.update(status=IMPORT_INVALID, message="올바른 닉네임 형식이 아닙니다. (닉네임#태그)")
+            elif key in registered:
+                result.update(status=IMPORT_EXISTS, message="이미 등록된 사용자입니다.")
+            elif key in seen:
+                result.update(status=IMPORT_DUPLICATE, message="목록에 중복된 사용자입니다.")
+            else:
+                seen.add(key)
+                pending.append(result)
+        if on_resolved and len(pending) < len(results):
+            on_resolved(len(results) - len(pending))
+
+        # 계정 확인
+        slots = asyncio.Semaphore(self.concurrency)
+        resolved: List[Dict] = []
+
+        async def resolve(result: Dict) -> None:
+            async with slots:
+                if self.riot_service.unavailable_for(('account', 'summoner')) is not None:
+                    result.update(status=IMPORT_FAILED, message="라이엇 API 장애로 확인하지 못했습니다.")
+                else:
+                    nickname, tag = result['riot_id'].split('#')
+                    basic_info, error = await self.riot_service.get_basic_info(nickname, tag)
+                    if error:
+                        result.update(status=IMPORT_FAILED, message=error)
+                    else:
+                        resolved.append({**basic_info, 'nickname': nickname, 'tag': tag, 'result': result})
+            if on_resolved:
+                on_resolved(1)
+
+        await asyncio.gather(*(resolve(result) for result in pending))
+
+        # 확인된 유저 일괄 등록
+        user_ids, error = await self.db_service.register_users(guild_id, resolved)
+        if error:
+            for user in resolved:
+                user['result'].update(status=IMPORT_FAILED, message=f"사용자 등록 실패: {error}")
+            return results
+
+        if user_ids:
+            self.user_service.invalidate_roster(guild_id)
+
+        for user in resolved:
+            if (user['nickname'], user['tag']) in user_ids:
+                user['result'].update(status=IMPORT_REGISTERED, message="등록 완료 (전적 수집 대기)")
+            else:
+                # 확인하는 동안 다른 명령어로 등록된 유저
+                user['result'].update(status=IMPORT_EXISTS, message="이미 등록된 사용자입니다.")
+
+        # 전적 수집 작업 등록 (실패해도 다음 자동 갱신 때 전체 전적을 수집함)
+        _, error = await self.db_service.enqueue_refresh_jobs(
+            list(user_ids.values()), REFRESH_PRIORITY_REGISTRATION
+        )
+        if error:
+            self.logger.error(f"일괄 등록 전적 수집 작업 등록 실패: {error}")
+
+        self.logger.info(
+            f"길드 {guild_id} 일괄 등록: {len(riot_ids)}개 중 {len(user_ids)}명 등록"
+        )
+        return results
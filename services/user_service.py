@@ -1,10 +1,22 @@
+import asyncio
 import logging
-from typing import Dict, Optional, Tuple, List
+import time
+from typing import Awaitable, Callable, Dict, Optional, Tuple, List
 from .riot_service import RiotService
 from .database_service import DatabaseService
+from .roster_index import RosterIndex
+from .win_probability import game_performance_score
+from utils.constants import RECENT_ACTIVITY_DAYS, REFRESH_PRIORITY_REGISTRATION
 from utils.logging_config import setup_logger
 
 class UserService:
+    # 길드별 명단 검색 인덱스 (모든 인스턴스가 공유하여 등록/삭제 시 함께 무효화)
+    _rosters: Dict[int, RosterIndex] = {}
+
+    # 진행 중인 계정별 전적 갱신 (PUUID → 작업, 갱신 중인 유저 행, 기다리는 호출 수)
+    # 명령어(%전적갱신)와 일일·적응형·워커 갱신이 함께 사용하므로 같은 계정을 동시에 두 번 조회하지 않음
+    _in_flight: Dict[str, Dict] = {}
+
     def __init__(self):
         self.riot_service = RiotService()
         self.db_service = DatabaseService()
@@ -14,7 +26,11 @@ class UserService:
 
 
     async def register_user(self, guild_id: int, guild_name: str, nickname_tag: str) -> Tuple[bool, Optional[str], Optional[Dict]]:
-        """새로운 유저 등록"""
+        """새로운 유저 등록
+
+        Riot ID 확인과 유저 등록만 바로 처리하고, 전적 수집은 갱신 작업 큐에
+        등록 우선순위로 넣어 백그라운드에서 처리합니다. (진행 상태: get_registration_status)
+        """
         try:
             # 길드 등록
             success, error = await self.db_service.register_guild(guild_id, guild_name)
@@ -32,12 +48,10 @@ class UserService:
             if existing_user:
                 return False, "이미 등록된 사용자입니다.", None
             
-            # Riot API로 유저 정보 및 전적 분석 (last_match_time=None으로 전체 데이터 가져오기)
-            basic_info, error, new_matches = await self.riot_service.analyze_aram_performance(nickname, tag)
+            # Riot ID 확인 (매치 조회는 백그라운드 작업에서 처리)
+            basic_info, error = await self.riot_service.get_basic_info(nickname, tag)
             if error:
                 return False, error, None
-            if not basic_info:
-                return False, "게임 데이터를 분석할 수 없습니다.", None
 
             # 기본 유저 정보로 새 유저 등록 (초기 통계는 0으로)
             success, error, user_id = await self.db_service.register_user(
@@ -60,16 +74,12 @@ class UserService:
             if not success:
                 return False, f"사용자 등록 실패: {error}", None
 
-            # 새로운 매치 데이터 저장
-            for match_data in new_matches:
-                success, error = await self.db_service.save_match_record(user_id, match_data)
-                if not success:
-                    self.logger.error(f"매치 저장 실패: {error}")
+            self.invalidate_roster(guild_id)
 
-            # 전체 통계 계산
-            success, error = await self.db_service.update_user_stats_from_db(user_id)
-            if not success:
-                return False, error, None
+            # 전적 수집 작업 등록 (실패해도 다음 자동 갱신 때 전체 전적을 수집함)
+            _, error = await self.db_service.enqueue_refresh_jobs([user_id], REFRESH_PRIORITY_REGISTRATION)
+            if error:
+                self.logger.error(f"유저 {nickname_tag} 전적 수집 작업 등록 실패: {error}")
 
             # 등록된 유저 정보 조회
             user_info, error = await self.db_service.get_user(guild_id, nickname, tag)
@@ -82,11 +92,43 @@ class UserService:
             self.logger.error(f"유저 등록 중 오류 발생: {str(e)}")
             return False, f"유저 등록 중 오류가 발생했습니다: {str(e)}", None
 
+    async def get_registration_status(self, guild_id: int, nickname_tag: str) -> Tuple[Optional[Dict], Optional[Dict], Optional[str]]:
+        """등록된 유저와 등록 후 전적 수집 작업 상태 조회 (작업 기록이 없으면 None)"""
+        try:
+            nickname, tag = nickname_tag.split('#')
+
+            user_info, error = await self.db_service.get_user(guild_id, nickname, tag)
+            if error:
+                return None, None, error
+
+            jobs, error = await self.db_service.get_refresh_jobs([user_info['id']], REFRESH_PRIORITY_REGISTRATION)
+            if error:
+                return None, None, error
+
+            return user_info, jobs.get(user_info['id']), None
+
+        except ValueError:
+            return None, None, "올바른 닉네임 형식이 아닙니다. (닉네임#태그)"
+        except Exception as e:
+            self.logger.error(f"등록 상태 조회 중 오류 발생: {str(e)}")
+            return None, None, f"등록 상태 조회 중 오류가 발생했습니다: {str(e)}"
+
+    async def get_registration_jobs(self, user_ids: List[int]) -> Tuple[Dict[int, Dict], Optional[str]]:
+        """유저별 등록 후 전적 수집 작업 상태 조회"""
+        try:
+            return await self.db_service.get_refresh_jobs(user_ids, REFRESH_PRIORITY_REGISTRATION)
+        except Exception as e:
+            self.logger.error(f"등록 작업 상태 조회 중 오류 발생: {str(e)}")
+            return {}, f"등록 작업 상태 조회 중 오류가 발생했습니다: {str(e)}"
+
     async def delete_user(self, guild_id: int, nickname_tag: str) -> Tuple[bool, Optional[str]]:
         """유저 삭제"""
         try:
             nickname, tag = nickname_tag.split('#')
-            return await self.db_service.delete_user(guild_id, nickname, tag)
+            success, error = await self.db_service.delete_user(guild_id, nickname, tag)
+            if success:
+                self.invalidate_roster(guild_id)
+            return success, error
             
         except ValueError:
             return False, "올바른 닉네임 형식이 아닙니다. (닉네임#태그)"
@@ -114,6 +156,93 @@ class UserService:
             self.logger.error(f"유저 목록 조회 중 오류 발생: {str(e)}")
             return [], f"유저 목록 조회 중 오류가 발생했습니다: {str(e)}"
 
+    async def get_users_page(
+        self,
+        guild_id: int,
+        limit: int,
+        after: Optional[Tuple[str, str]] = None
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """닉네임 순으로 after(닉네임, 태그) 다음 유저 limit 명 조회"""
+        try:
+            return await self.db_service.get_users_page(guild_id, limit, after)
+        except Exception as e:
+            self.logger.error(f"유저 페이지 조회 중 오류 발생: {str(e)}")
+            return [], f"유저 목록 조회 중 오류가 발생했습니다: {str(e)}"
+
+    async def count_users(self, guild_id: int) -> Tuple[int, Optional[str]]:
+        """길드에 등록된 유저 수 조회"""
+        try:
+            return await self.db_service.count_users(guild_id)
+        except Exception as e:
+            self.logger.error(f"유저 수 조회 중 오류 발생: {str(e)}")
+            return 0, f"유저 수 조회 중 오류가 발생했습니다: {str(e)}"
+
+    async def get_roster(self, guild_id: int) -> Tuple[Optional[RosterIndex], Optional[str]]:
+        """최근 활동 순으로 정렬된 길드 명단 검색 인덱스 조회 (캐시 사용)"""
+        roster = self._rosters.get(guild_id)
+        if roster and not roster.expired():
+            return roster, None
+
+        users, error = await self.get_all_users(guild_id)
+        if error:
+            return None, error
+
+        players = [{
+            'discord_id': f"{data['nickname']}#{data['tag']}",
+            'user_id': data['user_id'],
+            'nickname': data['nickname'],
+            'games_played': data['games_played'],
+            'wins': data['wins'],
+            'losses': data['losses'],
+            'avg_kda': data['avg_kda'],
+            'avg_damage_dealt': data['avg_damage_dealt'],
+            'avg_damage_taken': data['avg_damage_taken'],
+            'avg_healing': data['avg_healing'],
+            'avg_cc_score': data.get('avg_cc_score', 0),
+            'balance_score': data.get('balance_score'),
+            'balance_score_version': data.get('balance_score_version')
+        } for data in users]
+
+        # 활동 순위를 못 구해도 닉네임 순으로 사용
+        play_counts, error = await self.get_recent_play_counts(
+            [player['user_id'] for player in players], RECENT_ACTIVITY_DAYS
+        )
+        if error:
+            self.logger.warning(f"길드 {guild_id} 활동 순위 조회 실패: {error}")
+
+        roster = RosterIndex(players, play_counts)
+        self._rosters[guild_id] = roster
+        return roster, None
+
+    @classmethod
+    def invalidate_roster(cls, guild_id: int) -> None:
+        """유저 등록/삭제 후 다음 조회 때 명단을 다시 불러오도록 캐시 제거"""
+        cls._rosters.pop(guild_id, None)
+
+    async def get_recent_performances(self, user_ids: List[int], limit_per_user: int) -> Tuple[Dict[int, List[float]], Optional[str]]:
+        """유저별 최근 게임 성능 점수 조회"""
+        try:
+            records, error = await self.db_service.get_recent_match_records(user_ids, limit_per_user)
+            if error:
+                return {}, error
+
+            return {
+                user_id: [game_performance_score(record) for record in user_records]
+                for user_id, user_records in records.items()
+            }, None
+        except Exception as e:
+            self.logger.error(f"게임 성능 조회 중 오류 발생: {str(e)}")
+            return {}, f"게임 성능 조회 중 오류가 발생했습니다: {str(e)}"
+
+    async def get_recent_play_counts(self, user_ids: List[int], days: int) -> Tuple[Dict[int, int], Optional[str]]:
+        """유저별 최근 days 일 동안의 게임 수 조회"""
+        try:
+            since = int((time.time() - days * 86400) * 1000)
+            return await self.db_service.get_recent_play_counts(user_ids, since)
+        except Exception as e:
+            self.logger.error(f"최근 게임 수 조회 중 오류 발생: {str(e)}")
+            return {}, f"최근 게임 수 조회 중 오류가 발생했습니다: {str(e)}"
+
     async def update_user_match_history(self, guild_id: int, nickname: str, tag: str) -> Tuple[bool, Optional[str], Optional[Dict]]:
         """유저의 매치 히스토리 업데이트"""
         try:
@@ -145,6 +274,9 @@ class UserService:
             if not success:
                 return False, error, None
 
+            # 다음 자동 갱신 시각 설정 (수동 갱신도 포함하여 중복 갱신 방지)
+            await self.db_service.record_refresh([user_info['id']])
+
             # 업데이트된 유저 정보 반환
             updated_user, error = await self.db_service.get_user(guild_id, nickname, tag)
             if error:
@@ -156,16 +288,157 @@ class UserService:
             self.logger.error(f"매치 히스토리 업데이트 중 오류 발생: {str(e)}")
             return False, f"매치 히스토리 업데이트 중 오류가 발생했습니다: {str(e)}", None
 
+    async def _wait_in_flight(self, entry: Dict) -> Dict[int, Tuple[bool, Optional[str], Optional[Dict]]]:
+        """진행 중인 갱신의 결과 대기 (기다리던 호출이 모두 취소되면 갱신도 취소)"""
+        entry['waiters'] += 1
+        try:
+            # 한 호출이 취소되어도 같은 갱신을 기다리는 다른 호출에는 영향이 없도록 shield
+            return await asyncio.shield(entry['task'])
+        except asyncio.CancelledError:
+            if entry['waiters'] == 1:
+                entry['task'].cancel()
+            raise
+        finally:
+            entry['waiters'] -= 1
+
+    async def _refresh_shared(
+        self,
+        puuid: str,
+        users: Dict[int, Tuple[int, str]],
+        run: Callable[[List[int]], Awaitable[Dict[int, Tuple[bool, Optional[str], Optional[Dict]]]]]
+    ) -> Dict[int, Tuple[bool, Optional[str], Optional[Dict]]]:
+        """같은 계정의 갱신이 진행 중이면 그 결과를 함께 사용하고, 아니면 run 으로 갱신
+
+        진행 중인 갱신에 포함된 유저 행은 그 결과를 그대로 사용하고, 포함되지 않은 행은
+        진행 중인 갱신이 끝난 뒤 새로 갱신합니다 (이미 저장된 매치 이후만 조회).
+
+        Parameters:
+            users: user_id → (길드 ID, 소문자 닉네임#태그)
+            run: 갱신할 user_id 목록을 받아 user_id → (성공 여부, 오류 메시지, 유저 정보)를 반환
+        """
+        results = {}
+        pending = dict(users)
+        while pending:
+            entry = self._in_flight.get(puuid)
+            if entry is None:
+                entry = self._in_flight[puuid] = {
+                    'task': asyncio.create_task(run(list(pending))),
+                    'users': dict(pending),
+                    'waiters': 0
+                }
+
+                def forget(_, entry=entry) -> None:
+                    if self._in_flight.get(puuid) is entry:
+                        del self._in_flight[puuid]
+                entry['task'].add_done_callback(forget)
+
+            covered = [user_id for user_id in pending if user_id in entry['users']]
+            outcome = await self._wait_in_flight(entry)
+            for user_id in covered:
+                results[user_id] = outcome.get(user_id, (False, "갱신 결과가 없습니다.", None))
+                del pending[user_id]
+        return results
+
+    async def refresh_account(self, puuid: str, rows: List[Dict]) -> List[Tuple[bool, Optional[str], Optional[Dict]]]:
+        """같은 Riot 계정(PUUID)을 참조하는 모든 유저 행을 한 번의 API 조회로 갱신
+
+        rows 는 get_refresh_targets 결과 중 같은 PUUID 를 가진 행들이며,
+        결과는 rows 와 같은 순서의 (성공 여부, 오류 메시지, 갱신된 유저 정보) 목록입니다.
+        같은 계정의 %전적갱신 이 진행 중이면 그 결과를 함께 사용합니다.
+        """
+        by_id = {row['user_id']: row for row in rows}
+
+        async def run(user_ids: List[int]) -> Dict[int, Tuple[bool, Optional[str], Optional[Dict]]]:
+            outcomes = await self._refresh_account(puuid, [by_id[user_id] for user_id in user_ids])
+            return dict(zip(user_ids, outcomes))
+
+        results = await self._refresh_shared(
+            puuid,
+            {row['user_id']: (row['guild_id'], f"{row['nickname']}#{row['tag']}".lower()) for row in rows},
+            run
+        )
+        return [results[row['user_id']] for row in rows]
+
+    async def _refresh_account(self, puuid: str, rows: List[Dict]) -> List[Tuple[bool, Optional[str], Optional[Dict]]]:
+        try:
+            # 가장 오래된 마지막 매치 시간부터 조회해야 모든 행의 누락을 채울 수 있음
+            last_match_times = [row['last_match_time'] for row in rows]
+            start_time = None if any(t is None for t in last_match_times) else min(last_match_times)
+
+            new_matches, error = await self.riot_service.get_new_matches(puuid, start_time)
+            if error:
+                return [(False, error, None) for _ in rows]
+        except Exception as e:
+            self.logger.error(f"계정 {puuid} 매치 조회 중 오류 발생: {str(e)}")
+            return [(False, f"매치 조회 중 오류가 발생했습니다: {str(e)}", None) for _ in rows]
+
+        results = []
+        for row in rows:
+            try:
+                # 행마다 이미 저장된 매치 이후만 저장
+                for match_data in new_matches:
+                    if row['last_match_time'] is not None and match_data['game_creation'] <= row['last_match_time']:
+                        continue
+                    success, error = await self.db_service.save_match_record(row['user_id'], match_data)
+                    if not success:
+                        self.logger.error(f"매치 저장 실패: {error}")
+
+                # 전체 통계 재계산
+                success, error = await self.db_service.update_user_stats_from_db(row['user_id'])
+                if not success:
+                    results.append((False, error, None))
+                    continue
+
+                updated_user, error = await self.db_service.get_user(row['guild_id'], row['nickname'], row['tag'])
+                results.append((error is None, error, updated_user))
+
+            except Exception as e:
+                self.logger.error(f"유저 {row['nickname']}#{row['tag']} 갱신 중 오류 발생: {str(e)}")
+                results.append((False, f"유저 정보 업데이트 중 오류가 발생했습니다: {str(e)}", None))
+
+        # 갱신 성공한 유저들의 다음 갱신 시각 설정
+        await self.db_service.record_refresh([
+            row['user_id'] for row, (success, _, _) in zip(rows, results) if success
+        ])
+
+        return results
+
+    def is_refreshing(self, guild_id: int, nickname_tag: str) -> bool:
+        """해당 유저의 전적 갱신이 진행 중인지 확인 (명령어·자동 갱신 모두 포함)"""
+        key = (guild_id, nickname_tag.lower())
+        return any(key in entry['users'].values() for entry in self._in_flight.values())
+
     async def update_user_stats(self, guild_id: int, nickname_tag: str) -> Tuple[bool, Optional[str], Optional[Dict]]:
-        """유저 전적 정보 업데이트"""
+        """유저 전적 정보 업데이트
+
+        같은 계정(PUUID)의 갱신이 이미 진행 중이면 (다른 %전적갱신 이든 자동 갱신이든)
+        새로 조회하지 않고 그 결과를 함께 기다립니다.
+        기다리던 호출이 모두 취소되면 진행 중인 갱신도 취소합니다.
+        """
         try:
             nickname, tag = nickname_tag.split('#')
-            
-            # 기존 유저 확인
-            existing_user, error = await self.db_service.get_user(guild_id, nickname, tag)
-            if error:
-                return False, error, None
+        except ValueError:
+            return False, "올바른 닉네임 형식이 아닙니다. (닉네임#태그)", None
+
+        # 기존 유저 확인
+        existing_user, error = await self.db_service.get_user(guild_id, nickname, tag)
+        if error:
+            return False, error, None
+
+        user_id = existing_user['id']
 
+        async def run(_: List[int]) -> Dict[int, Tuple[bool, Optional[str], Optional[Dict]]]:
+            return {user_id: await self._update_user_stats(guild_id, nickname, tag)}
+
+        results = await self._refresh_shared(
+            existing_user.get('puuid') or f"{guild_id}:{nickname_tag.lower()}",
+            {user_id: (guild_id, nickname_tag.lower())},
+            run
+        )
+        return results[user_id]
+
+    async def _update_user_stats(self, guild_id: int, nickname: str, tag: str) -> Tuple[bool, Optional[str], Optional[Dict]]:
+        try:
             # 매치 히스토리 업데이트
             success, error, updated_user = await self.update_user_match_history(
                 guild_id=guild_id,
@@ -178,8 +451,6 @@ class UserService:
 
             return True, None, updated_user
 
-        except ValueError:
-            return False, "올바른 닉네임 형식이 아닙니다. (닉네임#태그)", None
         except Exception as e:
             self.logger.error(f"유저 정보 업데이트 중 오류 발생: {str(e)}")
             return False, f"유저 정보 업데이트 중 오류가 발생했습니다: {str(e)}", None
@@ -0,0 +1,123 @@
+import time
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Tuple
+from services.team_balancer import TeamBalancer
+
+# 시뮬레이션 횟수 (95% 신뢰구간 폭 약 ±1.5%p)
+SIMULATION_COUNT = 4000
+
+# 플레이어별로 사용할 최근 게임 수
+MAX_SAMPLES_PER_PLAYER = 50
+
+# 이보다 게임 수가 적으면 개인 분포 대신 밸런스 점수 + 전체 분산 사용
+MIN_SAMPLES_PER_PLAYER = 3
+
+# 한 번에 계산할 팀 구성 수 (메모리 사용량 상한)
+SPLIT_CHUNK_SIZE = 256
+
+# 95% 신뢰구간 z 값
+CONFIDENCE_Z = 1.96
+
+
+def game_performance_score(record: Dict) -> float:
+    """게임 한 판의 성능 점수 계산
+
+    밸런스 점수 공식은 각 평균값에 대해 선형이므로, 게임별 점수의 평균은
+    user_stats.balance_score 와 같습니다.
+    """
+    return TeamBalancer.calculate_player_score({
+        'games_played': 1,
+        'wins': 1 if record['win'] else 0,
+        'avg_kda': (record['kills'] + record['assists']) / max(record['deaths'], 1),
+        'avg_damage_dealt': record['total_damage_dealt'],
+        'avg_damage_taken': record['total_damage_taken'],
+        'avg_healing': record['total_heal'],
+        'avg_cc_score': record['total_cc_score']
+    })
+
+
+def wilson_interval(p: float, n: int, z: float = CONFIDENCE_Z) -> Tuple[float, float]:
+    """이항 비율의 Wilson 신뢰구간"""
+    if n == 0:
+        return 0.0, 1.0
+    denominator = 1 + z * z / n
+    center = (p + z * z / (2 * n)) / denominator
+    margin = z * np.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denominator
+    # p 가 0 또는 1 이면 부동소수점 오차로 구간이 p 를 벗어나지 않도록 p 를 포함시킴
+    return float(max(0.0, min(p, center - margin))), float(min(1.0, max(p, center + margin)))
+
+
+class WinProbabilityEstimator:
+    def __init__(
+        self,
+        performances: Dict[str, Sequence[float]],
+        simulations: int = SIMULATION_COUNT,
+        seed: Optional[int] = None
+    ):
+        """
+        Parameters:
+            performances: 플레이어 ID별 게임 성능 점수 목록 (game_performance_score 결과)
+            simulations: 시뮬레이션 횟수
+            seed: 난수 시드 (재현이 필요한 경우)
+        """
+        self.performances = {
+            player_id: np.asarray(scores, dtype=np.float64)
+            for player_id, scores in performances.items()
+        }
+        self.simulations = simulations
+        self.rng = np.random.default_rng(seed)
+
+        # 게임 기록이 부족한 플레이어에게 사용할 전체 표준편차
+        pooled = [scores - scores.mean() for scores in self.performances.values() if len(scores) >= 2]
+        self.pooled_std = float(np.concatenate(pooled).std()) if pooled else 10.0
+
+    def sample_matrix(self, players: List[dict]) -> np.ndarray:
+        """플레이어별 게임 성능 샘플 행렬 생성 (플레이어 수 × 시뮬레이션 횟수)"""
+        samples = np.empty((len(players), self.simulations), dtype=np.float64)
+        for row, player in enumerate(players):
+            scores = self.performances.get(player['discord_id'])
+            if scores is not None and len(scores) >= MIN_SAMPLES_PER_PLAYER:
+                # 실제 게임 기록에서 복원 추출 (부트스트랩)
+                samples[row] = self.rng.choice(scores, size=self.simulations, replace=True)
+            else:
+                samples[row] = self.rng.normal(
+                    TeamBalancer.get_player_score(player), self.pooled_std, size=self.simulations
+                )
+        return samples
+
+    def estimate_splits(
+        self,
+        players: List[dict],
+        masks: np.ndarray,
+        deadline: Optional[float] = None
+    ) -> np.ndarray:
+        """여러 팀 구성의 블루팀 승률을 한 번에 계산
+
+        masks 는 (팀 구성 수 × 플레이어 수) 불리언 행렬이며 True 가 블루팀입니다.
+        모든 구성이 같은 샘플을 공유하므로 구성 간 비교의 분산이 작습니다.
+        deadline(time.time() 기준)이 지나면 계산한 앞쪽 구성까지만 반환합니다 (최소 한 묶음).
+        """
+        samples = self.sample_matrix(players)
+        total = samples.sum(axis=0)
+        masks = np.asarray(masks, dtype=np.float64)
+
+        # (구성 수 × 시뮬레이션 횟수) 행렬이 커지지 않도록 나누어 계산
+        probabilities = np.empty(len(masks), dtype=np.float64)
+        for start in range(0, len(masks), SPLIT_CHUNK_SIZE):
+            blue = masks[start:start + SPLIT_CHUNK_SIZE] @ samples
+            red = total - blue
+            # 동점은 절반씩 승리로 처리
+            probabilities[start:start + SPLIT_CHUNK_SIZE] = (
+                (blue > red).mean(axis=1) + 0.5 * (blue == red).mean(axis=1)
+            )
+            if deadline is not None and time.time() >= deadline:
+                return probabilities[:start + SPLIT_CHUNK_SIZE]
+        return probabilities
+
+    def estimate(self, team1: List[dict], team2: List[dict]) -> Tuple[float, Tuple[float, float]]:
+        """블루팀(team1) 승률과 95% 신뢰구간 반환"""
+        players = list(team1) + list(team2)
+        mask = np.zeros((1, len(players)), dtype=bool)
+        mask[0, :len(team1)] = True
+        p = float(self.estimate_splits(players, mask)[0])
+        return p, wilson_interval(p, self.simulations)
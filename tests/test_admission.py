@@ -0,0 +1,87 @@
+import pytest
+
+from utils import admission
+from utils.admission import AdmissionController, AdmissionDenied, TokenBucket
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(admission.time, 'monotonic', lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def controller(monkeypatch, clock):
+    """빈 버킷 목록과 테스트용 한도 (유저 2개/10초, 길드 3개/5초)"""
+    monkeypatch.setattr(AdmissionController, '_buckets', {})
+    monkeypatch.setattr(admission, 'COMMAND_LIMITS', {'cmd': ((2, 10), (3, 5))})
+    return AdmissionController
+
+
+def test_bucket_refills_one_token_per_period(clock):
+    bucket = TokenBucket(2, 10)
+    bucket.consume()
+    bucket.consume()
+
+    assert bucket.retry_after() == pytest.approx(10)
+    clock[0] += 4
+    assert bucket.retry_after() == pytest.approx(6)
+    clock[0] += 6
+    assert bucket.retry_after() is None
+
+    # 오래 쉬어도 capacity 이상 쌓이지 않음
+    clock[0] += 100
+    bucket.retry_after()
+    assert bucket.tokens == 2
+
+
+def test_user_limit_denies_with_retry_after(controller, clock):
+    controller.admit('cmd', user_id=1, guild_id=10)
+    controller.admit('cmd', user_id=1, guild_id=10)
+
+    with pytest.raises(AdmissionDenied) as denied:
+        controller.admit('cmd', user_id=1, guild_id=10)
+    assert denied.value.scope == 'user'
+    assert denied.value.retry_after == pytest.approx(10)
+
+    # 다른 유저는 같은 길드에서 계속 사용 가능
+    controller.admit('cmd', user_id=2, guild_id=10)
+
+
+def test_guild_denial_does_not_consume_user_token(controller, clock):
+    for user_id in (2, 3, 4):
+        controller.admit('cmd', user_id=user_id, guild_id=10)
+
+    with pytest.raises(AdmissionDenied) as denied:
+        controller.admit('cmd', user_id=1, guild_id=10)
+    assert denied.value.scope == 'guild'
+
+    # 길드 토큰이 다시 차면 유저 1은 두 번 모두 사용할 수 있어야 함
+    clock[0] += 5
+    controller.admit('cmd', user_id=1, guild_id=10)
+    clock[0] += 5
+    controller.admit('cmd', user_id=1, guild_id=10)
+
+
+def test_unlimited_command_is_always_admitted(controller):
+    for _ in range(10):
+        controller.admit('other', user_id=1, guild_id=10)
+    assert controller._buckets == {}
+
+
+def test_full_buckets_are_evicted(controller, clock, monkeypatch):
+    monkeypatch.setattr(admission, 'MAX_BUCKETS', 4)
+    for user_id in range(4):
+        controller.admit('cmd', user_id=user_id, guild_id=None)
+
+    # 유저 0~3 의 버킷은 다시 가득 차고, 유저 4 는 토큰을 모두 사용
+    clock[0] += 10
+    controller.admit('cmd', user_id=4, guild_id=None)
+    controller.admit('cmd', user_id=4, guild_id=None)
+
+    controller.admit('cmd', user_id=5, guild_id=None)
+
+    assert {key[2] for key in controller._buckets} == {4, 5}
+    with pytest.raises(AdmissionDenied):
+        controller.admit('cmd', user_id=4, guild_id=None)
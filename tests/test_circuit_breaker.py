@@ -0,0 +1,95 @@
+import pytest
+
+from utils import circuit_breaker
+from utils.circuit_breaker import CircuitBreaker
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """time.monotonic 대신 직접 움직이는 시계"""
+    now = [1000.0]
+    monkeypatch.setattr(circuit_breaker.time, 'monotonic', lambda: now[0])
+    return now
+
+
+def test_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker('match', failure_threshold=3, reset_timeout=30)
+
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+    assert breaker.retry_after() == pytest.approx(30)
+
+
+def test_success_resets_failure_count(clock):
+    breaker = CircuitBreaker('match', failure_threshold=2)
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_trip_opens_immediately(clock):
+    breaker = CircuitBreaker('account', failure_threshold=5)
+
+    breaker.record_failure(trip=True)
+
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_half_open_allows_single_probe(clock):
+    breaker = CircuitBreaker('match', failure_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+
+    clock[0] += 30
+    assert breaker.retry_after() is None
+    assert breaker.allow()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+    # 시험 호출 결과가 나오기 전에는 다른 호출을 막음
+    assert not breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow()
+
+
+def test_failed_probe_doubles_timeout_up_to_max(clock):
+    breaker = CircuitBreaker('match', failure_threshold=1, reset_timeout=30, max_reset_timeout=100)
+    breaker.record_failure()
+
+    for expected in (60, 100, 100):
+        clock[0] += breaker.reset_timeout
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.reset_timeout == expected
+
+    clock[0] += breaker.reset_timeout
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.reset_timeout == 30
+
+
+def test_neutral_response_releases_probe_without_counting(clock):
+    breaker = CircuitBreaker('match', failure_threshold=2, reset_timeout=30)
+    breaker.record_failure()
+    breaker.record_neutral()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.failures == 1
+
+    breaker.record_failure()
+    clock[0] += 30
+    assert breaker.allow()
+    breaker.record_neutral()
+
+    # 시험 호출이 호출 한도 초과로 끝나면 다시 시험 호출을 허용
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow()
@@ -0,0 +1,92 @@
+import asyncio
+import time
+
+from utils.fair_share import FairShareLimiter, current_guild
+
+
+class InstantLimiter:
+    """호출 한도가 없는 Rate Limiter"""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def acquire(self):
+        self.calls += 1
+        await asyncio.sleep(0)
+
+
+async def acquire_as(fair_share, guild_id, order=None):
+    current_guild.set(guild_id)
+    await fair_share.acquire()
+    if order is not None:
+        order.append(guild_id)
+
+
+def test_dispatch_order_follows_weights():
+    async def run():
+        fair_share = FairShareLimiter(InstantLimiter())
+        fair_share.configure('big', weight=2)
+        fair_share.configure('small', weight=1)
+        order = []
+        tasks = [asyncio.create_task(acquire_as(fair_share, guild_id, order))
+                 for guild_id in ['big'] * 8 + ['small'] * 8]
+        await asyncio.gather(*tasks)
+        return order
+
+    order = asyncio.run(run())
+
+    # 두 길드가 모두 기다리는 동안에는 가중치 2:1 로 번갈아 배분
+    assert order[:9].count('big') == 6
+    assert order[:9].count('small') == 3
+    assert order[:2] == ['big', 'small']
+
+
+def test_guild_over_quota_waits_for_window():
+    async def run():
+        fair_share = FairShareLimiter(InstantLimiter(), window=0.3)
+        fair_share.configure('limited', quota=2)
+        start = time.monotonic()
+        finished = []
+
+        async def timed():
+            await acquire_as(fair_share, 'limited')
+            finished.append(time.monotonic() - start)
+
+        # 한도에 걸린 동안에도 다른 길드는 바로 호출
+        await asyncio.gather(*(timed() for _ in range(3)), acquire_as(fair_share, 'other'))
+        other_usage = fair_share.usage()['other']['requests']
+        return finished, other_usage
+
+    finished, other_usage = asyncio.run(run())
+
+    assert finished[0] < 0.1 and finished[1] < 0.1
+    assert finished[2] >= 0.29
+    assert other_usage == 1
+
+
+def test_cancelled_waiter_does_not_get_a_slot():
+    class GatedLimiter:
+        def __init__(self):
+            self.gate = asyncio.Event()
+
+        async def acquire(self):
+            await self.gate.wait()
+
+    async def run():
+        limiter = GatedLimiter()
+        fair_share = FairShareLimiter(limiter)
+        first = asyncio.create_task(acquire_as(fair_share, 'guild'))
+        second = asyncio.create_task(acquire_as(fair_share, 'guild'))
+        # 배분기가 첫 번째 요청을 위해 Rate Limiter 를 기다리는 중에 취소
+        for _ in range(5):
+            await asyncio.sleep(0)
+        first.cancel()
+        limiter.gate.set()
+        await asyncio.wait_for(second, timeout=1)
+        return first, fair_share.usage()['guild']
+
+    first, usage = asyncio.run(run())
+
+    assert first.cancelled()
+    assert usage['requests'] == 1
+    assert usage['waiting'] == 0
@@ -0,0 +1,22 @@
+import asyncio
+
+from utils import rate_limiter
+from utils.rate_limiter import RateLimiter
+
+
+def test_pause_blocks_requests_until_retry_after(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(rate_limiter.time, 'monotonic', lambda: now[0])
+    limiter = RateLimiter(requests_per_second=20, requests_per_two_minutes=100)
+
+    limiter.pause(5)
+    assert limiter.available() == 0
+
+    async def fake_sleep(seconds):
+        now[0] += seconds
+
+    monkeypatch.setattr(rate_limiter.asyncio, 'sleep', fake_sleep)
+    asyncio.run(limiter.acquire())
+
+    assert now[0] == 1005.0
+    assert limiter.available() == 19
@@ -0,0 +1,86 @@
+from datetime import datetime, time
+
+import pytz
+
+from services.refresh_planner import (
+    MINUTES_PER_DAY,
+    MIN_WINDOW_MINUTES,
+    _overlaps,
+    estimate_window_minutes,
+    plan_refresh_windows,
+    resolve_timezone,
+)
+
+NOW = pytz.utc.localize(datetime(2026, 1, 15, 12, 0))
+
+
+def utc_window(guild, start):
+    """현지 시작 시각을 UTC 기준 (시작 분, 길이) 로 변환"""
+    tz = resolve_timezone(guild.get('refresh_timezone'))
+    offset = int(NOW.astimezone(tz).utcoffset().total_seconds() // 60)
+    return (start.hour * 60 + start.minute - offset) % MINUTES_PER_DAY, estimate_window_minutes(guild)
+
+
+def assert_no_overlap(guilds, windows):
+    placed = [utc_window(guild, windows[guild['guild_id']]) for guild in guilds]
+    for i, (start1, length1) in enumerate(placed):
+        for start2, length2 in placed[i + 1:]:
+            assert not _overlaps(start1, length1, start2, length2)
+
+
+def test_window_length_uses_last_duration_or_user_count():
+    assert estimate_window_minutes({'last_duration': 600}) == 12
+    assert estimate_window_minutes({'user_count': 100}) == 6
+    assert estimate_window_minutes({'user_count': 0}) == MIN_WINDOW_MINUTES
+
+
+def test_overlaps_wraps_around_midnight():
+    assert _overlaps(23 * 60 + 50, 20, 0, 5)
+    assert not _overlaps(23 * 60 + 50, 10, 0, 5)
+
+
+def test_unknown_timezone_falls_back_to_default():
+    assert resolve_timezone('Not/AZone').zone == 'Asia/Seoul'
+
+
+def test_single_guild_gets_preferred_time():
+    windows = plan_refresh_windows([{'guild_id': 1, 'user_count': 50}], NOW)
+
+    assert windows == {1: time(6, 0)}
+
+
+def test_same_timezone_guilds_are_staggered():
+    guilds = [{'guild_id': i, 'user_count': 200} for i in range(1, 5)]
+
+    windows = plan_refresh_windows(guilds, NOW)
+
+    assert len(set(windows.values())) == 4
+    assert_no_overlap(guilds, windows)
+
+
+def test_guilds_in_different_timezones_do_not_overlap():
+    # 서울 06:00 와 도쿄 06:00 는 UTC 로 같은 시각
+    guilds = [
+        {'guild_id': 1, 'refresh_timezone': 'Asia/Seoul', 'last_duration': 1800},
+        {'guild_id': 2, 'refresh_timezone': 'Asia/Tokyo', 'last_duration': 1800},
+        {'guild_id': 3, 'refresh_timezone': 'America/Los_Angeles', 'last_duration': 1800},
+    ]
+
+    windows = plan_refresh_windows(guilds, NOW)
+
+    assert_no_overlap(guilds, windows)
+    assert windows[3] == time(6, 0)
+
+
+def test_fixed_window_is_kept_and_avoided():
+    guilds = [
+        {'guild_id': 1, 'refresh_window_start': time(6, 0), 'last_duration': 3600},
+        {'guild_id': 2, 'last_duration': 600},
+    ]
+
+    windows = plan_refresh_windows(guilds, NOW)
+
+    assert windows[1] == time(6, 0)
+    # 06:00 부터 72분(60분 x 1.2) 구간 뒤의 다음 5분 단위
+    assert windows[2] == time(7, 15)
+    assert_no_overlap(guilds, windows)
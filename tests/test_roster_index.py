@@ -0,0 +1,53 @@
+from services.roster_index import RosterIndex
+
+
+def make_roster():
+    players = [
+        {'discord_id': discord_id, 'user_id': user_id}
+        for user_id, discord_id in enumerate([
+            'Faker#KR1', 'fakeuser#0001', 'Zeus#KR', 'faint#ABC', 'Gumayusi#KR', 'Keria#KR'
+        ])
+    ]
+    # Faker(0) 5판, faint(3) 9판, fakeuser(1) 1판, 나머지는 기록 없음
+    return RosterIndex(players, play_counts={0: 5, 3: 9, 1: 1})
+
+
+def ids(players):
+    return [player['discord_id'] for player in players]
+
+
+def test_players_sorted_by_activity_then_name():
+    roster = make_roster()
+
+    assert ids(roster.players) == [
+        'faint#ABC', 'Faker#KR1', 'fakeuser#0001', 'Gumayusi#KR', 'Keria#KR', 'Zeus#KR'
+    ]
+
+
+def test_prefix_search_ignores_case():
+    roster = make_roster()
+
+    assert ids(roster.search('FAK')) == ['Faker#KR1', 'fakeuser#0001']
+    assert ids(roster.search('  zeus#kr ')) == ['Zeus#KR']
+
+
+def test_prefix_search_returns_activity_order():
+    roster = make_roster()
+
+    # 사전 순으로는 faint < faker < fakeuser 이지만 결과는 최근 게임 수 순
+    assert ids(roster.search('fa')) == ['faint#ABC', 'Faker#KR1', 'fakeuser#0001']
+
+
+def test_prefix_search_stops_at_first_non_match():
+    roster = make_roster()
+
+    assert roster.search('faker#kr2') == []
+    assert roster.search('zz') == []
+
+
+def test_empty_prefix_returns_full_roster():
+    roster = make_roster()
+
+    assert roster.search('') == roster.players
+    assert roster.search('   ') == roster.players
+    assert len(roster) == 6
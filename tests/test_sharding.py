@@ -0,0 +1,21 @@
+import pytest
+
+from utils.sharding import parse_shard_ids, shard_share
+
+
+def test_parse_shard_ids():
+    assert parse_shard_ids(None) is None
+    assert parse_shard_ids(' ') is None
+    assert parse_shard_ids('0-3') == [0, 1, 2, 3]
+    assert parse_shard_ids('5, 0-2,2') == [0, 1, 2, 5]
+
+
+def test_parse_shard_ids_rejects_reversed_range():
+    with pytest.raises(ValueError):
+        parse_shard_ids('3-1')
+
+
+def test_shard_share():
+    assert shard_share(None, 8) == 1.0
+    assert shard_share([0, 1], None) == 1.0
+    assert shard_share([0, 1], 8) == 0.25
@@ -0,0 +1,112 @@
+import itertools
+import random
+import time
+
+import pytest
+
+from services.team_balancer import TeamBalancer, BALANCE_SCORE_VERSION
+
+
+def make_players(scores):
+    return [
+        {'discord_id': f"p{i}", 'balance_score': score, 'balance_score_version': BALANCE_SCORE_VERSION}
+        for i, score in enumerate(scores)
+    ]
+
+
+def ids(team):
+    return {p['discord_id'] for p in team}
+
+
+def diff(team1, team2):
+    return abs(sum(p['total_score'] for p in team1) - sum(p['total_score'] for p in team2))
+
+
+def brute_force_optimum(players, together=(), apart=()):
+    """조건을 만족하는 구성 중 최소 점수 차이 (전수 탐색)"""
+    scores = [p['balance_score'] for p in players]
+    total = sum(scores)
+    best = None
+    for team1 in itertools.combinations(range(len(players)), len(players) // 2):
+        members = {players[i]['discord_id'] for i in team1}
+        if any((a in members) != (b in members) for a, b in together):
+            continue
+        if any((a in members) == (b in members) for a, b in apart):
+            continue
+        value = abs(2 * sum(scores[i] for i in team1) - total)
+        best = value if best is None else min(best, value)
+    return best
+
+
+def test_unconstrained_split_is_optimal():
+    rng = random.Random(7)
+    players = make_players([round(rng.uniform(20, 70), 2) for _ in range(10)])
+
+    team1, team2 = TeamBalancer.balance_teams(players)
+
+    assert len(team1) == 5 and len(team2) == 5
+    assert diff(team1, team2) == pytest.approx(brute_force_optimum(players))
+
+
+def test_odd_roster_sizes():
+    players = make_players([50, 40, 30, 20, 10])
+
+    team1, team2 = TeamBalancer.balance_teams(players)
+
+    assert sorted((len(team1), len(team2))) == [2, 3]
+    assert ids(team1) | ids(team2) == {p['discord_id'] for p in players}
+
+
+def test_together_and_apart_are_respected():
+    rng = random.Random(11)
+    players = make_players([round(rng.uniform(20, 70), 2) for _ in range(10)])
+    together = [('p0', 'p1'), ('p1', 'p2')]
+    apart = [('p0', 'p3'), ('p4', 'p5')]
+
+    team1, team2 = TeamBalancer.balance_teams(players, together=together, apart=apart)
+
+    for team in (team1, team2):
+        members = ids(team)
+        assert all((a in members) == (b in members) for a, b in together)
+        assert all((a in members) != (b in members) for a, b in apart)
+    assert diff(team1, team2) == pytest.approx(brute_force_optimum(players, together, apart))
+
+
+def test_contradictory_constraints_raise():
+    players = make_players([50, 40, 30, 20])
+
+    with pytest.raises(ValueError):
+        TeamBalancer.balance_teams(players, together=[('p0', 'p1')], apart=[('p1', 'p0')])
+
+
+def test_oversized_group_is_infeasible():
+    players = make_players([50, 40, 30, 20])
+
+    # 4명 중 3명을 같은 팀에 둘 수 없음
+    with pytest.raises(ValueError):
+        TeamBalancer.balance_teams(players, together=[('p0', 'p1'), ('p1', 'p2')])
+
+
+def test_unknown_player_raises():
+    players = make_players([50, 40, 30, 20])
+
+    with pytest.raises(ValueError):
+        TeamBalancer.balance_teams(players, apart=[('p0', 'nobody')])
+
+
+def test_iter_feasible_splits_skips_mirrored_splits():
+    players = make_players([50, 40, 30, 20, 10, 0])
+
+    splits = list(TeamBalancer.iter_feasible_splits(players, apart=[('p0', 'p1')]))
+
+    # 대칭 해를 제외한 C(6,3)/2 = 10 개 중 p0, p1 이 같은 팀인 4 개 제외
+    assert len(splits) == 6
+    assert all(not ({0, 1} <= set(split)) for split in splits)
+
+
+def test_expired_deadline_still_returns_teams():
+    players = make_players([round(random.Random(3).uniform(20, 70), 2) for _ in range(20)])
+
+    team1, team2 = TeamBalancer.balance_teams(players, deadline=time.time() - 1)
+
+    assert len(team1) == 10 and len(team2) == 10
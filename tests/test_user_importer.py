@@ -0,0 +1,120 @@
+import asyncio
+
+import pytest
+
+from services.user_importer import (
+    IMPORT_DUPLICATE,
+    IMPORT_EXISTS,
+    IMPORT_FAILED,
+    IMPORT_INVALID,
+    IMPORT_REGISTERED,
+    MAX_IMPORT_ROWS,
+    UserImporter,
+    parse_riot_ids,
+)
+
+
+class FakeRiotService:
+    def __init__(self, missing=()):
+        self.missing = set(missing)
+        self.lookups = []
+
+    def unavailable_for(self, endpoints):
+        return None
+
+    async def get_basic_info(self, nickname, tag):
+        self.lookups.append(f"{nickname}#{tag}")
+        if f"{nickname}#{tag}" in self.missing:
+            return None, "소환사를 찾을 수 없습니다."
+        return {'puuid': f"puuid-{nickname}", 'summoner_id': nickname, 'account_id': nickname,
+                'summoner_level': 100}, None
+
+
+class FakeDatabaseService:
+    def __init__(self, existing=()):
+        self.existing = [{'nickname': n, 'tag': t} for n, t in (riot_id.split('#') for riot_id in existing)]
+        self.enqueued = []
+
+    async def register_guild(self, guild_id, guild_name):
+        return True, None
+
+    async def get_all_users(self, guild_id):
+        return self.existing, None
+
+    async def register_users(self, guild_id, users):
+        return {(user['nickname'], user['tag']): i + 1 for i, user in enumerate(users)}, None
+
+    async def enqueue_refresh_jobs(self, user_ids, priority):
+        self.enqueued.extend(user_ids)
+        return len(user_ids), None
+
+
+class FakeUserService:
+    def __init__(self, db_service, riot_service):
+        self.db_service = db_service
+        self.riot_service = riot_service
+        self.invalidated = []
+
+    def invalidate_roster(self, guild_id):
+        self.invalidated.append(guild_id)
+
+
+def run_import(riot_ids, existing=(), missing=()):
+    riot_service = FakeRiotService(missing)
+    user_service = FakeUserService(FakeDatabaseService(existing), riot_service)
+    results = asyncio.run(UserImporter(user_service).import_users(1, "guild", riot_ids))
+    return {result['riot_id']: result['status'] for result in results}, riot_service, user_service
+
+
+def test_parse_list_and_csv():
+    assert parse_riot_ids("Faker#KR1, Zeus#KR\nKeria#KR") == ['Faker#KR1', 'Zeus#KR', 'Keria#KR']
+    csv_text = "nickname_tag,memo\nFaker#KR1,mid\n\"Gumayusi#KR\",adc\n"
+    assert parse_riot_ids(csv_text) == ['Faker#KR1', 'Gumayusi#KR']
+
+
+def test_parse_skips_cells_without_tag():
+    assert parse_riot_ids("Faker, Zeus#KR,,  \n\n") == ['Zeus#KR']
+    assert parse_riot_ids("") == []
+
+
+def test_malformed_ids_are_rejected_without_lookup():
+    statuses, riot_service, _ = run_import(['Faker#KR1', 'bad#', '#KR', 'a#b#c', 'We!rd#KR'])
+
+    assert statuses == {
+        'Faker#KR1': IMPORT_REGISTERED,
+        'bad#': IMPORT_INVALID,
+        '#KR': IMPORT_INVALID,
+        'a#b#c': IMPORT_INVALID,
+        'We!rd#KR': IMPORT_INVALID,
+    }
+    assert riot_service.lookups == ['Faker#KR1']
+
+
+def test_duplicates_and_existing_users_are_skipped():
+    riot_ids = ['Faker#KR1', 'faker#kr1', 'Zeus#KR', 'Keria#KR']
+    riot_service = FakeRiotService()
+    user_service = FakeUserService(FakeDatabaseService(existing=['zeus#kr']), riot_service)
+
+    results = asyncio.run(UserImporter(user_service).import_users(1, "guild", riot_ids))
+
+    assert [result['status'] for result in results] == [
+        IMPORT_REGISTERED, IMPORT_DUPLICATE, IMPORT_EXISTS, IMPORT_REGISTERED
+    ]
+    assert sorted(riot_service.lookups) == ['Faker#KR1', 'Keria#KR']
+    assert user_service.db_service.enqueued == [1, 2]
+    assert user_service.invalidated == [1]
+
+
+def test_failed_lookup_is_reported_per_row():
+    statuses, _, _ = run_import(['Faker#KR1', 'Nobody#KR'], missing=['Nobody#KR'])
+
+    assert statuses == {'Faker#KR1': IMPORT_REGISTERED, 'Nobody#KR': IMPORT_FAILED}
+
+
+def test_row_cap():
+    riot_ids = [f"player{i}#KR" for i in range(MAX_IMPORT_ROWS)]
+    statuses, _, _ = run_import(riot_ids)
+    assert set(statuses.values()) == {IMPORT_REGISTERED}
+
+    with pytest.raises(ValueError):
+        run_import(riot_ids + ['extra#KR'])
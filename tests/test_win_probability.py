@@ -0,0 +1,105 @@
+import time
+
+import numpy as np
+import pytest
+
+from services import win_probability
+from services.team_balancer import TeamBalancer, BALANCE_SCORE_VERSION
+from services.win_probability import WinProbabilityEstimator, wilson_interval
+
+
+def make_players(scores):
+    return [
+        {'discord_id': f"p{i}", 'balance_score': score, 'balance_score_version': BALANCE_SCORE_VERSION}
+        for i, score in enumerate(scores)
+    ]
+
+
+def performances(players, spread=5.0, games=20):
+    rng = np.random.default_rng(0)
+    return {
+        p['discord_id']: list(rng.normal(p['balance_score'], spread, size=games))
+        for p in players
+    }
+
+
+def test_lopsided_split_is_far_from_even():
+    players = make_players([70, 68, 66, 64, 62, 30, 28, 26, 24, 22])
+    estimator = WinProbabilityEstimator(performances(players), seed=1)
+
+    p, (low, high) = estimator.estimate(players[:5], players[5:])
+
+    assert p > 0.99
+    assert low <= p <= high
+
+
+def test_estimate_is_reproducible_with_seed():
+    players = make_players([50, 48, 46, 44, 42, 52, 47, 45, 43, 41])
+    perf = performances(players, spread=15.0)
+
+    first = WinProbabilityEstimator(perf, seed=7).estimate(players[:5], players[5:])
+    second = WinProbabilityEstimator(perf, seed=7).estimate(players[:5], players[5:])
+
+    assert first == second
+    assert first[1][0] <= first[0] <= first[1][1]
+
+
+def test_wilson_interval_bounds():
+    assert wilson_interval(0.5, 0) == (0.0, 1.0)
+    low, high = wilson_interval(1.0, 4000)
+    assert low < 1.0 and high == 1.0
+
+
+def test_estimate_splits_stops_after_first_chunk_past_deadline(monkeypatch):
+    monkeypatch.setattr(win_probability, 'SPLIT_CHUNK_SIZE', 4)
+    players = make_players([50, 40, 30, 20, 10, 0])
+    masks = np.zeros((10, len(players)), dtype=bool)
+    masks[:, :3] = True
+    estimator = WinProbabilityEstimator(performances(players), simulations=100, seed=0)
+
+    assert len(estimator.estimate_splits(players, masks)) == 10
+    assert len(estimator.estimate_splits(players, masks, deadline=time.time() - 1)) == 4
+
+
+class FixedEstimator:
+    """팀 구성마다 정해진 승률을 돌려주는 estimator"""
+
+    def __init__(self, probabilities):
+        self.probabilities = probabilities
+
+    def estimate_splits(self, players, masks, deadline=None):
+        return np.array([
+            self.probabilities.get(tuple(i for i, blue in enumerate(mask) if blue), 0.9)
+            for mask in masks
+        ])
+
+
+def test_win_probability_balancing_picks_closest_to_even():
+    players = make_players([50, 40, 30, 20])
+    # 대칭 해를 제외한 구성: (0,1), (0,2), (0,3)
+    estimator = FixedEstimator({(0, 1): 0.8, (0, 2): 0.45, (0, 3): 0.53})
+
+    team1, team2 = TeamBalancer.balance_teams(players, estimator=estimator)
+
+    assert {p['discord_id'] for p in team1} == {'p0', 'p3'}
+
+
+def test_win_probability_balancing_breaks_ties_by_score_diff():
+    players = make_players([50, 40, 30, 20])
+    estimator = FixedEstimator({(0, 1): 0.5, (0, 2): 0.5, (0, 3): 0.5})
+
+    team1, team2 = TeamBalancer.balance_teams(players, estimator=estimator)
+
+    assert {p['discord_id'] for p in team1} == {'p0', 'p3'}
+
+
+def test_win_probability_balancing_respects_constraints():
+    players = make_players([50, 40, 30, 20])
+    estimator = FixedEstimator({(0, 1): 0.8, (0, 2): 0.45, (0, 3): 0.5})
+
+    team1, _ = TeamBalancer.balance_teams(players, apart=[('p0', 'p3')], estimator=estimator)
+
+    assert {p['discord_id'] for p in team1} == {'p0', 'p2'}
+
+    with pytest.raises(ValueError):
+        TeamBalancer.balance_teams(players, together=[('p0', 'p1')], apart=[('p1', 'p0')], estimator=estimator)
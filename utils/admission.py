@@ -0,0 +1,103 @@
+import time
+from typing import Dict, Hashable, Optional, Tuple
+from discord.ext import commands
+
+# 명령어별 (유저 한도, 길드 한도) - 한도는 (버킷 크기, 토큰 하나가 다시 차는 시간(초))
+# Riot API 를 많이 사용하는 명령어만 제한합니다.
+COMMAND_LIMITS: Dict[str, Tuple[Tuple[int, float], Tuple[int, float]]] = {
+    '전적갱신': ((3, 20), (20, 3)),
+    '유저등록': ((5, 12), (30, 2)),
+    '유저일괄등록': ((1, 300), (1, 300)),
+    '게임생성': ((3, 20), (6, 10)),
+}
+
+# 버킷이 이 수를 넘으면 가득 찬(오래 사용하지 않은) 버킷을 정리
+MAX_BUCKETS = 5000
+
+
+class TokenBucket:
+    def __init__(self, capacity: int, refill_seconds: float):
+        """capacity 개까지 모아 둘 수 있고 refill_seconds 마다 하나씩 다시 차는 토큰 버킷"""
+        self.capacity = capacity
+        self.refill_seconds = refill_seconds
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) / self.refill_seconds)
+        self.updated_at = now
+
+    def retry_after(self, now: Optional[float] = None) -> Optional[float]:
+        """토큰이 없으면 하나가 찰 때까지 남은 시간(초), 있으면 None"""
+        self._refill(time.monotonic() if now is None else now)
+        if self.tokens >= 1:
+            return None
+        return (1 - self.tokens) * self.refill_seconds
+
+    def consume(self) -> None:
+        self.tokens -= 1
+
+    def full(self, now: float) -> bool:
+        self._refill(now)
+        return self.tokens >= self.capacity
+
+
+class AdmissionDenied(commands.CheckFailure):
+    def __init__(self, scope: str, retry_after: float):
+        """명령어 사용 한도 초과 (scope: 'user' 또는 'guild')"""
+        self.scope = scope
+        self.retry_after = retry_after
+        super().__init__(f"{scope} 사용 한도 초과 ({retry_after:.0f}초 후 재시도)")
+
+
+class AdmissionController:
+    # (명령어, 범위, ID) → 토큰 버킷 (모든 코그가 공유)
+    _buckets: Dict[Tuple[str, str, Hashable], TokenBucket] = {}
+
+    @classmethod
+    def _bucket(cls, command: str, scope: str, key: Hashable, limit: Tuple[int, float]) -> TokenBucket:
+        bucket = cls._buckets.get((command, scope, key))
+        if bucket is None:
+            bucket = cls._buckets[(command, scope, key)] = TokenBucket(*limit)
+        return bucket
+
+    @classmethod
+    def admit(cls, command: str, user_id: int, guild_id: Optional[int]) -> None:
+        """유저와 길드 버킷에 모두 토큰이 있을 때만 하나씩 사용 (없으면 AdmissionDenied)
+
+        한쪽만 부족해도 어느 토큰도 사용하지 않으므로, 길드 한도에 걸린 요청이
+        유저 한도를 깎지 않습니다.
+        """
+        limits = COMMAND_LIMITS.get(command)
+        if limits is None:
+            return
+
+        now = time.monotonic()
+        if len(cls._buckets) > MAX_BUCKETS:
+            # 가득 찬 버킷은 새로 만든 것과 같으므로 지워도 한도가 바뀌지 않음
+            for key in [key for key, bucket in cls._buckets.items() if bucket.full(now)]:
+                del cls._buckets[key]
+
+        user_limit, guild_limit = limits
+        buckets = [('user', cls._bucket(command, 'user', user_id, user_limit))]
+        if guild_id is not None:
+            buckets.append(('guild', cls._bucket(command, 'guild', guild_id, guild_limit)))
+
+        for scope, bucket in buckets:
+            retry_after = bucket.retry_after(now)
+            if retry_after is not None:
+                raise AdmissionDenied(scope, retry_after)
+        for _, bucket in buckets:
+            bucket.consume()
+
+
+def admission_control():
+    """COMMAND_LIMITS 에 따라 명령어 사용 횟수를 유저·길드별로 제한하는 check"""
+    async def predicate(ctx: commands.Context) -> bool:
+        AdmissionController.admit(
+            ctx.command.name,
+            ctx.author.id,
+            ctx.guild.id if ctx.guild else None
+        )
+        return True
+    return commands.check(predicate)
@@ -0,0 +1,87 @@
+import time
+import logging
+from typing import Optional
+
+
+class CircuitBreaker:
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30,
+        max_reset_timeout: float = 600
+    ):
+        """연속 실패가 쌓이면 호출을 차단하고, 일정 시간 뒤 한 번의 시험 호출로 복구 여부 확인
+
+        Parameters:
+            name: 로그에 표시할 이름 (엔드포인트)
+            failure_threshold: 차단(open)으로 전환할 연속 실패 수
+            reset_timeout: 차단 후 시험 호출까지 대기 시간(초)
+            max_reset_timeout: 시험 호출이 계속 실패할 때 늘어나는 대기 시간의 상한(초)
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.base_reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+
+        self.state = self.CLOSED
+        self.failures = 0
+        self.reset_timeout = reset_timeout
+        self.opened_at = 0.0
+        self._probing = False
+
+        self.logger = logging.getLogger(__name__)
+
+    def retry_after(self) -> Optional[float]:
+        """호출이 차단된 경우 시험 호출이 가능해질 때까지 남은 시간(초), 호출 가능하면 None"""
+        if self.state == self.CLOSED:
+            return None
+        if self.state == self.HALF_OPEN:
+            # 시험 호출 결과를 기다리는 중
+            return self.reset_timeout if self._probing else None
+        remaining = self.opened_at + self.reset_timeout - time.monotonic()
+        return remaining if remaining > 0 else None
+
+    def allow(self) -> bool:
+        """지금 호출해도 되는지 확인 (차단 시간이 지났으면 시험 호출 한 번만 허용)"""
+        if self.state == self.CLOSED:
+            return True
+        if self.retry_after() is not None:
+            return False
+        self.state = self.HALF_OPEN
+        self._probing = True
+        return True
+
+    def record_success(self) -> None:
+        if self.state != self.CLOSED:
+            self.logger.info(f"{self.name} 호출 복구")
+        self.state = self.CLOSED
+        self.failures = 0
+        self.reset_timeout = self.base_reset_timeout
+        self._probing = False
+
+    def record_neutral(self) -> None:
+        """장애와 무관한 응답 (호출 한도 초과 등) - 연속 실패 수는 그대로 두고 시험 호출만 다시 허용"""
+        self._probing = False
+
+    def record_failure(self, trip: bool = False) -> None:
+        """실패 기록 (trip 이 True 이면 연속 실패 수와 무관하게 바로 차단)"""
+        self.failures += 1
+        if self.state == self.HALF_OPEN:
+            # 시험 호출 실패 - 대기 시간을 늘려 다시 차단
+            self.reset_timeout = min(self.reset_timeout * 2, self.max_reset_timeout)
+            self._open()
+        elif self.state == self.CLOSED and (trip or self.failures >= self.failure_threshold):
+            self._open()
+
+    def _open(self) -> None:
+        self.state = self.OPEN
+        self.opened_at = time.monotonic()
+        self._probing = False
+        self.logger.warning(
+            f"{self.name} 호출 차단 (연속 실패 {self.failures}회, {self.reset_timeout:.0f}초 후 재시도)"
+        )
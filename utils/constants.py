@@ -1,5 +1,6 @@
 import os
 from dotenv import load_dotenv
+from utils.sharding import parse_shard_ids
 
 # .env 파일 로드
 load_dotenv()
@@ -8,11 +9,72 @@ load_dotenv()
 DISCORD_TOKEN = os.getenv('DISCORD_TOKEN')
 COMMAND_PREFIX = os.getenv('COMMAND_PREFIX', '%')  # 기본값 '%'
 
+# 접두어 명령어(%명령어) 사용 여부 - 끄면 message_content 인텐트 없이 슬래시 명령어와 멘션으로만 동작
+PREFIX_COMMANDS_ENABLED = os.getenv('PREFIX_COMMANDS_ENABLED', 'true').lower() == 'true'
+
+# 시작할 때 슬래시 명령어를 Discord 에 등록할지 여부 (전역 등록은 호출 한도가 있으므로 명령어가 바뀐 배포에서만 켜기)
+SYNC_COMMANDS_ON_STARTUP = os.getenv('SYNC_COMMANDS_ON_STARTUP', 'false').lower() == 'true'
+
+# 샤드 설정 - SHARD_COUNT 가 0 이면 Discord 권장 샤드 수를 사용하고,
+# SHARD_IDS("0-3" 또는 "0,2")를 지정하면 이 프로세스는 해당 샤드의 길드만 맡음 (SHARD_COUNT 필요)
+SHARD_COUNT = int(os.getenv('SHARD_COUNT', '0')) or None
+SHARD_IDS = parse_shard_ids(os.getenv('SHARD_IDS'))
+
 # Riot API 관련 설정
 RIOT_API_KEY = os.getenv('RIOT_API_KEY')
 RIOT_API_BASE_URL = "https://kr.api.riotgames.com"
 RIOT_API_ASIA_URL = "https://asia.api.riotgames.com"
 
+# Riot API 키 호출 한도 (초당, 2분당)
+RIOT_REQUESTS_PER_SECOND = int(os.getenv('RIOT_REQUESTS_PER_SECOND', '20'))
+RIOT_REQUESTS_PER_TWO_MINUTES = int(os.getenv('RIOT_REQUESTS_PER_TWO_MINUTES', '100'))
+
+# 연산 작업(팀 밸런싱, 시뮬레이션) 프로세스 풀 설정
+COMPUTE_WORKERS = int(os.getenv('COMPUTE_WORKERS', str(max(1, (os.cpu_count() or 2) - 1))))
+COMPUTE_TIMEOUT = float(os.getenv('COMPUTE_TIMEOUT', '10'))  # 초
+
+# 게임 생성 시 플레이어 전적 갱신을 기다리는 최대 시간(초) - 지나면 저장된 전적으로 팀 구성
+GAME_REFRESH_DEADLINE = float(os.getenv('GAME_REFRESH_DEADLINE', '5'))
+
+# 게임 생성 메뉴가 열려 있는 동안 미리 갱신할 플레이어 수
+PREWARM_PLAYER_LIMIT = int(os.getenv('PREWARM_PLAYER_LIMIT', '10'))
+
+# 플레이어 활동 순위(미리 갱신, 플레이어 선택 메뉴 정렬)에 사용할 최근 기간(일)
+RECENT_ACTIVITY_DAYS = int(os.getenv('RECENT_ACTIVITY_DAYS', '14'))
+
+# 전적 자동 갱신 동시 작업 수 (실제 호출 속도는 Rate Limiter 가 제한)
+STATS_UPDATE_CONCURRENCY = int(os.getenv('STATS_UPDATE_CONCURRENCY', '8'))
+
+# 적응형 전적 갱신 주기(분)와 한 주기에 사용할 API 한도 비율 (나머지는 명령어 처리용)
+REFRESH_SCHEDULER_INTERVAL_MINUTES = int(os.getenv('REFRESH_SCHEDULER_INTERVAL_MINUTES', '5'))
+REFRESH_SCHEDULER_BUDGET_RATIO = float(os.getenv('REFRESH_SCHEDULER_BUDGET_RATIO', '0.6'))
+
+# 일일 전적 갱신 시 이 시간 안에 이미 갱신된 유저는 건너뜀
+STATS_UPDATE_SKIP_RECENT_HOURS = float(os.getenv('STATS_UPDATE_SKIP_RECENT_HOURS', '3'))
+
+# 전적 갱신 작업 큐 (활성화하면 봇은 작업만 등록하고 worker.py 프로세스들이 갱신)
+REFRESH_QUEUE_ENABLED = os.getenv('REFRESH_QUEUE_ENABLED', 'false').lower() == 'true'
+REFRESH_JOB_LEASE_SECONDS = int(os.getenv('REFRESH_JOB_LEASE_SECONDS', '300'))
+REFRESH_JOB_MAX_ATTEMPTS = int(os.getenv('REFRESH_JOB_MAX_ATTEMPTS', '3'))
+REFRESH_WORKER_BATCH_SIZE = int(os.getenv('REFRESH_WORKER_BATCH_SIZE', '20'))
+REFRESH_WORKER_POLL_SECONDS = float(os.getenv('REFRESH_WORKER_POLL_SECONDS', '10'))
+
+# 갱신 작업 우선순위 (높을수록 먼저 처리)
+REFRESH_PRIORITY_SCHEDULED = 0  # 적응형 스케줄러
+REFRESH_PRIORITY_REGISTRATION = 10  # 신규 등록 유저의 전체 전적 수집
+
+# 등록 후 전적 수집 완료 여부를 확인하는 주기(초)
+REGISTRATION_POLL_SECONDS = float(os.getenv('REGISTRATION_POLL_SECONDS', '5'))
+
+# 로깅 설정
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()  # 기본 로그 레벨
+LOG_LEVELS = os.getenv('LOG_LEVELS', '')  # 모듈별 레벨 (예: "services.riot_service=DEBUG,services.database_service=WARNING")
+LOG_FORMAT = os.getenv('LOG_FORMAT', 'json').lower()  # 로그 파일 형식 ('json' 또는 'text', 콘솔은 항상 text)
+LOG_MAX_BYTES = int(os.getenv('LOG_MAX_BYTES', str(10 * 1024 * 1024)))  # 파일 하나의 최대 크기
+LOG_ROTATE_WHEN = os.getenv('LOG_ROTATE_WHEN', '')  # 지정하면 크기 대신 시간 기준으로 교체 (예: 'midnight')
+LOG_BACKUP_COUNT = int(os.getenv('LOG_BACKUP_COUNT', '5'))  # 보관할 이전 로그 파일 수
+LOG_INSTANCE = os.getenv('LOG_INSTANCE', '')  # 로그 파일 이름에 붙일 프로세스 이름 (기본: 호스트명[-샤드 범위])
+
 # 파일 경로 설정
 USER_DATA_FILE = 'user_list.json'
 GAME_DATA_FILE = 'game_list.json'
@@ -0,0 +1,159 @@
+import asyncio
+from collections import deque
+from contextvars import ContextVar
+from typing import Deque, Dict, Hashable, Optional, Tuple
+import time
+import logging
+from utils.rate_limiter import RateLimiter
+
+# 현재 작업이 API 호출 한도를 나눠 쓰는 길드 (None 이면 명령어 처리 등 길드 몫과 무관한 호출)
+current_guild: ContextVar[Optional[Hashable]] = ContextVar('current_guild', default=None)
+
+
+class FairShareLimiter:
+    def __init__(self, rate_limiter: RateLimiter, window: float = 120):
+        """길드별 가중치에 따라 Rate Limiter 의 호출 한도를 나누어 배분
+
+        길드마다 대기열을 두고, 지금까지 받은 몫(호출 수 / 가중치)이 가장 적은
+        길드의 요청부터 Rate Limiter 에 넘깁니다 (가중 공정 큐잉).
+        한도(quota)가 설정된 길드는 window 초 동안 그 이상 호출하지 못합니다.
+        길드가 지정되지 않은 요청은 대기열을 거치지 않고 바로 Rate Limiter 를 사용합니다.
+
+        Parameters:
+            rate_limiter: 실제 호출 속도를 제한하는 Rate Limiter
+            window: 한도를 적용할 기간(초)
+        """
+        self.rate_limiter = rate_limiter
+        self.window = window
+
+        # 길드별 설정
+        self.weights: Dict[Hashable, float] = {}
+        self.quotas: Dict[Hashable, Optional[int]] = {}
+
+        # 길드별 대기 중인 요청
+        self._queues: Dict[Hashable, Deque[asyncio.Future]] = {}
+
+        # 길드별로 받은 몫 (가상 시각), 마지막으로 배분된 몫
+        self._virtual_time: Dict[Hashable, float] = {}
+        self._clock = 0.0
+
+        # 길드별 호출 기록 (한도 계산용)과 누적 호출 수
+        self._recent: Dict[Hashable, Deque[float]] = {}
+        self._usage: Dict[Hashable, int] = {}
+
+        self._wakeup = asyncio.Event()
+        self._dispatcher: Optional[asyncio.Task] = None
+
+        self.logger = logging.getLogger(__name__)
+
+    def configure(self, guild_id: Hashable, weight: float = 1.0, quota: Optional[int] = None) -> None:
+        """길드의 가중치와 기간당 최대 호출 수 설정"""
+        self.weights[guild_id] = max(weight, 0.01)
+        self.quotas[guild_id] = quota
+
+    async def acquire(self) -> None:
+        """현재 길드의 차례가 될 때까지 대기"""
+        guild_id = current_guild.get()
+        if guild_id is None:
+            await self.rate_limiter.acquire()
+            return
+
+        queue = self._queues.get(guild_id)
+        if queue is None:
+            queue = self._queues[guild_id] = deque()
+            # 쉬고 있던 길드가 밀린 몫을 한꺼번에 쓰지 않도록 현재 몫부터 시작
+            self._virtual_time[guild_id] = max(self._virtual_time.get(guild_id, 0.0), self._clock)
+
+        future = asyncio.get_running_loop().create_future()
+        queue.append(future)
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+        self._wakeup.set()
+
+        # 대기 중 취소되면 future 도 취소되어 배분 대상에서 빠짐
+        await future
+
+    def usage(self) -> Dict[Hashable, Dict]:
+        """길드별 호출 수 (누적, 최근 기간), 대기 중인 요청 수, 설정값"""
+        now = time.monotonic()
+        guild_ids = set(self._usage) | set(self._queues) | set(self.weights)
+        return {
+            guild_id: {
+                'requests': self._usage.get(guild_id, 0),
+                'recent_requests': len(self._recent_requests(guild_id, now)),
+                'waiting': len(self._queues.get(guild_id, ())),
+                'weight': self.weights.get(guild_id, 1.0),
+                'quota': self.quotas.get(guild_id)
+            }
+            for guild_id in guild_ids
+        }
+
+    def _recent_requests(self, guild_id: Hashable, now: float) -> Deque[float]:
+        recent = self._recent.setdefault(guild_id, deque())
+        while recent and now - recent[0] >= self.window:
+            recent.popleft()
+        return recent
+
+    def _next_guild(self) -> Tuple[Optional[Hashable], Optional[float]]:
+        """다음에 호출할 길드 선택
+
+        (길드, None) 또는 모든 길드가 한도에 걸린 경우 (None, 다음 확인까지 대기 시간),
+        대기 중인 요청이 없으면 (None, None) 을 반환합니다.
+        """
+        now = time.monotonic()
+        best = None
+        retry_after = None
+        for guild_id, queue in list(self._queues.items()):
+            while queue and queue[0].done():
+                queue.popleft()
+            if not queue:
+                del self._queues[guild_id]
+                continue
+
+            quota = self.quotas.get(guild_id)
+            recent = self._recent_requests(guild_id, now)
+            if quota is not None and len(recent) >= quota:
+                wait = self.window - (now - recent[0])
+                retry_after = wait if retry_after is None else min(retry_after, wait)
+                continue
+
+            if best is None or self._virtual_time[guild_id] < self._virtual_time[best]:
+                best = guild_id
+
+        if best is not None:
+            return best, None
+        return None, retry_after
+
+    async def _dispatch(self) -> None:
+        """대기열에서 몫이 가장 적은 길드의 요청을 하나씩 Rate Limiter 에 넘김"""
+        while True:
+            try:
+                guild_id, retry_after = self._next_guild()
+                if guild_id is None:
+                    self._wakeup.clear()
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout=retry_after)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+
+                await self.rate_limiter.acquire()
+
+                queue = self._queues.get(guild_id)
+                while queue and queue[0].done():
+                    queue.popleft()
+                if not queue:
+                    # 기다리는 동안 요청이 모두 취소됨
+                    continue
+                queue.popleft().set_result(None)
+
+                self._recent_requests(guild_id, time.monotonic()).append(time.monotonic())
+                self._usage[guild_id] = self._usage.get(guild_id, 0) + 1
+                self._clock = self._virtual_time[guild_id]
+                self._virtual_time[guild_id] += 1 / self.weights.get(guild_id, 1.0)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"API 호출 배분 중 오류: {str(e)}")
+                await asyncio.sleep(1)
@@ -1,35 +1,200 @@
+import atexit
+import copy
+import json
 import logging
+import logging.handlers
 import os
+import queue
+import socket
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Optional
+from utils.constants import (
+    LOG_LEVEL,
+    LOG_LEVELS,
+    LOG_FORMAT,
+    LOG_MAX_BYTES,
+    LOG_ROTATE_WHEN,
+    LOG_BACKUP_COUNT,
+    LOG_INSTANCE,
+    SHARD_IDS
+)
+
+LOG_DIR = 'logs'
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# 모든 로거가 레코드를 넣기만 하는 큐 (파일 쓰기는 리스너 스레드가 처리)
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_listener: Optional[logging.handlers.QueueListener] = None
+_setup_lock = threading.Lock()
+_EXCEPTION_FORMATTER = logging.Formatter()
+
+# 프로세스 역할 (setup_logging 에 넘긴 파일 이름, 예: bot, worker)
+_role = 'main'
+
+
+def instance_name() -> str:
+    """로그 파일 이름에 붙일 이 프로세스의 이름
+
+    여러 프로세스(봇, 워커 복제본, 샤드 프로세스)가 같은 logs 디렉토리를 쓰므로
+    파일마다 한 프로세스만 쓰고 교체하도록 이름을 나눕니다. 컨테이너는 호스트명이
+    복제본마다 다르고, 같은 호스트에서 같은 역할의 프로세스를 여러 개 실행할 때는
+    LOG_INSTANCE 로 구분합니다.
+    """
+    if LOG_INSTANCE:
+        return LOG_INSTANCE
+    name = socket.gethostname()
+    if SHARD_IDS is not None:
+        name += f"-shards{SHARD_IDS[0]}-{SHARD_IDS[-1]}"
+    return name
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        """레코드 하나를 한 줄짜리 JSON 으로 변환"""
+        entry = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage()
+        }
+        if record.exc_text:
+            entry['exception'] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class _FileQueueHandler(logging.handlers.QueueHandler):
+    def __init__(self, log_file: str, console: bool = False):
+        """레코드에 기록할 파일 이름을 붙여 큐에 넣는 핸들러
+
+        Parameters:
+            log_file: logs 디렉토리 안의 파일 이름
+            console: 콘솔에도 출력할지 여부
+        """
+        super().__init__(_log_queue)
+        self.log_file = log_file
+        self.console = console
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 같은 레코드가 상위 로거의 핸들러로도 전달되므로 복사본을 만들고,
+        # 다른 스레드에서 포맷할 수 있도록 메시지와 예외를 문자열로 바꿔 둠
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = record.exc_text or _EXCEPTION_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        record.log_file = self.log_file
+        record.console = self.console
+        return record
+
+
+class _LogRouter(logging.Handler):
+    def __init__(self):
+        """리스너 스레드에서 레코드를 파일별 핸들러로 전달 (파일 핸들러는 처음 쓸 때 생성)"""
+        super().__init__()
+        self.file_handlers: Dict[str, logging.Handler] = {}
+        self.console_handler = logging.StreamHandler()
+        self.console_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+
+    def _file_handler(self, log_file: str) -> logging.Handler:
+        handler = self.file_handlers.get(log_file)
+        if handler is None:
+            os.makedirs(LOG_DIR, exist_ok=True)
+            stem, ext = os.path.splitext(log_file)
+            # 모듈 로그 파일에는 역할도 붙임 (예: database-worker-<호스트명>.log, worker-<호스트명>.log)
+            name = stem if stem == _role else f"{stem}-{_role}"
+            path = os.path.join(LOG_DIR, f"{name}-{instance_name()}{ext}")
+            if LOG_ROTATE_WHEN:
+                handler = logging.handlers.TimedRotatingFileHandler(
+                    path, when=LOG_ROTATE_WHEN, backupCount=LOG_BACKUP_COUNT, encoding='utf-8'
+                )
+            else:
+                handler = logging.handlers.RotatingFileHandler(
+                    path, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding='utf-8'
+                )
+            handler.setFormatter(JsonFormatter() if LOG_FORMAT == 'json' else logging.Formatter(TEXT_FORMAT))
+            self.file_handlers[log_file] = handler
+        return handler
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self._file_handler(record.log_file).handle(record)
+        if record.console:
+            self.console_handler.handle(record)
+
+    def close(self) -> None:
+        for handler in self.file_handlers.values():
+            handler.close()
+        self.console_handler.close()
+        super().close()
+
+
+def parse_log_levels(value: str) -> Dict[str, str]:
+    """"모듈=레벨,모듈=레벨" 형식의 모듈별 로그 레벨 해석"""
+    levels = {}
+    for part in value.split(','):
+        if '=' not in part:
+            continue
+        name, level = part.split('=', 1)
+        levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def _start_listener() -> None:
+    """리스너 스레드 시작과 로그 레벨 적용 (프로세스당 한 번)"""
+    global _listener
+    with _setup_lock:
+        if _listener is not None:
+            return
+
+        # 로거의 레벨은 지정하지 않고 상위 로거에서 물려받게 하여 모듈별 설정이 적용되도록 함
+        logging.getLogger().setLevel(LOG_LEVEL)
+        for name, level in parse_log_levels(LOG_LEVELS).items():
+            logging.getLogger(name).setLevel(level)
+
+        router = _LogRouter()
+        _listener = logging.handlers.QueueListener(_log_queue, router)
+        _listener.start()
+
+        def stop_listener() -> None:
+            # 종료 시 큐에 남은 로그를 모두 기록한 뒤 파일 닫기
+            _listener.stop()
+            router.close()
+        atexit.register(stop_listener)
+
+
+def setup_logging(log_file: str) -> None:
+    """프로세스 전체(루트 로거) 로그를 log_file 과 콘솔에 기록하도록 설정
+
+    모든 로거의 레코드가 루트로 전달되므로 main.py, worker.py 시작 시 한 번 호출합니다.
+    log_file 의 이름(확장자 제외)은 이 프로세스의 역할로 로그 파일 이름에 붙습니다.
+    """
+    global _role
+    _role = os.path.splitext(log_file)[0]
+    _start_listener()
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(_FileQueueHandler(log_file, console=True))
+
 
 def setup_logger(name: str, log_file: str) -> logging.Logger:
     """
     개별 모듈을 위한 로거를 설정하는 유틸리티 함수
-    
+
+    로거는 레코드를 큐에 넣기만 하고, 파일 쓰기와 교체(크기 또는 시간 기준)는
+    리스너 스레드에서 처리하므로 이벤트 루프를 막지 않습니다.
+
     Args:
         name: 로거 이름 (__name__ 사용)
-        log_file: 로그 파일 경로
+        log_file: logs 디렉토리 안의 로그 파일 이름
     """
-    # logs 디렉토리가 없으면 생성
-    if not os.path.exists('logs'):
-        os.makedirs('logs')
-        
+    _start_listener()
     logger = logging.getLogger(name)
-    
+
     # 이미 핸들러가 설정되어 있다면 추가 설정하지 않음
     if logger.handlers:
         return logger
-        
-    logger.setLevel(logging.DEBUG)
-    
-    # 파일 핸들러 추가
-    file_handler = logging.FileHandler(f'logs/{log_file}', encoding='utf-8')
-    file_handler.setLevel(logging.DEBUG)
-    
-    # 포맷터 설정
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    file_handler.setFormatter(formatter)
-    
-    # 핸들러 추가
-    logger.addHandler(file_handler)
-    
-    return logger
\ No newline at end of file
+
+    logger.addHandler(_FileQueueHandler(log_file))
+    return logger
@@ -0,0 +1,108 @@
+import asyncio
+import time
+import logging
+from typing import Dict, Optional
+import discord
+from utils.embed_builder import EmbedBuilder
+
+# 같은 채널의 메시지 수정 최소 간격(초) - Discord 채널별 한도(5초에 5회)보다 여유 있게
+CHANNEL_EDIT_INTERVAL = 2.0
+
+# 진행 막대 길이
+PROGRESS_BAR_LENGTH = 12
+
+
+def format_duration(seconds: float) -> str:
+    minutes, seconds = divmod(int(round(seconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}시간 {minutes}분"
+    if minutes:
+        return f"{minutes}분 {seconds}초"
+    return f"{seconds}초"
+
+
+class ProgressReporter:
+    # 채널별 다음 수정 가능 시각 (같은 채널의 여러 진행 메시지가 한도를 나눠 씀)
+    _channel_next_edit: Dict[int, float] = {}
+
+    def __init__(
+        self,
+        message: discord.Message,
+        title: str,
+        total: int,
+        footer: Optional[str] = None
+    ):
+        """진행 상황 메시지를 일정 간격으로 모아서 수정
+
+        advance 는 메시지를 바로 수정하지 않고 진행 수만 기록하며,
+        채널별 최소 간격이 지날 때마다 마지막 상태로 한 번만 수정합니다.
+
+        Parameters:
+            message: 수정할 진행 상황 메시지
+            title: 임베드 제목
+            total: 전체 작업 수
+            footer: 임베드 하단 문구
+        """
+        self.message = message
+        self.title = title
+        self.total = total
+        self.footer = footer
+        self.done = 0
+        self.started_at = time.monotonic()
+
+        self._shown = 0
+        self._flush_task: Optional[asyncio.Task] = None
+        self.logger = logging.getLogger(__name__)
+
+    def advance(self, count: int = 1) -> None:
+        """작업 완료 기록 (메시지 수정은 예약만 함)"""
+        self.done = min(self.total, self.done + count)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush())
+
+    def eta(self) -> Optional[float]:
+        """지금까지의 처리 속도 기준 남은 시간(초)"""
+        if not self.done or self.done >= self.total:
+            return None
+        elapsed = time.monotonic() - self.started_at
+        return elapsed / self.done * (self.total - self.done)
+
+    def build_embed(self) -> discord.Embed:
+        ratio = self.done / self.total if self.total else 1.0
+        filled = round(ratio * PROGRESS_BAR_LENGTH)
+        bar = "█" * filled + "░" * (PROGRESS_BAR_LENGTH - filled)
+        lines = [f"`{bar}` {self.done}/{self.total} ({ratio * 100:.0f}%)"]
+        eta = self.eta()
+        if eta is not None:
+            lines.append(f"예상 남은 시간: {format_duration(eta)}")
+        return EmbedBuilder.info(self.title, "\n".join(lines), footer=self.footer)
+
+    async def close(self) -> None:
+        """예약된 수정 취소 (최종 결과로 메시지를 수정하기 전에 호출)"""
+        if self._flush_task and not self._flush_task.done():
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+
+    async def _flush(self) -> None:
+        """채널 수정 간격을 지킨 뒤 마지막 진행 상태로 메시지 수정"""
+        channel_id = self.message.channel.id
+        while self._shown != self.done:
+            # 대기 전에 수정 시각을 예약하여 같은 채널의 다른 메시지와 겹치지 않게 함
+            now = time.monotonic()
+            edit_at = max(now, ProgressReporter._channel_next_edit.get(channel_id, 0))
+            ProgressReporter._channel_next_edit[channel_id] = edit_at + CHANNEL_EDIT_INTERVAL
+            if edit_at > now:
+                await asyncio.sleep(edit_at - now)
+
+            shown = self.done
+            try:
+                await self.message.edit(embed=self.build_embed())
+            except discord.HTTPException as e:
+                # 진행 표시는 부가 기능이므로 실패해도 작업은 계속 진행
+                self.logger.warning(f"진행 상황 메시지 수정 실패: {str(e)}")
+                return
+            self._shown = shown
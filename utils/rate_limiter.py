@@ -1,59 +1,76 @@
 import asyncio
 from collections import deque
-from datetime import datetime, timedelta
+import time
 import logging
 
 class RateLimiter:
     def __init__(self, requests_per_second: int, requests_per_two_minutes: int):
         self.requests_per_second = requests_per_second
         self.requests_per_two_minutes = requests_per_two_minutes
-        
+
         # 초당 요청 추적
         self.second_requests = deque()
-        
+
         # 2분당 요청 추적
         self.two_minute_requests = deque()
-        
+
+        # 429 응답의 Retry-After 로 모든 요청을 멈출 시각
+        self.paused_until = 0.0
+
+        # 동시에 여러 작업이 호출해도 한도를 넘지 않도록 순서대로 처리 (FIFO)
+        self._lock = asyncio.Lock()
+
         self.logger = logging.getLogger(__name__)
 
     async def acquire(self) -> None:
         """Rate limit 체크 및 대기"""
-        await self._clean_old_requests()
-        
-        while True:
-            current_time = datetime.now()
-            
-            # 초당 제한 체크
-            while (len(self.second_requests) >= self.requests_per_second and 
-                   (current_time - self.second_requests[0]).total_seconds() <= 1):
-                await asyncio.sleep(0.1)
-                current_time = datetime.now()
-                await self._clean_old_requests()
-            
-            # 2분 제한 체크
-            while (len(self.two_minute_requests) >= self.requests_per_two_minutes and 
-                   (current_time - self.two_minute_requests[0]).total_seconds() <= 120):
-                wait_time = 120 - (current_time - self.two_minute_requests[0]).total_seconds()
-                self.logger.warning(f"2분 제한에 도달. {wait_time:.1f}초 대기 중...")
-                await asyncio.sleep(1)  # 1초마다 체크
-                current_time = datetime.now()
-                await self._clean_old_requests()
-            
-            # 모든 제한을 통과하면 요청 기록 추가
-            self.second_requests.append(current_time)
-            self.two_minute_requests.append(current_time)
-            break
-
-    async def _clean_old_requests(self) -> None:
+        async with self._lock:
+            while True:
+                current_time = time.monotonic()
+                self._clean_old_requests(current_time)
+
+                # 두 제한 중 더 오래 기다려야 하는 시간 계산
+                wait_time = max(0.0, self.paused_until - current_time)
+                if len(self.second_requests) >= self.requests_per_second:
+                    wait_time = max(wait_time, 1 - (current_time - self.second_requests[0]))
+                if len(self.two_minute_requests) >= self.requests_per_two_minutes:
+                    two_minute_wait = 120 - (current_time - self.two_minute_requests[0])
+                    if two_minute_wait > 1:
+                        self.logger.warning(f"2분 제한에 도달. {two_minute_wait:.1f}초 대기 중...")
+                    wait_time = max(wait_time, two_minute_wait)
+
+                if wait_time <= 0:
+                    # 모든 제한을 통과하면 요청 기록 추가
+                    self.second_requests.append(current_time)
+                    self.two_minute_requests.append(current_time)
+                    return
+
+                await asyncio.sleep(wait_time)
+
+    def pause(self, seconds: float) -> None:
+        """API 가 알려준 시간(초) 동안 요청을 보내지 않음 (429 응답의 Retry-After)"""
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+        self.logger.warning(f"API 호출 한도 초과 응답. {seconds:.1f}초 동안 요청 중지")
+
+    def available(self) -> int:
+        """지금 바로 보낼 수 있는 요청 수"""
+        current_time = time.monotonic()
+        if current_time < self.paused_until:
+            return 0
+        self._clean_old_requests(current_time)
+        return max(0, min(
+            self.requests_per_second - len(self.second_requests),
+            self.requests_per_two_minutes - len(self.two_minute_requests)
+        ))
+
+    def _clean_old_requests(self, current_time: float) -> None:
         """만료된 요청 기록 제거"""
-        current_time = datetime.now()
-        
         # 1초 이상 지난 요청 제거
-        while (self.second_requests and 
-               (current_time - self.second_requests[0]).total_seconds() > 1):
+        while (self.second_requests and
+               current_time - self.second_requests[0] >= 1):
             self.second_requests.popleft()
-        
+
         # 2분 이상 지난 요청 제거
-        while (self.two_minute_requests and 
-               (current_time - self.two_minute_requests[0]).total_seconds() > 120):
-            self.two_minute_requests.popleft()
\ No newline at end of file
+        while (self.two_minute_requests and
+               current_time - self.two_minute_requests[0] >= 120):
+            self.two_minute_requests.popleft()
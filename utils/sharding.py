@@ -0,0 +1,35 @@
+from typing import List, Optional
+
+
+def parse_shard_ids(value: Optional[str]) -> Optional[List[int]]:
+    """"0-3" 또는 "0,2,5" 형식의 샤드 목록 해석 (비어 있으면 None = 모든 샤드)
+
+    "0-3,8" 처럼 범위와 개별 번호를 섞어 쓸 수 있습니다.
+    """
+    if not value or not value.strip():
+        return None
+
+    shard_ids = set()
+    for part in value.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        if '-' in part:
+            start, end = (int(bound) for bound in part.split('-', 1))
+            if start > end:
+                raise ValueError(f"잘못된 샤드 범위입니다: {part}")
+            shard_ids.update(range(start, end + 1))
+        else:
+            shard_ids.add(int(part))
+    return sorted(shard_ids)
+
+
+
+def shard_share(shard_ids: Optional[List[int]], shard_count: Optional[int]) -> float:
+    """이 프로세스가 맡은 샤드의 비율 (샤드를 나누지 않으면 1)
+
+    여러 샤드 프로세스가 같은 API 키를 쓸 때 키의 호출 한도를 이 비율만큼만 사용합니다.
+    """
+    if shard_ids is None or not shard_count:
+        return 1.0
+    return min(1.0, len(shard_ids) / shard_count)
@@ -0,0 +1,22 @@
+from services.refresh_worker import RefreshWorker
+import asyncio
+from utils.logging_config import setup_logging
+import signal
+
+async def run_worker():
+    """Discord 연결 없이 전적 갱신 작업 큐만 처리하는 워커 실행"""
+    worker = RefreshWorker()
+
+    # 종료 신호를 받으면 처리 중인 묶음을 마친 뒤 종료
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, worker.stop)
+        except NotImplementedError:
+            pass  # Windows 는 신호 처리기를 지원하지 않음
+
+    await worker.run()
+
+if __name__ == "__main__":
+    setup_logging('worker.log')
+    asyncio.run(run_worker())